@@ -17,7 +17,11 @@ from pydantic import BaseModel
 from resolve_firebase_user import FireBaseUser
 from refresh_auth import require_refresh_api_key
 from sanity_auth import require_sanity_api_key
-from botnim.query import run_query, government_distribution_sidecar
+from botnim.query import (
+    run_query, run_query_many, government_distribution_sidecar,
+    query_client_pool_stats, query_embedding_cache_stats, context_id_stats,
+    law_name_catalog_stats, retrieve_cache_stats, db_pool_stats,
+)
 from botnim.vector_store.search_modes import SEARCH_MODES, DEFAULT_SEARCH_MODE
 from botnim.bot_config import load_bot_config
 from botnim.config import AVAILABLE_BOTS, VALID_ENVIRONMENTS, DEFAULT_ENVIRONMENT
@@ -51,6 +55,21 @@ async def health():
     return "OK"
 
 
+@app.get("/stats")
+@app.get("/botnim/stats")
+async def stats() -> Dict[str, Any]:
+    """In-process retrieve-path counters (per task — not aggregated across
+    the service). Cheap to compute; safe to poll."""
+    return {
+        "query_client_pool": query_client_pool_stats(),
+        "query_embedding_cache": query_embedding_cache_stats(),
+        "context_ids": context_id_stats(),
+        "law_name_catalog": law_name_catalog_stats(),
+        "retrieve_cache": retrieve_cache_stats(),
+        "db_pools": db_pool_stats(),
+    }
+
+
 # ---------------------------------------------------------------------------
 # Bot config endpoints (post-Assistants-API migration)
 #
@@ -193,10 +212,13 @@ async def search_datasets_handler(
     try:
         # run_query is sync (sqlalchemy + openai client). Run in a worker
         # thread so we can enforce a deadline via asyncio.wait_for instead
-        # of leaving the event loop blocked. asyncio.TimeoutError is an
-        # alias for TimeoutError on Python 3.11+, so a single except branch
-        # below covers both the deadline-exceeded case (our wait_for) and
-        # any inner TimeoutError raised by run_query itself.
+        # of leaving the event loop blocked. The same deadline goes to
+        # run_query, which cancels its in-flight statements when it passes,
+        # so the worker thread and its pooled connection are freed rather
+        # than left running after we've answered 504. asyncio.TimeoutError
+        # is an alias for TimeoutError on Python 3.11+, so a single except
+        # branch below covers both the deadline-exceeded case (our wait_for)
+        # and the inner TimeoutError raised by run_query itself.
         results = await asyncio.wait_for(
             asyncio.to_thread(
                 run_query,
@@ -206,6 +228,7 @@ async def search_datasets_handler(
                 format=format,
                 search_mode=mode_config,
                 metadata_filter=parsed_filter,
+                deadline_seconds=RETRIEVE_TIMEOUT_SECONDS,
             ),
             timeout=RETRIEVE_TIMEOUT_SECONDS,
         )
@@ -271,6 +294,112 @@ async def search_datasets_handler(
     return Response(content=results, media_type="text/plain")
 
 
+# Headroom kept between the per-context deadline inside run_query_many and
+# the outer RETRIEVE_TIMEOUT_SECONDS, so contexts that did finish are
+# formatted and returned instead of the whole fan-out hitting the outer 504.
+RETRIEVE_MANY_DEADLINE_MARGIN_SECONDS = 1.0
+
+
+class RetrieveManyContext(BaseModel):
+    context: str
+    search_mode: Optional[str] = None
+    num_results: Optional[int] = None
+    metadata_filter: Optional[Dict[str, Any]] = None
+
+
+class RetrieveManyRequest(BaseModel):
+    query: str
+    contexts: List[RetrieveManyContext]
+    format: str = 'yaml'
+
+
+def _render_many(blocks: list[dict], fmt: str) -> str:
+    """Render run_query_many blocks as one text/yaml body.
+
+    Each block's ``results`` is already formatted (a yaml/text string); it is
+    nested under a per-context header the same way ``_inject_distribution``
+    nests results under its sidecar.
+    """
+    out = []
+    for block in blocks:
+        if fmt == 'yaml':
+            header = {k: v for k, v in block.items() if k != "results"}
+            entry = _yaml.dump([header], allow_unicode=True, default_flow_style=False, sort_keys=False)
+            if "results" in block:
+                entry += "  results:\n" + "".join(
+                    "    " + line + "\n" for line in block["results"].splitlines()
+                )
+            out.append(entry)
+        else:
+            title = f"[{block['context']} — {block['search_mode']}]"
+            body = block.get("results") if block["status"] == "ok" else f"{block['status']}: {block.get('detail', '')}"
+            out.append(title + "\n" + (body or "") + "\n")
+    return "".join(out) if fmt == 'yaml' else "\n\n".join(out)
+
+
+@app.post("/retrieve_many/{bot}")
+@app.post("/botnim/retrieve_many/{bot}")
+async def search_many_handler(bot: str, request: RetrieveManyRequest = Body(...)):
+    """One query across several contexts: embedded once, searched concurrently.
+
+    Runs under the same RETRIEVE_TIMEOUT_SECONDS deadline as /retrieve.
+    Contexts that miss it come back with ``status: timeout`` alongside the
+    results of the contexts that made it; only when every context timed out
+    does the endpoint answer 504.
+    """
+    fmt = request.format or 'yaml'
+    contexts = [
+        {
+            "context": c.context,
+            "search_mode": SEARCH_MODES.get(c.search_mode, DEFAULT_SEARCH_MODE) if c.search_mode else DEFAULT_SEARCH_MODE,
+            "num_results": c.num_results,
+            "metadata_filter": c.metadata_filter,
+        }
+        for c in request.contexts
+    ]
+    try:
+        blocks = await asyncio.wait_for(
+            asyncio.to_thread(
+                run_query_many,
+                bot=bot,
+                query_text=request.query,
+                contexts=contexts,
+                format=fmt,
+                deadline_seconds=max(0.0, RETRIEVE_TIMEOUT_SECONDS - RETRIEVE_MANY_DEADLINE_MARGIN_SECONDS),
+            ),
+            timeout=RETRIEVE_TIMEOUT_SECONDS,
+        )
+    except ConnectionError as e:
+        logger.error(f"Upstream connection error in search_many: {e}")
+        return JSONResponse(
+            status_code=502,
+            content={"error": "upstream_connection_error", "detail": str(e), "bot": bot},
+        )
+    except TimeoutError as e:
+        detail = str(e) or f"deadline exceeded after {RETRIEVE_TIMEOUT_SECONDS:.1f}s"
+        logger.warning("RETRIEVE_MANY_TIMEOUT bot=%s detail=%s query=%r", bot, detail, request.query[:80])
+        return JSONResponse(
+            status_code=504,
+            content={"error": "search_timeout", "detail": detail, "bot": bot},
+        )
+    except Exception as e:
+        logger.error(f"Multi-context search failed: {e}", exc_info=True)
+        return JSONResponse(
+            status_code=500,
+            content={"error": "search_error", "detail": str(e), "bot": bot},
+        )
+
+    if blocks and all(b["status"] == "timeout" for b in blocks):
+        return JSONResponse(
+            status_code=504,
+            content={"error": "search_timeout", "detail": blocks[0]["detail"], "bot": bot},
+        )
+    if fmt == 'dict':
+        return JSONResponse(content={"query": request.query, "results": blocks})
+    media_type = "application/x-yaml" if fmt == 'yaml' else "text/plain"
+    return Response(content=_render_many(blocks, fmt), media_type=media_type)
+
+
 # ---------------------------------------------------------------------------
 # Word-doc generation tool
 #
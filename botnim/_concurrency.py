@@ -13,10 +13,12 @@ parallelization:
 
 The byte-equal-at-concurrency-1 invariant (DoD #3) relies on:
 - ``asyncio.Semaphore(1)`` making calls effectively serial under load
-- Inputs processed via ``asyncio.gather``, which preserves input order in
-  its output — iteration order stays the same as today's serial code
-- Cache writes guarded by a single lock so the sqlite KVFile never sees
-  concurrent writers (sqlite-over-NFS on EFS is especially sensitive).
+- Results yielded in input order (``iter_context_sources_async`` awaits
+  its window of tasks first-in, first-out) — iteration order stays the
+  same as today's serial code
+- Cache writes that never race: the ES embedding KVFile's under a single
+  lock (sqlite-over-NFS on EFS is especially sensitive), the extraction
+  metadata L1 batched by ``MetadataCache`` itself.
 """
 from __future__ import annotations
 
@@ -24,6 +26,7 @@ import asyncio
 import functools
 import os
 import random
+import threading
 from typing import Callable, Awaitable, TypeVar, Any
 
 from .config import get_logger
@@ -51,6 +54,26 @@ DEFAULT_REWARM_BUDGET = 2000
 # afterwards means "investigate". Operators who DO want a one-shot full
 # re-extraction set EXTRACTION_MAX_LLM_CALLS_PER_RUN high (or 0) for one run.
 DEFAULT_LLM_CALL_CEILING = 5000
+# How many contexts ``vector_store_update`` syncs at once, for backends
+# that opt in (``VectorStoreBase.parallel_contexts``; Aurora only — the
+# others share per-bot state across contexts). Contexts are independent
+# there (own documents, own extraction inputs), so a daily refresh need
+# not be the sum of every context's wall time. OpenAI concurrency
+# stays capped run-wide by RunBudget.openai_slots, so this only overlaps
+# the non-OpenAI work (file reads, chunking, DB writes, cache hits).
+DEFAULT_CONTEXT_CONCURRENCY = 3
+# How many worker processes chunk and hash files for ``upload_files``
+# (one pool, shared by every context of the run). Tokenizing a large
+# context is minutes of single-core CPU; in worker processes it overlaps
+# the embedding round-trips and DB writes of the files before it. Capped
+# at the host's CPU count when unset.
+DEFAULT_CHUNK_WORKERS = 4
+# How many source files a streaming sync (``iter_context_sources``) keeps
+# in extraction at once, and how many extracted files may wait for upload.
+# Bounds a context's in-memory documents to ~2x this instead of the whole
+# corpus (knesset_protocols, bk_csv: several GB of RSS). Well above
+# SYNC_CONCURRENCY, so the OpenAI slots stay saturated.
+DEFAULT_COLLECT_WINDOW = 256
 
 
 def get_sync_concurrency() -> int:
@@ -133,6 +156,103 @@ def get_llm_call_ceiling() -> int:
     return value
 
 
+def get_context_concurrency() -> int:
+    """Read how many contexts one sync run processes in parallel (on
+    backends with ``parallel_contexts``; the others always run one).
+
+    ``SYNC_CONTEXT_CONCURRENCY=1`` restores the strictly sequential,
+    in-order behavior.
+    """
+    raw = os.environ.get("SYNC_CONTEXT_CONCURRENCY", "").strip()
+    if not raw:
+        return DEFAULT_CONTEXT_CONCURRENCY
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning(
+            "SYNC_CONTEXT_CONCURRENCY=%r is not an int; falling back to %d",
+            raw, DEFAULT_CONTEXT_CONCURRENCY,
+        )
+        return DEFAULT_CONTEXT_CONCURRENCY
+    if value < 1:
+        logger.warning(
+            "SYNC_CONTEXT_CONCURRENCY=%d is < 1; clamping to 1", value,
+        )
+        return 1
+    return value
+
+
+def get_chunk_workers() -> int:
+    """Read how many processes chunk and hash files during upload.
+
+    ``SYNC_CHUNK_WORKERS=0`` keeps chunking in-process, on the uploading
+    thread (the pre-pool behavior).
+    """
+    raw = os.environ.get("SYNC_CHUNK_WORKERS", "").strip()
+    if not raw:
+        return min(DEFAULT_CHUNK_WORKERS, os.cpu_count() or 1)
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning(
+            "SYNC_CHUNK_WORKERS=%r is not an int; falling back to %d",
+            raw, DEFAULT_CHUNK_WORKERS,
+        )
+        return min(DEFAULT_CHUNK_WORKERS, os.cpu_count() or 1)
+    if value < 0:
+        logger.warning(
+            "SYNC_CHUNK_WORKERS=%d is < 0; clamping to 0", value,
+        )
+        return 0
+    return value
+
+
+def get_collect_window() -> int:
+    """Read the in-flight window of a streaming context collection
+    (``SYNC_COLLECT_WINDOW``, at least 1)."""
+    raw = os.environ.get("SYNC_COLLECT_WINDOW", "").strip()
+    if not raw:
+        return DEFAULT_COLLECT_WINDOW
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning(
+            "SYNC_COLLECT_WINDOW=%r is not an int; falling back to %d",
+            raw, DEFAULT_COLLECT_WINDOW,
+        )
+        return DEFAULT_COLLECT_WINDOW
+    if value < 1:
+        logger.warning(
+            "SYNC_COLLECT_WINDOW=%d is < 1; clamping to 1", value,
+        )
+        return 1
+    return value
+
+
+class SharedSlots:
+    """Run-wide cap on in-flight OpenAI calls, usable from many event loops.
+
+    ``asyncio.Semaphore`` belongs to one event loop, but contexts synced in
+    parallel each run their own ``asyncio.run`` loop on their own thread.
+    This wraps a ``threading.BoundedSemaphore`` and polls it without
+    blocking the loop, so every context's ``SyncConcurrency`` can draw
+    from one pool.
+    """
+
+    _POLL_SECONDS = 0.02
+
+    def __init__(self, slots: int) -> None:
+        self.slots = slots
+        self._sem = threading.BoundedSemaphore(slots)
+
+    async def acquire(self) -> None:
+        while not self._sem.acquire(blocking=False):
+            await asyncio.sleep(self._POLL_SECONDS)
+
+    def release(self) -> None:
+        self._sem.release()
+
+
 class RunBudget:
     """Per-sync-run LLM-call ceiling, shared across all contexts.
 
@@ -145,21 +265,55 @@ class RunBudget:
     call; all contexts draw their ``llm_call_permit()`` slots from this
     single counter.
 
-    Thread-safety: contexts are processed sequentially (one ``asyncio.run``
-    fully completes before the next starts), and within a context the
-    owning ``SyncConcurrency._llm_lock`` serializes access. So at any
-    instant only one event loop touches this object, under one lock — a
-    plain ``int`` is sufficient, no extra lock needed here.
+    Thread-safety: contexts may be processed in parallel, each on its own
+    thread with its own event loop (see ``get_context_concurrency``), so
+    the counter is guarded by a ``threading.Lock`` rather than an asyncio
+    one. The lock is never held across an ``await``.
+
+    ``openai_slots`` (optional ``SharedSlots``) is the run-wide OpenAI
+    concurrency cap; every ``SyncConcurrency`` built on this budget
+    acquires a slot inside ``run_bounded``.
 
     A ceiling of 0 disables the breaker (uncapped).
     """
 
-    def __init__(self, llm_call_ceiling: int | None = None) -> None:
+    def __init__(
+        self,
+        llm_call_ceiling: int | None = None,
+        openai_slots: SharedSlots | None = None,
+    ) -> None:
         self.llm_call_ceiling = (
             llm_call_ceiling if llm_call_ceiling is not None else get_llm_call_ceiling()
         )
         self.llm_calls_made = 0
         self.circuit_broken = False
+        self.openai_slots = openai_slots
+        self._lock = threading.Lock()
+
+    def take_llm_call(self) -> bool:
+        """Claim one LLM call from the ceiling; ``False`` once it's spent.
+
+        The first refusal flips ``circuit_broken`` and logs the loud
+        EXTRACTION_CIRCUIT_BREAKER line (only once per run).
+        """
+        if self.llm_call_ceiling <= 0:
+            return True
+        with self._lock:
+            if self.llm_calls_made < self.llm_call_ceiling:
+                self.llm_calls_made += 1
+                return True
+            first_trip = not self.circuit_broken
+            self.circuit_broken = True
+        if first_trip:
+            logger.error(
+                "EXTRACTION_CIRCUIT_BREAKER: hit %d LLM-call ceiling for "
+                "this sync run (all contexts combined) — remaining chunks "
+                "served stale or skipped. This indicates content_hash "
+                "churn or a cold corpus far larger than expected; "
+                "investigate before the next refresh.",
+                self.llm_call_ceiling,
+            )
+        return False
 
 
 class SyncConcurrency:
@@ -182,9 +336,11 @@ class SyncConcurrency:
         # One pool keeps the overall rate predictable; splitting by API
         # would be a second-order optimization.
         self.semaphore = asyncio.Semaphore(self.concurrency)
-        # Guards writes to the sqlite KVFile caches. Reads are lock-free
-        # because sqlite handles concurrent readers fine; only the write
-        # path needs serialization to avoid "database is locked" errors.
+        # Guards writes to the ES embedding KVFile cache. Reads are
+        # lock-free because sqlite handles concurrent readers fine; only the
+        # write path needs serialization to avoid "database is locked"
+        # errors. (The extraction-metadata L1, MetadataCache, batches its
+        # own writes and needs no lock.)
         self.cache_lock = asyncio.Lock()
         # Set by the first task that converts a 429 to RpdExhausted; once
         # set, sibling tasks short-circuit instead of burning their slots
@@ -204,6 +360,10 @@ class SyncConcurrency:
         # asyncio.run() event loop closes mid-LLM-call and the tasks get
         # cancelled — leaving rewarmed_count=0 even though budget was taken.
         self.rewarm_tasks: list[asyncio.Task] = []
+        # Extraction-cache (L2) rows waiting for the next put_many, as
+        # (content_hash, payload, document_type, is_rewarm). collect_sources
+        # flushes them a batch at a time and at the end of the context.
+        self.cache_puts: list[tuple] = []
         # Circuit breaker: hard ceiling on TOTAL extraction LLM calls
         # (rewarms + misses). Defense-in-depth against a content_hash-
         # instability bug routing a whole corpus through the uncapped
@@ -216,7 +376,6 @@ class SyncConcurrency:
             self._run_budget = run_budget
         else:
             self._run_budget = RunBudget(llm_call_ceiling=llm_call_ceiling)
-        self._llm_lock = asyncio.Lock()
 
         # Observability counters — written by _get_metadata_for_content_async
         # and _rewarm_extraction; read at end-of-run for the
@@ -239,24 +398,7 @@ class SyncConcurrency:
         entirely (uncapped). The first trip logs a loud
         EXTRACTION_CIRCUIT_BREAKER line — it means a bug, not a steady state.
         """
-        rb = self._run_budget
-        if rb.llm_call_ceiling <= 0:
-            return True
-        async with self._llm_lock:
-            if rb.llm_calls_made >= rb.llm_call_ceiling:
-                if not rb.circuit_broken:
-                    rb.circuit_broken = True
-                    logger.error(
-                        "EXTRACTION_CIRCUIT_BREAKER: hit %d LLM-call ceiling for "
-                        "this sync run (all contexts combined) — remaining chunks "
-                        "served stale or skipped. This indicates content_hash "
-                        "churn or a cold corpus far larger than expected; "
-                        "investigate before the next refresh.",
-                        rb.llm_call_ceiling,
-                    )
-                return False
-            rb.llm_calls_made += 1
-            return True
+        return self._run_budget.take_llm_call()
 
     @property
     def llm_calls_made(self) -> int:
@@ -302,7 +444,10 @@ class SyncConcurrency:
             # Spec: avoid burning remaining tasks on guaranteed-to-fail calls.
             from .dynamic_extraction import RpdExhausted
             raise RpdExhausted("rpd_tripped flag set by an earlier task")
+        slots = self._run_budget.openai_slots
         async with self.semaphore:
+            if slots is not None:
+                await slots.acquire()
             try:
                 return await fn(*args, **kwargs)
             except Exception:
@@ -311,6 +456,9 @@ class SyncConcurrency:
                 # ``rpd_tripped`` so siblings short-circuit. The exception
                 # bubbles either way.
                 raise
+            finally:
+                if slots is not None:
+                    slots.release()
 
 
 T = TypeVar("T")
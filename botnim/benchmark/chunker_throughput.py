@@ -0,0 +1,130 @@
+"""Embedding-chunker throughput benchmark.
+
+Runs ``_chunk_for_embedding`` over a corpus built from the spec's own
+extraction sources, the way sync would see them (CSV rows flattened by
+_collect_raw_streams_csv, law structures rendered by _split_json_file, plus
+each law's sections joined back into one long markdown document), and
+reports tokens/sec. The multi-encode chunker it replaced is kept here as
+``loop_chunk_for_embedding`` — the baseline, and the golden reference for
+tests/test_chunker_golden.py.
+
+CLI:
+    python -m botnim.benchmark.chunker_throughput --max-tokens 600 --overlap 80 --repeat 3
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+SPECS_DIR = Path(__file__).resolve().parents[2] / "specs" / "unified"
+
+
+def loop_chunk_for_embedding(content: str, max_tokens: int, overlap_tokens: int) -> list[str]:
+    """_chunk_for_embedding before single-pass tokenization: every section,
+    the oversized ones twice, and every flushed chunk (for its overlap tail)
+    re-encoded."""
+    from botnim.vector_store.vector_store_aurora import _get_tokenizer
+
+    enc = _get_tokenizer()
+    token_ids = enc.encode(content)
+    if len(token_ids) <= max_tokens:
+        return [content]
+    sections = re.split(r"(?m)(?=^##\s)", content)
+    sections = [s for s in sections if s.strip()]
+    if len(sections) <= 1:
+        sections = re.split(r"\n\s*\n", content)
+        sections = [s for s in sections if s.strip()]
+    chunks: list[str] = []
+    current: list[str] = []
+    current_tokens = 0
+    for section in sections:
+        section_tokens = len(enc.encode(section))
+        if section_tokens > max_tokens:
+            if current:
+                chunks.append("\n\n".join(current))
+                current = []
+                current_tokens = 0
+            section_token_ids = enc.encode(section)
+            step = max_tokens - overlap_tokens
+            for start in range(0, len(section_token_ids), step):
+                window = section_token_ids[start : start + max_tokens]
+                chunks.append(enc.decode(window))
+                if start + max_tokens >= len(section_token_ids):
+                    break
+            continue
+        if current_tokens + section_tokens > max_tokens and current:
+            chunks.append("\n\n".join(current))
+            prev_tail_tokens = enc.encode(chunks[-1])[-overlap_tokens:]
+            tail_text = enc.decode(prev_tail_tokens) if prev_tail_tokens else ""
+            current = [tail_text, section] if tail_text else [section]
+            current_tokens = (
+                len(prev_tail_tokens) + section_tokens
+            ) if tail_text else section_tokens
+        else:
+            current.append(section)
+            current_tokens += section_tokens
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+def load_corpus(specs_dir: Path = SPECS_DIR) -> list[str]:
+    """Document contents from ``specs_dir/extraction`` (CSV rows and law
+    structures) and ``specs_dir/*.md``, in a stable order."""
+    from botnim.collect_sources import _collect_raw_streams_csv, _split_json_file
+
+    corpus = []
+    for path in sorted(specs_dir.glob("extraction/*.csv")):
+        corpus.extend(content for _, content, _, _ in _collect_raw_streams_csv(path.parent, path.stem, path.name))
+    for path in sorted(specs_dir.glob("extraction/*_structure_content.json")):
+        sections = [content for _, content, _, _ in _split_json_file(path)]
+        corpus.extend(sections)
+        corpus.append("\n\n".join(sections))
+    for path in sorted(specs_dir.glob("*.md")):
+        corpus.append(path.read_text(encoding="utf-8"))
+    return corpus
+
+
+def run(corpus: list[str], max_tokens: int, overlap: int, repeat: int) -> dict:
+    from botnim.vector_store.vector_store_aurora import _chunk_for_embedding, _get_tokenizer
+
+    enc = _get_tokenizer()
+    tokens = sum(len(enc.encode(doc)) for doc in corpus)
+    paths = {
+        "loop": lambda doc: loop_chunk_for_embedding(doc, max_tokens, overlap),
+        "single_pass": lambda doc: _chunk_for_embedding(doc, max_tokens=max_tokens, overlap_tokens=overlap),
+    }
+    report: dict = {"documents": len(corpus), "tokens": tokens}
+    for name, chunk in paths.items():
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for doc in corpus:
+                chunk(doc)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        report[name] = {"seconds": round(best, 3), "tokens_per_sec": round(tokens / best) if best else None}
+    if report["single_pass"]["seconds"]:
+        report["speedup"] = round(report["loop"]["seconds"] / report["single_pass"]["seconds"], 2)
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--specs-dir", type=Path, default=SPECS_DIR)
+    p.add_argument("--max-tokens", type=int, default=600)
+    p.add_argument("--overlap", type=int, default=80)
+    p.add_argument("--repeat", type=int, default=3, help="passes per chunker; the fastest is reported")
+    args = p.parse_args(argv)
+
+    report = run(load_corpus(args.specs_dir), args.max_tokens, args.overlap, args.repeat)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""RRF fusion and vector-explanation CPU micro-benchmark.
+
+Times the API-side CPU work of a hybrid search, with no database or
+embeddings involved: weighted RRF over the vector and BM25 candidate lists
+(``_rrf_rank``, the ranking inside ``_rrf_fuse``) and the explain-mode
+cosine scoring (``explain_vector_scores_many``). Each is compared with the
+per-row loop it replaced (kept here as ``loop_rrf_fuse`` / ``loop_explain``)
+on synthetic candidates, at each candidate count. Times are microseconds.
+
+CLI:
+    python -m botnim.benchmark.fusion_cpu --sizes 10 100 1000 --repeat 200
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+import uuid
+
+import numpy as np
+
+from botnim.benchmark.retrieve_latency import percentile
+
+# Explain mode: vectors per document and their dimension (text-embedding-3-small).
+VECTORS_PER_DOC = 3
+DIMENSIONS = 1536
+
+
+def loop_rrf_fuse(vector_rows: list, bm25_rows: list, num_results: int,
+                  k: int, bm25_weight: float, vector_weight: float = 1.0) -> list[tuple[str, float, tuple]]:
+    """The dict-and-sort fusion _rrf_fuse used before _rrf_rank: the top
+    ``num_results`` as ``(id, score, row)``."""
+    scores: dict[str, float] = {}
+    docs: dict[str, tuple] = {}
+    for rank, row in enumerate(vector_rows):
+        doc_id = str(row[0])
+        scores[doc_id] = scores.get(doc_id, 0.0) + vector_weight / (k + rank + 1)
+        docs[doc_id] = row
+    for rank, row in enumerate(bm25_rows):
+        doc_id = str(row[0])
+        scores[doc_id] = scores.get(doc_id, 0.0) + bm25_weight / (k + rank + 1)
+        docs.setdefault(doc_id, row)
+    ordered = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)[:num_results]
+    return [(doc_id, score, docs[doc_id]) for doc_id, score in ordered]
+
+
+def loop_explain(query_vector: list[float], docs_vectors: list[list[dict]]) -> list[dict]:
+    """The old explain_vector_scores, called once per hit: one cosine
+    similarity per vector, max per document."""
+    out = []
+    for doc_vectors in docs_vectors:
+        details = []
+        for vec in doc_vectors:
+            q, v = np.array(query_vector), np.array(vec["vector"])
+            score = float(np.dot(q, v) / (np.linalg.norm(q) * np.linalg.norm(v)))
+            source = vec.get("source", "unknown")
+            details.append({"source": source, "similarity": score,
+                            "description": f"Cosine similarity with {source} vector: {score:.4f}"})
+        out.append({"value": np.max([d["similarity"] for d in details]),
+                    "description": "Combined vector similarity score (max)", "details": details})
+    return out
+
+
+def make_candidates(n: int, overlap: float = 0.3, seed: int = 0) -> tuple[list, list]:
+    """``n`` vector and ``n`` BM25 rows shaped like the search branches'
+    ``(id, content, metadata)``, sharing about ``overlap`` of their ids."""
+    rng = random.Random(seed)
+    shared = [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(int(n * overlap))]
+    vector_ids = shared + [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(n - len(shared))]
+    bm25_ids = shared + [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(n - len(shared))]
+    rng.shuffle(vector_ids)
+    rng.shuffle(bm25_ids)
+    vector_rows = [(i, f"content {i}", {"title": i}) for i in vector_ids]
+    bm25_rows = [(i, f"content {i}", {"title": i}) for i in bm25_ids]
+    return vector_rows, bm25_rows
+
+
+def make_vectors(n: int, dimensions: int = DIMENSIONS, seed: int = 0) -> tuple[list[float], list[list[dict]]]:
+    """A query vector and ``n`` documents of VECTORS_PER_DOC vectors each,
+    as plain lists (the shape Elasticsearch returns)."""
+    rng = np.random.default_rng(seed)
+    query = rng.standard_normal(dimensions).tolist()
+    docs = [
+        [{"source": f"field{j}", "vector": rng.standard_normal(dimensions).tolist()}
+         for j in range(VECTORS_PER_DOC)]
+        for _ in range(n)
+    ]
+    return query, docs
+
+
+def _time(fn, repeat: int) -> list[float]:
+    fn()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return samples
+
+
+def summarize(samples_us: list[float]) -> dict:
+    return {
+        "n": len(samples_us),
+        "p50_us": round(percentile(samples_us, 50) or 0.0, 1),
+        "p95_us": round(percentile(samples_us, 95) or 0.0, 1),
+    }
+
+
+def run(sizes: list[int], repeat: int, num_results: int) -> dict[str, dict[str, dict]]:
+    from botnim.vector_store.vector_score_explainer import explain_vector_scores_many
+    from botnim.vector_store.vector_store_aurora import _RRF_BM25_WEIGHT, _RRF_K, _rrf_rank
+
+    results: dict[str, dict[str, dict]] = {}
+    for n in sizes:
+        vector_rows, bm25_rows = make_candidates(n)
+        query, docs = make_vectors(n)
+        timings = {
+            "rrf_loop": _time(lambda: loop_rrf_fuse(vector_rows, bm25_rows, num_results,
+                                                    _RRF_K, _RRF_BM25_WEIGHT), repeat),
+            "rrf_numpy": _time(lambda: _rrf_rank(vector_rows, bm25_rows, num_results,
+                                                 _RRF_K, _RRF_BM25_WEIGHT, 1.0), repeat),
+            "explain_loop": _time(lambda: loop_explain(query, docs), repeat),
+            "explain_numpy": _time(lambda: explain_vector_scores_many(query, docs), repeat),
+        }
+        results[str(n)] = {name: summarize(samples) for name, samples in timings.items()}
+    return results
+
+
+def speedups(results: dict[str, dict[str, dict]]) -> dict[str, dict[str, float | None]]:
+    """p50 of the loop path over p50 of the numpy path (>1 = numpy faster)."""
+    out = {}
+    for n, by_path in results.items():
+        out[n] = {}
+        for op in ("rrf", "explain"):
+            new = by_path[f"{op}_numpy"]["p50_us"]
+            out[n][op] = round(by_path[f"{op}_loop"]["p50_us"] / new, 2) if new else None
+    return out
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--sizes", nargs="+", type=int, default=[10, 100, 1000],
+                   help="candidates per branch (and documents to explain)")
+    p.add_argument("--repeat", type=int, default=200)
+    p.add_argument("--num-results", type=int, default=7)
+    args = p.parse_args(argv)
+
+    results = run(args.sizes, args.repeat, args.num_results)
+    print(json.dumps({"results": results, "speedup_p50": speedups(results)}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""Retrieve-path latency benchmark.
+
+Times the database side of ``/retrieve`` — ``QueryClient.search()`` with
+the query embedding already cached — per context, under one or more DB
+settings *variants*, and reports p50/p95 for each. Each variant runs on
+freshly built engines, so its settings apply from the first connection.
+
+Variants:
+    unprepared  the read role's defaults (botnim.db.session): server-side
+                prepared statements off, every search is parsed and
+                planned from scratch
+    prepared    BOTNIM_DB_READ_PREPARE_THRESHOLD=1: the fixed search
+                statements are prepared on their second run
+
+CLI (against a real, synced Aurora — ENVIRONMENT / DB_* as for the API):
+    python -m botnim.benchmark.retrieve_latency --env staging \\
+        --contexts israeli_laws knesset_protocols --repeat 20
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Iterable
+
+QUERIES_CSV = Path(__file__).with_name("query_evaluations.csv")
+
+# Env applied (None = unset) for the duration of each variant.
+VARIANTS: dict[str, dict[str, str | None]] = {
+    "unprepared": {"BOTNIM_DB_READ_PREPARE_THRESHOLD": None},
+    "prepared": {"BOTNIM_DB_READ_PREPARE_THRESHOLD": "1"},
+}
+
+
+def percentile(samples: Iterable[float], q: float) -> float | None:
+    """Nearest-rank percentile (``q`` in 0..100) — same convention as
+    aurora_parity_check.p95_latency."""
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    idx = math.ceil(q / 100 * len(ordered)) - 1
+    return ordered[max(idx, 0)]
+
+
+def summarize(samples_ms: list[float]) -> dict:
+    return {
+        "n": len(samples_ms),
+        "p50_ms": round(percentile(samples_ms, 50) or 0.0, 2),
+        "p95_ms": round(percentile(samples_ms, 95) or 0.0, 2),
+        "mean_ms": round(sum(samples_ms) / len(samples_ms), 2) if samples_ms else 0.0,
+    }
+
+
+def compare(results: dict[str, dict[str, dict]], baseline: str, candidate: str) -> dict[str, dict]:
+    """Per-context p50/p95 change of ``candidate`` vs ``baseline`` (negative = faster)."""
+    out = {}
+    for context, base in results.get(baseline, {}).items():
+        cand = results.get(candidate, {}).get(context)
+        if cand is None:
+            continue
+        out[context] = {
+            f"{p}_delta_ms": round(cand[f"{p}_ms"] - base[f"{p}_ms"], 2) for p in ("p50", "p95")
+        }
+    return out
+
+
+def load_queries(limit: int | None = None) -> list[str]:
+    """Distinct question texts from the evaluation set, in file order."""
+    seen: dict[str, None] = {}
+    with open(QUERIES_CSV, encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            q = (row.get("question_text") or "").strip()
+            if q:
+                seen.setdefault(q, None)
+    queries = list(seen)
+    return queries[:limit] if limit else queries
+
+
+def _apply_env(overrides: dict[str, str | None]) -> dict[str, str | None]:
+    previous = {k: os.environ.get(k) for k in overrides}
+    for key, value in overrides.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+    return previous
+
+
+def _time_context(store_id: str, queries: list[str], repeat: int, num_results: int) -> list[float]:
+    """Latency (ms) of every timed search; one untimed warm-up pass first
+    fills the embedding cache and the connections."""
+    from botnim.query import QueryClient
+
+    client = QueryClient(store_id)
+    for q in queries:
+        client.search(query_text=q, num_results=num_results)
+    samples = []
+    for _ in range(repeat):
+        for q in queries:
+            started = time.perf_counter()
+            client.search(query_text=q, num_results=num_results)
+            samples.append((time.perf_counter() - started) * 1000.0)
+    return samples
+
+
+def run(bot: str, contexts: list[str], variants: list[str], queries: list[str],
+        repeat: int, num_results: int) -> dict[str, dict[str, dict]]:
+    from botnim.db.session import dispose_engines
+
+    results: dict[str, dict[str, dict]] = {}
+    for variant in variants:
+        previous = _apply_env(VARIANTS[variant])
+        dispose_engines()
+        try:
+            results[variant] = {
+                context: summarize(_time_context(f"{bot}__{context}", queries, repeat, num_results))
+                for context in contexts
+            }
+        finally:
+            _apply_env(previous)
+            dispose_engines()
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--env", choices=["staging", "production"], required=True)
+    p.add_argument("--bot", default="unified")
+    p.add_argument("--contexts", nargs="+", default=["israeli_laws", "knesset_protocols"])
+    p.add_argument("--variants", nargs="+", choices=sorted(VARIANTS), default=list(VARIANTS))
+    p.add_argument("--repeat", type=int, default=10, help="timed passes over the query set")
+    p.add_argument("--queries", type=int, default=20, help="distinct queries from query_evaluations.csv")
+    p.add_argument("--num-results", type=int, default=7)
+    args = p.parse_args(argv)
+
+    os.environ["ENVIRONMENT"] = args.env
+    results = run(args.bot, args.contexts, args.variants, load_queries(args.queries),
+                  args.repeat, args.num_results)
+    report = {"results": results}
+    if "unprepared" in results and "prepared" in results:
+        report["prepared_vs_unprepared"] = compare(results, "unprepared", "prepared")
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
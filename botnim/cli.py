@@ -1,3 +1,5 @@
+import json
+
 import click
 
 from botnim.fetch_and_process import fetch_and_process
@@ -181,6 +183,35 @@ def fetch_and_process_(bot, context, kind, environment):
         logger.error(f"Error in fetch-and-process: {e}", exc_info=True)
         raise
 
+@cli.group(name='metadata-cache')
+def metadata_cache_group():
+    """Inspect and maintain the local extraction-metadata cache (cache/metadata.sqlite)."""
+    pass
+
+@metadata_cache_group.command(name='stats')
+def metadata_cache_stats():
+    """Print the cache's entry count and size."""
+    from .collect_sources import _open_metadata_cache
+    cache = _open_metadata_cache()
+    try:
+        stats = cache.stats()
+    finally:
+        cache.close()
+    click.echo(json.dumps({'path': str(cache.path), 'entries': stats['entries'], 'bytes': stats['bytes']}, indent=2))
+
+@metadata_cache_group.command(name='compact')
+@click.option('--max-age-days', type=click.FLOAT, default=None,
+              help='Also drop entries no sync has written or hit in this many days (default: keep all)')
+def metadata_cache_compact(max_age_days):
+    """Drop the legacy KVFile table and stale entries, then VACUUM."""
+    from .collect_sources import _open_metadata_cache
+    cache = _open_metadata_cache()
+    try:
+        result = cache.compact(max_age_days=max_age_days)
+    finally:
+        cache.close()
+    click.echo(json.dumps(result, indent=2))
+
 @cli.command(name='process-wikitext')
 @click.argument('input_url')
 @click.argument('output_base_dir')
@@ -1,12 +1,16 @@
 import asyncio
+import contextvars
 import io
 import csv
+import queue
 import re
+import threading
+from collections import deque
+from itertools import islice
 from pathlib import Path
 from typing import Union
 import hashlib
 import dataflows as DF
-from kvfile.kvfile_sqlite import CachedKVFileSQLite as KVFile
 import json
 
 # Bump CSV field-size limit globally for this module. Some BudgetKey-sourced
@@ -20,37 +24,50 @@ csv.field_size_limit(10 * 1024 * 1024)
 
 from .config import get_logger
 from .dynamic_extraction import extract_structured_content, extract_structured_content_async
+from .metadata_cache import MetadataCache
 from .document_parser.wikitext.generate_markdown_files import generate_markdown_dict
 from .document_parser.wikitext.pipeline_config import sanitize_filename
-from ._concurrency import SyncConcurrency, get_sync_concurrency, run_async
+from ._concurrency import SyncConcurrency, get_collect_window, get_sync_concurrency, run_async
 
 
 logger = get_logger(__name__)
-cache: KVFile = None
+# The L1 handle is per thread: vector_store_update may sync several contexts
+# at once, each in its own thread + event loop. Each opens its own
+# MetadataCache on the shared WAL-mode file, buffers its own writes, and
+# flushes them when its context ends.
+_l1 = threading.local()
 
 
-def _open_metadata_cache() -> KVFile:
+def _l1_cache() -> MetadataCache:
+    return getattr(_l1, 'cache', None)
+
+
+def _open_metadata_cache() -> MetadataCache:
     """Open the per-process L1 extraction-result cache.
 
     Lives at ``<repo_root>/cache/metadata.sqlite``. The parent dir
     ``<repo_root>/cache/`` is committed in the repo for dev/CI but is
     NOT copied into the prod docker image (no ``COPY cache/`` in
     ``backend/api/Dockerfile``), so a fresh ECS task has no
-    ``/srv/cache/``. Without this mkdir, ``KVFile(...)`` →
-    ``sqlite3.connect(...)`` raises ``OperationalError: unable to open
+    ``/srv/cache/``. Without this mkdir, ``sqlite3.connect(...)`` raises ``OperationalError: unable to open
     database file`` and the sync aborts mid-run — and if the
     ``--force-rebuild`` wipe already ran, the context is left empty in
     Aurora until a successful re-sync.
     """
-    location = Path(__file__).parent.parent / 'cache' / 'metadata'
+    location = Path(__file__).parent.parent / 'cache' / 'metadata.sqlite'
     location.parent.mkdir(parents=True, exist_ok=True)
-    return KVFile(location=str(location))
+    return MetadataCache(location)
 
 
 def _cache_key(content: str) -> str:
     return hashlib.sha256(content.strip().encode('utf-8')).hexdigest()[:16]
 
 
+def _l1_hit(content: str) -> bool:
+    item = _l1_cache().peek(_cache_key(content))
+    return bool(item) and item.get('content') == content
+
+
 def _cached_metadata_for_content(content: str) -> dict | None:
     """Return the cached metadata dict if the cached content exactly matches.
 
@@ -60,13 +77,54 @@ def _cached_metadata_for_content(content: str) -> dict | None:
     hits do not consume slots".
     """
     key = _cache_key(content)
-    item = cache.get(key, default=None)
+    item = _l1_cache().get(key, default=None)
     if item and item.get('content') == content:
         logger.info(f'Cache hit for {key}, cached content: {item.get("content")[:100]!r}')
         return item['metadata']
     return None
 
 
+# L2 writes per put_many. Smaller than a read page: buffered rows are paid-for
+# LLM extractions, and a crash loses whatever hasn't been flushed yet.
+_CACHE_PUT_BATCH = 100
+
+
+def _write_cache_puts(puts: list, extraction_cache, bot: str, context_name: str) -> int:
+    """Write buffered L2 rows with one put_many. Best-effort, like the
+    per-row put it replaces: a failure is logged and the rows are dropped
+    (the next run re-extracts them). Returns how many were re-warms."""
+    from .dynamic_extraction import EXTRACTION_VERSION
+
+    try:
+        extraction_cache.put_many(
+            ((h, payload, document_type) for h, payload, document_type, _ in puts),
+            EXTRACTION_VERSION, bot=bot, context=context_name,
+        )
+    except Exception as e:
+        logger.warning("extraction_cache.put_many failed for %d rows: %s", len(puts), e)
+        return 0
+    return sum(1 for *_, rewarm in puts if rewarm)
+
+
+async def _queue_cache_put(
+    concurrency: SyncConcurrency, extraction_cache, bot: str, context_name: str,
+    content_hash: str, payload: dict, document_type: str | None, *, rewarm: bool = False,
+) -> None:
+    """Buffer one L2 row; every _CACHE_PUT_BATCH rows, write them off-loop."""
+    concurrency.cache_puts.append((content_hash, payload, document_type, rewarm))
+    if len(concurrency.cache_puts) >= _CACHE_PUT_BATCH:
+        puts, concurrency.cache_puts = concurrency.cache_puts, []
+        concurrency.rewarmed_count += await asyncio.to_thread(
+            _write_cache_puts, puts, extraction_cache, bot, context_name,
+        )
+
+
+def _flush_cache_puts(concurrency: SyncConcurrency, extraction_cache, bot: str, context_name: str) -> None:
+    puts, concurrency.cache_puts = concurrency.cache_puts, []
+    if puts:
+        concurrency.rewarmed_count += _write_cache_puts(puts, extraction_cache, bot, context_name)
+
+
 # CSV-row contexts whose fap step fans one source document out into many
 # rows (knesset_protocols → speaker turns, plenary_schedule → (session,
 # item) pairs) flatten the row into the per-chunk markdown content as
@@ -188,7 +246,7 @@ def get_metadata_for_content(content: str, file_path: str, document_type: str) -
         logger.error(f"Error extracting structured content from {file_path}")
         metadata = _build_metadata_record(content, file_path, document_type, None, e)
 
-    cache.set(_cache_key(content), {'content': content, 'metadata': metadata})
+    _l1_cache().set(_cache_key(content), {'content': content, 'metadata': metadata})
     return metadata
 
 
@@ -202,18 +260,22 @@ async def _get_metadata_for_content_async(
     context_name: str | None = None,
     extraction_cache=None,
     client=None,
+    l2_hits: dict | None = None,
 ) -> dict:
     """Concurrent extraction.
 
     Order of operations is load-bearing:
-      1. L1 cache lookup (per-process KVFile). Cache hits skip the pool
+      1. L1 cache lookup (local MetadataCache). Cache hits skip the pool
          entirely so they don't crowd out genuine OpenAI work (DoD).
       2. L2 cache lookup (Aurora extraction_cache). Hits warm L1 and skip
-         the pool too.
+         the pool too. ``l2_hits`` is the caller's ``get_many`` prefetch
+         for this document's batch: when given, a hash absent from it is
+         a miss without another query.
       3. Semaphore-bounded OpenAI call. RpdExhausted trips the shared
          flag (so siblings short-circuit) before re-raising.
-      4. L2 + L1 cache write — L2 best-effort (failures log + continue),
-         L1 always written under the async lock.
+      4. L2 + L1 cache write — L2 buffered for put_many and best-effort
+         (failures log + continue), L1 always written (MetadataCache
+         buffers it; no lock needed).
     """
     from .dynamic_extraction import (
         EXTRACTION_VERSION, RpdExhausted, extract_structured_content_async,
@@ -221,7 +283,7 @@ async def _get_metadata_for_content_async(
 
     content_hash = hashlib.sha256(content.strip().encode("utf-8")).hexdigest()
 
-    # L1: per-process KVFile (legacy fast path).
+    # L1: local MetadataCache (fast path).
     cached_local = _cached_metadata_for_content(content)
     if cached_local is not None:
         return cached_local
@@ -229,17 +291,19 @@ async def _get_metadata_for_content_async(
     # L2: Aurora cache with version-fallback to smooth EXTRACTION_VERSION bumps.
     # See docs/superpowers/specs/2026-05-19-extraction-cache-delta-design.md.
     if extraction_cache is not None:
-        try:
-            hit = extraction_cache.get_with_fallback(content_hash, EXTRACTION_VERSION)
-        except Exception as e:
-            logger.warning(
-                "extraction_cache.get_with_fallback failed for %s: %s", file_path, e,
-            )
-            hit = None
+        if l2_hits is not None:
+            hit = l2_hits.get(content_hash)
+        else:
+            try:
+                hit = extraction_cache.get_with_fallback(content_hash, EXTRACTION_VERSION)
+            except Exception as e:
+                logger.warning(
+                    "extraction_cache.get_with_fallback failed for %s: %s", file_path, e,
+                )
+                hit = None
         if hit is not None:
             payload = hit["payload"]
-            async with concurrency.cache_lock:
-                cache.set(_cache_key(content), {"content": content, "metadata": payload})
+            _l1_cache().set(_cache_key(content), {"content": content, "metadata": payload})
 
             if hit["stale"]:
                 # Stale row served. Try to claim a re-warm slot from the
@@ -299,17 +363,12 @@ async def _get_metadata_for_content_async(
 
     # Persist to L2 (Aurora). Failures here log + continue (L1 still gets it).
     if extraction_cache is not None and bot and context_name:
-        try:
-            extraction_cache.put(
-                content_hash, EXTRACTION_VERSION,
-                payload=metadata, bot=bot, context=context_name,
-                document_type=document_type,
-            )
-        except Exception as e:
-            logger.warning("extraction_cache.put failed for %s: %s", file_path, e)
+        await _queue_cache_put(
+            concurrency, extraction_cache, bot, context_name,
+            content_hash, metadata, document_type,
+        )
 
-    async with concurrency.cache_lock:
-        cache.set(_cache_key(content), {'content': content, 'metadata': metadata})
+    _l1_cache().set(_cache_key(content), {'content': content, 'metadata': metadata})
     return metadata
 
 
@@ -333,7 +392,7 @@ async def _rewarm_extraction(
     competes for the same async semaphore as the primary extraction
     path.
 
-    Deliberately does NOT update L1 (the legacy KVFile) — L1 was already
+    Deliberately does NOT update L1 (the local MetadataCache) — L1 was already
     populated with the stale payload when the sync caller was unblocked,
     and overwriting it mid-run would create a race. The next run's L2
     fallback picks up the freshly-written current-version row as an
@@ -373,15 +432,11 @@ async def _rewarm_extraction(
 
     metadata = _build_metadata_record(content, file_path, document_type, extracted, None)
     if extraction_cache is not None and bot and context_name:
-        try:
-            extraction_cache.put(
-                content_hash, EXTRACTION_VERSION,
-                payload=metadata, bot=bot, context=context_name,
-                document_type=document_type,
-            )
-            concurrency.rewarmed_count += 1
-        except Exception as e:
-            logger.info("rewarm cache.put failed for %s: %s", file_path, e)
+        # Counted in rewarmed_count once put_many has written it.
+        await _queue_cache_put(
+            concurrency, extraction_cache, bot, context_name,
+            content_hash, metadata, document_type, rewarm=True,
+        )
 
 def _prepare_file_content(filename: str, content: Union[str, io.BufferedReader], content_type: str) -> tuple[str, str, str]:
     """Normalize the raw content to (filename, utf-8 text, content_type).
@@ -406,12 +461,13 @@ async def _process_file_stream_async(
     bot: str | None = None,
     context_name: str | None = None,
     extraction_cache=None,
+    l2_hits: dict | None = None,
 ):
     fname, text, ctype = _prepare_file_content(filename, content, content_type)
     metadata = await _get_metadata_for_content_async(
         text, fname, ctype, concurrency,
         bot=bot, context_name=context_name, extraction_cache=extraction_cache,
-        client=client,
+        client=client, l2_hits=l2_hits,
     )
     metadata = dict(metadata or {})
     # extra_meta is structured per-row data lifted out of the CSV (e.g.
@@ -420,10 +476,16 @@ async def _process_file_stream_async(
     metadata['source_id'] = source_id
     return (fname, io.BytesIO(text.encode('utf-8')), ctype, metadata)
 
+def _iter_raw_streams_files(config_dir: Path, source):
+    """Yield (filename, content, content_type, extra_meta) without the OpenAI
+    step, opening each file only when it is reached."""
+    for f in config_dir.glob(source):
+        yield (f.name, f.open('rb'), 'text/markdown', {})
+
+
 def _collect_raw_streams_files(config_dir: Path, source):
     """Return [(filename, content, content_type, extra_meta)] without the OpenAI step."""
-    files = list(config_dir.glob(source))
-    return [(f.name, f.open('rb'), 'text/markdown', {}) for f in files]
+    return list(_iter_raw_streams_files(config_dir, source))
 
 
 def _split_json_file(filename: Path):
@@ -439,24 +501,29 @@ def _split_json_file(filename: Path):
     return [(fname, content, 'text/markdown', {}) for fname, content in markdown_dict.items()]
 
 
-def _collect_raw_streams_split(config_dir: Path, context_name, source, offset=0):
+def _iter_raw_streams_split(config_dir: Path, context_name, source, offset=0):
     # Glob support: a source containing '*' expands to every matching file —
     # the israeli_laws (law-book) context points at
     # extraction/law_book/*_structure_content.json instead of listing ~2000
     # laws in config.yaml. generate_markdown_dict prefixes every chunk filename
     # with the per-law document_name, so chunks never collide across laws.
+    # Yields one law file's sections at a time, so only that file is held.
     if '*' in str(source):
-        results = []
         for path in sorted(config_dir.glob(str(source))):
-            results.extend(_split_json_file(path))
-        return results
+            yield from _split_json_file(path)
+        return
     filename = config_dir / source
     if filename.suffix == '.json':
-        return _split_json_file(filename)
+        yield from _split_json_file(filename)
     else:
         content = filename.read_text()
         parts = content.split('\n---\n')
-        return [(f'{context_name}_{i+offset}.md', c, 'text/markdown', {}) for i, c in enumerate(parts)]
+        for i, c in enumerate(parts):
+            yield (f'{context_name}_{i+offset}.md', c, 'text/markdown', {})
+
+
+def _collect_raw_streams_split(config_dir: Path, context_name, source, offset=0):
+    return list(_iter_raw_streams_split(config_dir, context_name, source, offset=offset))
 
 
 def _collect_raw_streams_google_spreadsheet(context_name, source, offset=0):
@@ -480,8 +547,8 @@ def _collect_raw_streams_google_spreadsheet(context_name, source, offset=0):
     return raw
 
 
-def _collect_raw_streams_csv(config_dir, context_name, source, offset=0):
-    """Flatten CSV rows into markdown chunks.
+def _iter_raw_streams_csv(config_dir, context_name, source, offset=0):
+    """Flatten CSV rows into markdown chunks, one row at a time.
 
     Columns listed in ``_METADATA_ONLY_CSV_COLUMNS`` (e.g. ``source_url``)
     are NOT included in the markdown content — they land in the per-row
@@ -491,7 +558,6 @@ def _collect_raw_streams_csv(config_dir, context_name, source, offset=0):
     """
     with open(config_dir / source, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
-        raw = []
         for idx, row in enumerate(reader):
             content = ''
             extra_meta: dict = {}
@@ -511,11 +577,16 @@ def _collect_raw_streams_csv(config_dir, context_name, source, offset=0):
                         extra_meta[meta_key] = v
                     continue
                 content += f'{k}:\n{v}\n\n'
-            raw.append((f'{context_name}_{idx+offset}.md', content, 'text/markdown', extra_meta))
-        return raw
+            yield (f'{context_name}_{idx+offset}.md', content, 'text/markdown', extra_meta)
+
+
+def _collect_raw_streams_csv(config_dir, context_name, source, offset=0):
+    """List form of ``_iter_raw_streams_csv``."""
+    return list(_iter_raw_streams_csv(config_dir, context_name, source, offset=offset))
+
 
 def _raw_streams_for_context(config_dir, context_name, context_, offset=0):
-    """Gather raw (filename, content, content_type, source_id) tuples without calling OpenAI.
+    """Yield raw (filename, content, content_type, source_id, extra_meta) tuples without calling OpenAI.
 
     Each tuple now carries the derived `source_id` so per-source attribution
     survives through the async extraction pipeline into upload_files.
@@ -527,20 +598,65 @@ def _raw_streams_for_context(config_dir, context_name, context_, offset=0):
     source_id = _source_id_for(fetcher, source)
 
     if context_type == 'files':
-        raw = _collect_raw_streams_files(config_dir, source)
+        raw = _iter_raw_streams_files(config_dir, source)
     elif context_type == 'split':
-        raw = _collect_raw_streams_split(config_dir, context_name, source, offset=offset)
+        raw = _iter_raw_streams_split(config_dir, context_name, source, offset=offset)
     elif context_type == 'google-spreadsheet':
+        # Spreadsheets are small; dataflows loads them whole.
         raw = _collect_raw_streams_google_spreadsheet(context_name, source, offset=offset)
     elif context_type == 'csv':
-        raw = _collect_raw_streams_csv(config_dir, context_name, source, offset=offset)
+        raw = _iter_raw_streams_csv(config_dir, context_name, source, offset=offset)
     else:
         raise ValueError(f'Unknown context type: {context_type}')
 
-    return [(fname, content, ctype, source_id, extra_meta) for fname, content, ctype, extra_meta in raw]
+    for fname, content, ctype, extra_meta in raw:
+        yield (fname, content, ctype, source_id, extra_meta)
 
 
-async def collect_context_sources_async(
+def _iter_raw_streams(context_, config_dir):
+    """Raw tuples of every source of ``context_``, in config order.
+
+    Multi-source contexts number positional filenames on from the previous
+    source's last row (``offset``), as the list-based collector did.
+    """
+    context_name = context_['name']
+    if 'sources' in context_:
+        count = 0
+        for source in context_['sources']:
+            for item in _raw_streams_for_context(config_dir, context_name, source, offset=count):
+                count += 1
+                yield item
+    elif 'type' in context_ and 'source' in context_:
+        yield from _raw_streams_for_context(config_dir, context_name, context_)
+    else:
+        # Context with neither `sources` nor a single inline source — used by
+        # direct-Aurora fetchers (e.g. gov_il_decisions) that bypass the
+        # extraction/<x>.csv pipeline entirely. Sync becomes a no-op for the
+        # data side; the context row is still upserted by
+        # get_or_create_vector_store so /admin/sources still sees it.
+        logger.info(
+            "Context %s has no sources to collect (direct-Aurora fetcher).",
+            context_name,
+        )
+
+
+async def _prefetch_l2_hits(extraction_cache, texts: list[str]) -> dict | None:
+    """``get_many`` the L2 rows of every L1 miss among ``texts`` in one
+    pass. None if the lookup failed, so each document falls back to its
+    own ``get_with_fallback``."""
+    from .dynamic_extraction import EXTRACTION_VERSION
+
+    hashes = [hashlib.sha256(t.strip().encode("utf-8")).hexdigest() for t in texts if not _l1_hit(t)]
+    if not hashes:
+        return {}
+    try:
+        return await asyncio.to_thread(extraction_cache.get_many, hashes, EXTRACTION_VERSION)
+    except Exception as e:
+        logger.warning("extraction_cache.get_many failed for %d documents: %s", len(hashes), e)
+        return None
+
+
+async def iter_context_sources_async(
     context_,
     config_dir: Path,
     concurrency: SyncConcurrency,
@@ -548,86 +664,170 @@ async def collect_context_sources_async(
     bot: str | None = None,
     extraction_cache=None,
     client=None,
+    window: int | None = None,
 ):
-    """Async variant of ``collect_context_sources``.
+    """Yield the context's ``(fname, BytesIO, content_type, metadata)``
+    file streams in source order, as their extraction completes.
 
-    Extraction for the N source files happens concurrently under the
-    bounded semaphore. Cache hits skip the semaphore entirely so a warm
-    sync never blocks on API slots.
+    Source rows are read lazily and at most ``window`` of them
+    (``SYNC_COLLECT_WINDOW`` by default) are in extraction at once, so a
+    context's documents never all sit in memory together. Extraction runs
+    concurrently under the bounded semaphore; cache hits skip it entirely
+    so a warm sync never blocks on API slots.
 
     When ``extraction_cache`` is provided, the Aurora-backed L2 cache is
-    consulted before each LLM call and populated on miss. RPD short-
+    consulted before each LLM call — one ``get_many`` per window of
+    sources, for the L1 misses — and populated on miss with ``put_many``
+    batches. RPD short-
     circuits via ``RpdExhausted`` — exhausted siblings are dropped, but
-    successful + cached extractions are still returned so the run can
+    successful + cached extractions are still yielded so the run can
     embed partial progress.
     """
     from .dynamic_extraction import RpdExhausted
 
-    global cache
-    cache = _open_metadata_cache()
-
+    window = window or get_collect_window()
     context_name = context_['name']
-    raw: list[tuple[str, object, str, str, dict]] = []
-    if 'sources' in context_:
-        for source in context_['sources']:
-            raw.extend(_raw_streams_for_context(config_dir, context_name, source, offset=len(raw)))
-    elif 'type' in context_ and 'source' in context_:
-        raw.extend(_raw_streams_for_context(config_dir, context_name, context_))
-    else:
-        # Context with neither `sources` nor a single inline source — used by
-        # direct-Aurora fetchers (e.g. gov_il_decisions) that bypass the
-        # extraction/<x>.csv pipeline entirely. Sync becomes a no-op for the
-        # data side; the context row is still upserted by
-        # get_or_create_vector_store so /admin/sources still sees it.
+    _l1.cache = _open_metadata_cache()
+    # (filename, task) in source order; popped from the left, so the output
+    # order is the input order — SYNC_CONCURRENCY=1 stays byte-equal to the
+    # serial implementation. A source that couldn't be read holds its
+    # exception instead of a task.
+    pending: deque = deque()
+    total = extracted = rpd_count = 0
+
+    async def _next_result():
+        nonlocal extracted, rpd_count
+        fn, task = pending.popleft()
+        try:
+            if isinstance(task, BaseException):
+                raise task
+            result = await task
+        except RpdExhausted:
+            rpd_count += 1
+            return None
+        except Exception as e:
+            # Error isolation: one failed document must not poison the batch.
+            logger.error(f"Extraction failed for {fn}: {e}")
+            return None
+        extracted += 1
+        return result
+
+    try:
+        raw = _iter_raw_streams(context_, config_dir)
+        while batch := list(islice(raw, window)):
+            prepared = []
+            for fn, content, ct, sid, em in batch:
+                try:
+                    prepared.append((fn, _prepare_file_content(fn, content, ct), sid, em))
+                except Exception as e:
+                    prepared.append((fn, e, sid, em))
+            del batch
+            l2_hits = None
+            if extraction_cache is not None:
+                l2_hits = await _prefetch_l2_hits(
+                    extraction_cache,
+                    [p[1] for _, p, _, _ in prepared if not isinstance(p, BaseException)],
+                )
+            for fn, p, sid, em in prepared:
+                total += 1
+                if isinstance(p, BaseException):
+                    pending.append((fn, p))
+                else:
+                    fname, text, ctype = p
+                    pending.append((fn, asyncio.ensure_future(_process_file_stream_async(
+                        fname, text, ctype, sid, em, concurrency, client,
+                        bot=bot, context_name=context_name, extraction_cache=extraction_cache,
+                        l2_hits=l2_hits,
+                    ))))
+                if len(pending) >= window:
+                    result = await _next_result()
+                    if result is not None:
+                        yield result
+        while pending:
+            result = await _next_result()
+            if result is not None:
+                yield result
+
+        if rpd_count > 0:
+            logger.warning(
+                "EXTRACTION RPD HIT: %d/%d files left un-extracted in context %s. "
+                "%d files were extracted (cache+fresh) and will be embedded this run. "
+                "RESUME: re-run `botnim sync <env> <bot>` after the daily limit "
+                "resets (midnight UTC). Cached extractions persist in Aurora; the "
+                "next run will only call gpt-4o-mini for the remaining %d files.",
+                rpd_count, total, context_name, extracted, rpd_count,
+            )
+
+        # Drain any background re-warm tasks before returning so the
+        # orchestrator's `asyncio.run()` loop doesn't close mid-LLM-call and
+        # cancel them — that would leave rewarmed_count=0 even though the
+        # budget was consumed. Each re-warm is best-effort; exceptions are
+        # captured so a single failure doesn't poison the whole drain.
+        if concurrency.rewarm_tasks:
+            await asyncio.gather(*concurrency.rewarm_tasks, return_exceptions=True)
+            concurrency.rewarm_tasks.clear()
+    finally:
+        # Consumer stopped early (or failed): don't leave extractions running.
+        tasks = [task for _, task in pending if isinstance(task, asyncio.Future)]
+        pending.clear()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if extraction_cache is not None and bot and context_name:
+            _flush_cache_puts(concurrency, extraction_cache, bot, context_name)
+        try:
+            _l1.cache.flush()
+            l1_stats = _l1.cache.stats()
+        finally:
+            _l1.cache.close()
+            _l1.cache = None
         logger.info(
-            "Context %s has no sources to collect (direct-Aurora fetcher).",
-            context_name,
+            "L1_METADATA_CACHE: context=%s hits=%d misses=%d hit_ratio=%.2f "
+            "writes=%d flushes=%d entries=%d size_mb=%.1f",
+            context_name, l1_stats['hits'], l1_stats['misses'], l1_stats['hit_ratio'],
+            l1_stats['writes'], l1_stats['flushes'], l1_stats['entries'], l1_stats['bytes'] / 2**20,
         )
 
-    # asyncio.gather preserves input order in its output list — this is
-    # what keeps SYNC_CONCURRENCY=1 byte-equal to the serial implementation.
-    tasks = [
-        _process_file_stream_async(
-            fn, content, ct, sid, em, concurrency, client,
-            bot=bot, context_name=context_name, extraction_cache=extraction_cache,
-        )
-        for fn, content, ct, sid, em in raw
-    ]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
 
-    file_streams: list = []
-    rpd_count = 0
-    for r, (fn, _, _, _, _) in zip(results, raw):
-        if isinstance(r, RpdExhausted):
-            rpd_count += 1
-            continue
-        if isinstance(r, BaseException):
-            # Error isolation: one failed document must not poison the batch.
-            logger.error(f"Extraction failed for {fn}: {r}")
-            continue
-        file_streams.append(r)
-
-    if rpd_count > 0:
-        logger.warning(
-            "EXTRACTION RPD HIT: %d/%d files left un-extracted in context %s. "
-            "%d files were extracted (cache+fresh) and will be embedded this run. "
-            "RESUME: re-run `botnim sync <env> <bot>` after the daily limit "
-            "resets (midnight UTC). Cached extractions persist in Aurora; the "
-            "next run will only call gpt-4o-mini for the remaining %d files.",
-            rpd_count, len(tasks), context_name, len(file_streams), rpd_count,
+async def collect_context_sources_async(
+    context_,
+    config_dir: Path,
+    concurrency: SyncConcurrency,
+    *,
+    bot: str | None = None,
+    extraction_cache=None,
+    client=None,
+):
+    """List form of ``iter_context_sources_async``."""
+    return [
+        stream async for stream in iter_context_sources_async(
+            context_, config_dir, concurrency,
+            bot=bot, extraction_cache=extraction_cache, client=client,
         )
+    ]
 
-    # Drain any background re-warm tasks before returning so the
-    # orchestrator's `asyncio.run()` loop doesn't close mid-LLM-call and
-    # cancel them — that would leave rewarmed_count=0 even though the
-    # budget was consumed. Each re-warm is best-effort; exceptions are
-    # captured so a single failure doesn't poison the whole drain.
-    if concurrency.rewarm_tasks:
-        await asyncio.gather(*concurrency.rewarm_tasks, return_exceptions=True)
-        concurrency.rewarm_tasks.clear()
 
-    cache.close()
-    return file_streams
+def _log_extraction_cache_summary(context_, bot, concurrency: SyncConcurrency) -> None:
+    # Cache-stats summary line — see 2026-05-19 extraction-cache-delta-design
+    # spec. CloudWatch metric filter on EXTRACTION_CACHE_SUMMARY surfaces the
+    # post-bump re-warm progress without needing a new DB column.
+    context_slug = context_.get('slug') or context_.get('name') or '?'
+    logger.info(
+        "EXTRACTION_CACHE_SUMMARY: bot=%s context=%s "
+        "exact_hits=%d stale_served=%d rewarmed=%d llm_misses=%d "
+        "rewarm_budget_remaining=%d llm_calls_made=%d circuit_skipped=%d "
+        "circuit_broken=%s",
+        bot or '?', context_slug,
+        concurrency.exact_hits_count,
+        concurrency.stale_served_count,
+        concurrency.rewarmed_count,
+        concurrency.llm_miss_count,
+        concurrency.rewarm_budget_remaining,
+        concurrency.llm_calls_made,
+        concurrency.circuit_skipped_count,
+        concurrency.circuit_broken,
+    )
 
 
 def collect_context_sources(context_, config_dir: Path, *, bot=None,
@@ -649,33 +849,95 @@ def collect_context_sources(context_, config_dir: Path, *, bot=None,
     every per-context call so the circuit breaker spans the whole run.
     When ``None``, SyncConcurrency falls back to a private per-context
     budget — fine for ad-hoc / single-context callers.
+
+    Holds the whole context in memory; backends that can consume file
+    streams as they come use ``iter_context_sources`` instead.
     """
     concurrency = SyncConcurrency(run_budget=run_budget)
     result = run_async(collect_context_sources_async(
         context_, config_dir, concurrency,
         bot=bot, extraction_cache=extraction_cache,
     ))
-    # Cache-stats summary line — see 2026-05-19 extraction-cache-delta-design
-    # spec. CloudWatch metric filter on EXTRACTION_CACHE_SUMMARY surfaces the
-    # post-bump re-warm progress without needing a new DB column.
-    context_slug = context_.get('slug') or context_.get('name') or '?'
-    logger.info(
-        "EXTRACTION_CACHE_SUMMARY: bot=%s context=%s "
-        "exact_hits=%d stale_served=%d rewarmed=%d llm_misses=%d "
-        "rewarm_budget_remaining=%d llm_calls_made=%d circuit_skipped=%d "
-        "circuit_broken=%s",
-        bot or '?', context_slug,
-        concurrency.exact_hits_count,
-        concurrency.stale_served_count,
-        concurrency.rewarmed_count,
-        concurrency.llm_miss_count,
-        concurrency.rewarm_budget_remaining,
-        concurrency.llm_calls_made,
-        concurrency.circuit_skipped_count,
-        concurrency.circuit_broken,
-    )
+    _log_extraction_cache_summary(context_, bot, concurrency)
     return result
 
+
+_STREAM_DONE = object()
+_STREAM_POLL_SECONDS = 0.02
+
+
+def iter_context_sources(context_, config_dir: Path, *, bot=None,
+                         extraction_cache=None, run_budget=None, window: int | None = None):
+    """Streaming ``collect_context_sources``: a generator of the same file
+    streams, in the same order.
+
+    Extraction runs on a producer thread with its own event loop, so it
+    keeps going while the caller uploads what it already has. At most
+    ``window`` files are in extraction and at most ``window`` more wait
+    for the caller, which bounds memory to the window instead of the
+    whole context. Closing the generator early cancels the extractions
+    still in flight; a producer error is re-raised to the caller.
+    """
+    window = window or get_collect_window()
+    concurrency = SyncConcurrency(run_budget=run_budget)
+    ready: queue.Queue = queue.Queue(maxsize=window)
+    stop = threading.Event()
+
+    async def _produce():
+        streams = iter_context_sources_async(
+            context_, config_dir, concurrency,
+            bot=bot, extraction_cache=extraction_cache, window=window,
+        )
+        try:
+            async for stream in streams:
+                # A blocking put would stall the loop and every extraction
+                # on it; poll instead, as SharedSlots does.
+                while not stop.is_set():
+                    try:
+                        ready.put_nowait(stream)
+                        break
+                    except queue.Full:
+                        await asyncio.sleep(_STREAM_POLL_SECONDS)
+                if stop.is_set():
+                    return
+        finally:
+            await streams.aclose()
+
+    def _run():
+        try:
+            run_async(_produce())
+        except BaseException as exc:
+            ready.put(exc)
+        else:
+            ready.put(_STREAM_DONE)
+
+    # copy_context: the fap_sync_context() OpenAI-key override lives in a
+    # contextvar the producer thread must inherit.
+    producer = threading.Thread(
+        target=contextvars.copy_context().run, args=(_run,),
+        name=f"collect-{context_.get('slug') or context_.get('name')}", daemon=True,
+    )
+    producer.start()
+    try:
+        while True:
+            item = ready.get()
+            if item is _STREAM_DONE:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+        _log_extraction_cache_summary(context_, bot, concurrency)
+    finally:
+        stop.set()
+        # Unblock a producer waiting to hand over its final item.
+        while producer.is_alive():
+            try:
+                ready.get(timeout=_STREAM_POLL_SECONDS)
+            except queue.Empty:
+                pass
+        producer.join()
+
+
 def collect_all_sources(context_list, config_dir):
     all_sources = []
     for context in context_list:
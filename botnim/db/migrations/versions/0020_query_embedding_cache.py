@@ -0,0 +1,47 @@
+"""query_embedding_cache: shared tier of the /retrieve query-embedding cache
+
+Revision ID: 0020_query_embedding_cache
+Revises: 0019_law_name_catalog_owner
+Create Date: 2026-10-16
+
+Backs `botnim.query_embedding_cache` when BOTNIM_QUERY_EMBEDDING_CACHE_SHARED
+is set, so every API task reuses an embedding another task already paid for.
+Keyed on (sha256(query_text), model); rows older than the cache TTL are
+ignored on read and can be deleted at will — nothing else references them.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0020_query_embedding_cache"
+down_revision = "0019_law_name_catalog_owner"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE query_embedding_cache (
+            query_hash  TEXT         NOT NULL,
+            model       TEXT         NOT NULL,
+            embedding   vector(1536) NOT NULL,
+            created_at  TIMESTAMPTZ  NOT NULL DEFAULT now(),
+
+            PRIMARY KEY (query_hash, model)
+        );
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX idx_query_embedding_cache_created_at
+            ON query_embedding_cache (created_at);
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_query_embedding_cache_created_at;")
+    op.execute("DROP TABLE IF EXISTS query_embedding_cache;")
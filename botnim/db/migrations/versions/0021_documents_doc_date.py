@@ -0,0 +1,74 @@
+"""documents.doc_date: sortable document date for RECENCY_BROWSE.
+
+_recency_search used to COALESCE six `metadata->>` date keys, regex-validate
+the result and ROW_NUMBER() the chunks of every document — on every row of
+the context, on every call (a full-context scan of knesset_protocols and
+government_decisions). The date is now normalized once, at ingest
+(_doc_date in vector_store_aurora.py, applied by _copy_documents and
+aurora_writer.write_decision), into a `date` column.
+
+The partial index covers each document's first chunk only — the same
+`doc_date IS NOT NULL AND coalesce(metadata->>'chunk_index', '0') = '0'`
+predicate _recency_search filtered on — so the browse is an index range scan
+that stops after num_results rows, already deduplicated. 0023 rebuilds it on
+the chunk_index column added in 0022.
+
+Existing rows are backfilled here with the same rules in SQL: first
+non-empty key wins, strict ISO or DD.MM.YYYY regex (government_decisions'
+publish_date), and an impossible day (2025-02-30) stays NULL instead of
+failing the cast. Only rows that carry a date key are touched. CONCURRENTLY
+index build as in 0015.
+"""
+from alembic import op
+
+revision = "0021_documents_doc_date"
+down_revision = "0020_query_embedding_cache"
+branch_labels = None
+depends_on = None
+
+# Same precedence as _DOC_DATE_KEYS: top-level keys, then extracted_data.
+_DATE_KEYS = ("תאריך", "תאריך_מכתב", "PublicationDate", "publish_date")
+_RAW_DATE_EXPR = "COALESCE(" + ", ".join(
+    [f"NULLIF(metadata->>'{k}', '')" for k in _DATE_KEYS]
+    + [f"NULLIF(metadata->'extracted_data'->>'{k}', '')" for k in _DATE_KEYS]
+) + ")"
+# Same patterns as _DOC_DATE_RE / _DOC_DATE_DMY_RE.
+_DATE_RE = "^(19[0-9]{2}|20[0-3][0-9])-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])"
+_DMY_RE = "^(0[1-9]|[12][0-9]|3[01])\\.(0[1-9]|1[0-2])\\.(19[0-9]{2}|20[0-3][0-9])$"
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE documents ADD COLUMN doc_date date")
+    op.execute(f"""
+        UPDATE documents d
+        SET doc_date = make_date(p.y, p.m, p.d)
+        FROM (
+            SELECT id,
+                   CASE WHEN raw ~ '{_DATE_RE}' THEN substr(raw, 1, 4)::int
+                        WHEN raw ~ '{_DMY_RE}' THEN substr(raw, 7, 4)::int END AS y,
+                   CASE WHEN raw ~ '{_DATE_RE}' THEN substr(raw, 6, 2)::int
+                        WHEN raw ~ '{_DMY_RE}' THEN substr(raw, 4, 2)::int END AS m,
+                   CASE WHEN raw ~ '{_DATE_RE}' THEN substr(raw, 9, 2)::int
+                        WHEN raw ~ '{_DMY_RE}' THEN substr(raw, 1, 2)::int END AS d
+            FROM (
+                SELECT id, {_RAW_DATE_EXPR} AS raw
+                FROM documents
+                WHERE metadata ?| ARRAY['{"', '".join(_DATE_KEYS)}', 'extracted_data']
+            ) r
+        ) p
+        WHERE d.id = p.id
+          AND p.y IS NOT NULL
+          AND p.d <= extract(day FROM make_date(p.y, p.m, 1) + interval '1 month - 1 day')
+    """)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS documents_context_doc_date "
+            "ON documents (context_id, doc_date DESC, id DESC) "
+            "WHERE doc_date IS NOT NULL AND coalesce(metadata->>'chunk_index', '0') = '0'"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS documents_context_doc_date")
+    op.execute("ALTER TABLE documents DROP COLUMN IF EXISTS doc_date")
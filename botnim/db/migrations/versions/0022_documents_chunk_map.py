@@ -0,0 +1,51 @@
+"""documents.document_key + chunk_index: document -> chunk map for expansion.
+
+_expand_to_documents (decision-complete retrieval) collects every chunk of
+the decisions/opinions a search hit belongs to. It used to filter on
+`metadata->>'DocumentTitle' IN (...)` and order by
+`(metadata->>'chunk_index')::int` — JSONB extraction and a cast on every
+candidate row, with no index on either.
+
+Both are now plain columns, set at ingest (_document_key / _chunk_index in
+vector_store_aurora.py, applied by _copy_documents and
+aurora_writer.write_decision):
+  - document_key: md5(DocumentTitle), NULL for untitled rows. Hashed so the
+    index key stays 32 bytes whatever the title length.
+  - chunk_index: metadata.chunk_index, 0 when absent (single-chunk files).
+
+The partial (context_id, document_key, chunk_index, id) index serves each
+title's siblings in chunk order; expansion stops after max_chunks + 1 rows
+per title. Backfilled here with the same rules in SQL (md5() over UTF-8 text
+matches hashlib.md5). CONCURRENTLY index build as in 0015.
+"""
+from alembic import op
+
+revision = "0022_documents_chunk_map"
+down_revision = "0021_documents_doc_date"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE documents ADD COLUMN document_key text")
+    op.execute("ALTER TABLE documents ADD COLUMN chunk_index integer NOT NULL DEFAULT 0")
+    op.execute("""
+        UPDATE documents
+        SET document_key = md5(NULLIF(metadata->>'DocumentTitle', '')),
+            chunk_index = CASE WHEN metadata->>'chunk_index' ~ '^[0-9]+$'
+                               THEN (metadata->>'chunk_index')::int ELSE 0 END
+        WHERE metadata ?| ARRAY['DocumentTitle', 'chunk_index']
+    """)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS documents_document_chunks "
+            "ON documents (context_id, document_key, chunk_index, id) "
+            "WHERE document_key IS NOT NULL"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS documents_document_chunks")
+    op.execute("ALTER TABLE documents DROP COLUMN IF EXISTS chunk_index")
+    op.execute("ALTER TABLE documents DROP COLUMN IF EXISTS document_key")
@@ -0,0 +1,37 @@
+"""documents_context_doc_date: first-chunk predicate on the chunk_index column.
+
+0021 built the RECENCY_BROWSE index before documents had a chunk_index
+column, so its "first chunk only" predicate read the JSONB key:
+`coalesce(metadata->>'chunk_index', '0') = '0'`. 0022 added the column;
+the index (and _recency_search, which must repeat the predicate verbatim
+for the planner to use it) now filter on `chunk_index = 0`.
+
+The new index is built CONCURRENTLY under a temporary name, then swapped
+in for the old one, so recency browses always have an index to walk.
+"""
+from alembic import op
+
+revision = "0023_doc_date_index_chunk_column"
+down_revision = "0022_documents_chunk_map"
+branch_labels = None
+depends_on = None
+
+
+def _swap_index(predicate: str) -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS documents_context_doc_date_new")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY documents_context_doc_date_new "
+            "ON documents (context_id, doc_date DESC, id DESC) "
+            f"WHERE doc_date IS NOT NULL AND {predicate}"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS documents_context_doc_date")
+        op.execute("ALTER INDEX documents_context_doc_date_new RENAME TO documents_context_doc_date")
+
+
+def upgrade() -> None:
+    _swap_index("chunk_index = 0")
+
+
+def downgrade() -> None:
+    _swap_index("coalesce(metadata->>'chunk_index', '0') = '0'")
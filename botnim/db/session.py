@@ -3,36 +3,95 @@
 Reads DB_HOST / DB_PORT / DB_NAME / DB_USER / DB_PASSWORD from the
 process environment (the canonical pattern for shared-ecs-app
 consumers — see modules/shared-ecs-app/README.md). Falls back to
-DATABASE_URL for local dev. Engine is cached at module load time
-(one engine per process — same pattern as the existing ES client).
+DATABASE_URL for local dev. Engines are cached at module level (one
+per role per process — same pattern as the existing ES client).
+
+Two engine roles, each with its own connection pool:
+
+- ``write`` (the default everywhere): sync, admin refresh, sanity
+  storage, caches that INSERT.
+- ``read``: the retrieve path. A separate pool means a background
+  sync's long transactions can't hold every connection a concurrent
+  ``/retrieve`` needs. With ``DB_READER_HOST`` (or
+  ``DATABASE_READER_URL``) set it connects to the Aurora reader
+  endpoint; otherwise to the same database as ``write``.
+
+Pool sizing comes from ``BOTNIM_DB_<ROLE>_<SETTING>``, then
+``BOTNIM_DB_<SETTING>``, then SQLAlchemy's defaults, for SETTING in
+POOL_SIZE / MAX_OVERFLOW / POOL_TIMEOUT / POOL_RECYCLE (e.g.
+``BOTNIM_DB_READ_POOL_SIZE=10``). ``pool_stats()`` reports checkout
+waits per role. PREPARE_THRESHOLD / PREPARED_MAX_STATEMENTS tune
+psycopg's server-side prepared statements the same way (see
+``_PREPARE_DEFAULTS``).
 """
 from __future__ import annotations
 
+import contextvars
+import logging
 import os
+import threading
+import time
 from contextlib import contextmanager
 from typing import Iterator
 from urllib.parse import quote_plus
 
-from sqlalchemy import create_engine
+import psycopg
+from sqlalchemy import create_engine, event
+from sqlalchemy import exc as sa_exc
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
+
+WRITE = "write"
+READ = "read"
 
 _engine: Engine | None = None
 _SessionFactory: sessionmaker | None = None
+_read_engine: Engine | None = None
+_ReadSessionFactory: sessionmaker | None = None
+# The write engine the read engine was built next to. Resetting ``_engine``
+# (tests, a DATABASE_URL swap) rebuilds the read engine on its next use.
+_read_engine_base: Engine | None = None
+_read_engine_lock = threading.Lock()
 
+# SQLAlchemy's own QueuePool defaults.
+_POOL_DEFAULTS = {"pool_size": 5, "max_overflow": 10, "pool_timeout": 30, "pool_recycle": -1}
+# Checkouts slower than this are logged (DB_POOL_WAIT).
+_POOL_WAIT_WARN_MS = 1000.0
+# psycopg prepares a statement server-side once the same SQL text has run
+# ``prepare_threshold`` times on a connection, keeping the
+# ``prepared_max_statements`` most recent per connection. The write role
+# keeps psycopg's defaults. The read role ships with preparation off: the
+# retrieve path re-sends a small fixed set of large statements, but whether
+# preparing them (threshold 1) beats re-planning has not been measured on
+# Aurora yet — run botnim.benchmark.retrieve_latency (its ``prepared``
+# variant sets ``BOTNIM_DB_READ_PREPARE_THRESHOLD=1``) before turning it on.
+# ``BOTNIM_DB_[<ROLE>_]PREPARE_THRESHOLD=none`` turns preparation off (needed
+# behind a transaction-pooling proxy).
+_PREPARE_DEFAULTS = {
+    WRITE: {"prepare_threshold": 5, "prepared_max_statements": 100},
+    READ: {"prepare_threshold": None, "prepared_max_statements": 256},
+}
 
-def _build_database_url() -> str:
+
+def _build_database_url(reader: bool = False) -> str:
     # Preferred path: per-field env vars (set by ECS task def via
     # shared-ecs-app secret_environment_variables JSON-key selectors).
     host = os.getenv("DB_HOST")
     if host:
+        if reader:
+            host = os.getenv("DB_READER_HOST") or host
         port = os.getenv("DB_PORT", "5432")
         dbname = os.getenv("DB_NAME") or "botnim_staging"
         user = os.getenv("DB_USER") or "botnim_app"
         password = os.getenv("DB_PASSWORD", "")
         return f"postgresql+psycopg://{quote_plus(user)}:{quote_plus(password)}@{host}:{port}/{dbname}"
     # Fallback: explicit DATABASE_URL (local dev / pytest-postgresql / cutover scripts)
-    db_url = os.getenv("DATABASE_URL") or os.getenv("BOTNIM_DATABASE_URL")
+    db_url = ((reader and os.getenv("DATABASE_READER_URL"))
+              or os.getenv("DATABASE_URL") or os.getenv("BOTNIM_DATABASE_URL"))
     if not db_url:
         raise RuntimeError(
             "DB_HOST + DB_PORT/DB_NAME/DB_USER/DB_PASSWORD or DATABASE_URL "
@@ -45,15 +104,183 @@ def _build_database_url() -> str:
     return db_url
 
 
-def get_engine() -> Engine:
+def _register_vector_types(dbapi_connection, connection_record) -> None:
+    """Register the pgvector psycopg adapters on each new DB connection.
+
+    Lets callers bind embeddings as ``pgvector.psycopg.Vector`` so they
+    travel as binary float4 instead of a ~20KB decimal literal parsed by
+    ``CAST(:emb AS vector)`` on every query, and lets binary COPY name the
+    ``vector`` type. A database without the extension yet (fresh DB before
+    ``alembic upgrade``) just skips registration.
+    """
+    from pgvector.psycopg import register_vector
+    try:
+        register_vector(dbapi_connection)
+    except Exception as exc:
+        dbapi_connection.rollback()
+        logger.warning("pgvector types not registered on new connection: %s", exc)
+
+
+class _PoolMetrics:
+    """Checkout counters for one role's pool (survive pool re-creation)."""
+
+    def __init__(self, role: str) -> None:
+        self.role = role
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+
+    def record(self, wait_ms: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_ms_total += wait_ms
+            self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+        if wait_ms >= _POOL_WAIT_WARN_MS:
+            logger.warning("DB_POOL_WAIT role=%s wait_ms=%.0f", self.role, wait_ms)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+        logger.warning("DB_POOL_TIMEOUT role=%s", self.role)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms_avg": round(self.wait_ms_total / self.checkouts, 2) if self.checkouts else 0.0,
+                "wait_ms_max": round(self.wait_ms_max, 2),
+            }
+
+
+class _MeteredQueuePool(QueuePool):
+    """QueuePool that times every checkout (queue wait, plus the connect
+    when the pool opens a new connection)."""
+
+    metrics: _PoolMetrics
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except sa_exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record((time.perf_counter() - started) * 1000.0)
+        return conn
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def _role_int_settings(role: str, defaults: dict[str, int | None]) -> dict[str, int | None]:
+    """``defaults`` overridden by BOTNIM_DB_<ROLE>_<KEY>, then BOTNIM_DB_<KEY>.
+    ``none`` maps to None (only meaningful where the setting allows it)."""
+    settings = {}
+    for key, default in defaults.items():
+        names = (f"BOTNIM_DB_{role.upper()}_{key.upper()}", f"BOTNIM_DB_{key.upper()}")
+        raw = next((os.getenv(n) for n in names if os.getenv(n)), None)
+        if raw is None:
+            settings[key] = default
+        elif raw.strip().lower() == "none":
+            settings[key] = None
+        else:
+            try:
+                settings[key] = int(raw)
+            except ValueError:
+                logger.warning("%s=%r is not an int; using %s", names[0], raw, default)
+                settings[key] = default
+    return settings
+
+
+def _pool_settings(role: str) -> dict[str, int]:
+    settings = _role_int_settings(role, _POOL_DEFAULTS)
+    return {k: _POOL_DEFAULTS[k] if v is None else v for k, v in settings.items()}
+
+
+def _prepare_settings(role: str) -> dict[str, int | None]:
+    settings = _role_int_settings(role, _PREPARE_DEFAULTS[role])
+    if settings["prepared_max_statements"] is None:
+        settings["prepared_max_statements"] = _PREPARE_DEFAULTS[role]["prepared_max_statements"]
+    return settings
+
+
+def _prepared_statement_listener(settings: dict[str, int | None]):
+    def _configure(dbapi_connection, connection_record) -> None:
+        dbapi_connection.prepare_threshold = settings["prepare_threshold"]
+        dbapi_connection.prepared_max_statements = settings["prepared_max_statements"]
+    return _configure
+
+
+def _create_engine(url: str, role: str) -> tuple[Engine, sessionmaker]:
+    engine = create_engine(url, pool_pre_ping=True, poolclass=_MeteredQueuePool, **_pool_settings(role))
+    engine.pool.metrics = _PoolMetrics(role)
+    event.listen(engine, "connect", _register_vector_types)
+    event.listen(engine, "connect", _prepared_statement_listener(_prepare_settings(role)))
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    event.listen(factory, "after_begin", _apply_statement_deadline)
+    return engine, factory
+
+
+def get_engine(role: str = WRITE) -> Engine:
+    """The cached engine for ``role`` (``WRITE`` or ``READ``)."""
     global _engine, _SessionFactory
+    if role == READ:
+        return _get_read_engine()
+    if role != WRITE:
+        raise ValueError(f"unknown engine role {role!r}; expected {WRITE!r} or {READ!r}")
     if _engine is not None:
         return _engine
-    _engine = create_engine(_build_database_url(), pool_pre_ping=True)
-    _SessionFactory = sessionmaker(bind=_engine, expire_on_commit=False)
+    _engine, _SessionFactory = _create_engine(_build_database_url(), WRITE)
     return _engine
 
 
+def _get_read_engine() -> Engine:
+    global _read_engine, _ReadSessionFactory, _read_engine_base
+    base = get_engine(WRITE)
+    if _read_engine is not None and _read_engine_base is base:
+        return _read_engine
+    with _read_engine_lock:
+        if _read_engine is None or _read_engine_base is not base:
+            _read_engine, _ReadSessionFactory = _create_engine(_build_database_url(reader=True), READ)
+            _read_engine_base = base
+    return _read_engine
+
+
+def dispose_engines() -> None:
+    """Close every role's pool and drop the cached engines; the next
+    ``get_engine()`` / ``get_session()`` rebuilds them from the current
+    environment."""
+    global _engine, _SessionFactory, _read_engine, _ReadSessionFactory, _read_engine_base
+    with _read_engine_lock:
+        for engine in (_read_engine, _engine):
+            if engine is not None:
+                engine.dispose()
+        _engine = _SessionFactory = None
+        _read_engine = _ReadSessionFactory = _read_engine_base = None
+
+
+def pool_stats() -> dict[str, dict]:
+    """Per-role pool occupancy and checkout-wait counters for the engines
+    built so far in this process."""
+    stats = {}
+    for role, engine in ((WRITE, _engine), (READ, _read_engine)):
+        if engine is None:
+            continue
+        pool = engine.pool
+        stats[role] = {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            **pool.metrics.snapshot(),
+        }
+    return stats
+
+
 def build_libpq_database_url() -> str:
     """Return the same DB URL ``get_engine()`` uses, in libpq form.
 
@@ -70,16 +297,139 @@ def build_libpq_database_url() -> str:
     return url
 
 
+class StatementDeadline:
+    """Wall-clock budget shared by every ``get_session()`` opened under
+    ``statement_deadline()`` — on any thread that inherited the context.
+
+    Each session transaction begun under it gets ``SET LOCAL
+    statement_timeout`` to the time left, so Postgres itself stops a
+    statement that would outlive the deadline. ``cancel()`` (fired by the
+    deadline's timer) additionally sends a cancel request to every
+    connection still inside such a transaction, so a statement stuck
+    waiting on a lock or I/O is interrupted right at the deadline and its
+    pooled connection comes back instead of staying busy for the abandoned
+    caller. Once expired, no new transaction may start.
+    """
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+        self.cancelled = False
+        self._lock = threading.Lock()
+        # id(session) -> driver connection currently running its transaction
+        self._active: dict[int, psycopg.Connection] = {}
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+    def _expired_error(self) -> TimeoutError:
+        return TimeoutError(f"deadline exceeded after {self.seconds:.1f}s; in-flight statements cancelled")
+
+    def _attach(self, session: Session, connection) -> None:
+        remaining_ms = int(self.remaining() * 1000)
+        with self._lock:
+            if self.cancelled or remaining_ms <= 0:
+                raise self._expired_error()
+            self._active[id(session)] = connection.connection.driver_connection
+        # Bound, not interpolated: one statement text for every remaining_ms,
+        # so it doesn't churn the connection's prepared-statement cache.
+        connection.exec_driver_sql(
+            "SELECT set_config('statement_timeout', %s, true)", (str(remaining_ms),))
+
+    def _detach(self, session: Session) -> None:
+        with self._lock:
+            self._active.pop(id(session), None)
+
+    def cancel(self) -> int:
+        """Expire the deadline and cancel every in-flight statement under it.
+        Returns how many connections were sent a cancel request."""
+        # Held across the cancel requests: a session detaches (and only then
+        # returns its connection to the pool) under the same lock, so a
+        # cancel can never land on a connection another request reused.
+        with self._lock:
+            if self.cancelled:
+                return 0  # already done; nothing can have attached since
+            self.cancelled = True
+            conns = list(self._active.values())
+            for conn in conns:
+                try:
+                    conn.cancel_safe(timeout=2.0)
+                except Exception as exc:  # noqa: BLE001 — best-effort; statement_timeout still applies
+                    logger.warning("statement cancel failed: %s", exc)
+        if conns:
+            logger.warning("STATEMENT_DEADLINE: cancelled %d in-flight statement(s) after %.1fs",
+                           len(conns), self.seconds)
+        return len(conns)
+
+
+_statement_deadline: contextvars.ContextVar[StatementDeadline | None] = contextvars.ContextVar(
+    "statement_deadline", default=None)
+
+
+def current_deadline() -> StatementDeadline | None:
+    """The ``StatementDeadline`` the calling context runs under, if any."""
+    return _statement_deadline.get()
+
+
+@contextmanager
+def statement_deadline(seconds: float | None) -> Iterator[StatementDeadline | None]:
+    """Run the block under a ``StatementDeadline`` of ``seconds`` (None: no-op).
+
+    A timer cancels whatever is still running when the deadline passes, so
+    the block ends promptly with ``TimeoutError`` instead of holding its
+    thread and pooled connection until the slow statement finishes.
+    """
+    if seconds is None:
+        yield None
+        return
+    deadline = StatementDeadline(seconds)
+    timer = threading.Timer(max(0.0, seconds), deadline.cancel)
+    timer.daemon = True
+    timer.start()
+    token = _statement_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _statement_deadline.reset(token)
+        timer.cancel()
+
+
+def _apply_statement_deadline(session: Session, transaction, connection) -> None:
+    deadline = session.info.get("statement_deadline")
+    if deadline is not None:
+        deadline._attach(session, connection)
+
+
 @contextmanager
-def get_session() -> Iterator[Session]:
-    """Yield a SQLAlchemy session and commit on success / rollback on error."""
-    get_engine()  # ensures both _engine and _SessionFactory are initialised
-    assert _SessionFactory is not None
-    sess = _SessionFactory()
+def get_session(role: str = WRITE) -> Iterator[Session]:
+    """Yield a SQLAlchemy session on ``role``'s engine and commit on
+    success / rollback on error.
+
+    Under ``statement_deadline()`` a statement cancelled by the deadline
+    surfaces as ``TimeoutError``.
+    """
+    get_engine(role)  # ensures the role's engine and session factory are initialised
+    factory = _ReadSessionFactory if role == READ else _SessionFactory
+    assert factory is not None
+    sess = factory()
+    deadline = _statement_deadline.get()
+    if deadline is not None:
+        sess.info["statement_deadline"] = deadline
     try:
         yield sess
+        if deadline is not None:
+            deadline._detach(sess)
         sess.commit()
+    except DBAPIError as exc:
+        if deadline is not None:
+            deadline._detach(sess)
+        sess.rollback()
+        if deadline is not None and isinstance(exc.orig, psycopg.errors.QueryCanceled):
+            raise deadline._expired_error() from exc
+        raise
     except Exception:
+        if deadline is not None:
+            deadline._detach(sess)
         sess.rollback()
         raise
     finally:
@@ -26,7 +26,13 @@ from ...config import DEFAULT_EMBEDDING_MODEL, get_logger
 from ...db.session import get_session
 from ...vector_store.vector_store_aurora import (
     _chunk_for_embedding,
+    _chunk_index,
+    _copy_documents,
+    _doc_date,
+    _document_key,
     _get_embedding_client,
+    _touch_contexts,
+    _vector_param,
 )
 
 logger = get_logger(__name__)
@@ -125,16 +131,21 @@ def write_decision(
 
                 result = sess.execute(sql_text(
                     "INSERT INTO documents "
-                    "(context_id, content, content_hash, metadata, embedding, source_id) "
-                    "VALUES (:cid, :c, :h, CAST(:m AS jsonb), CAST(:e AS vector), :sid) "
+                    "(context_id, content, content_hash, metadata, embedding, source_id, "
+                    "doc_date, document_key, chunk_index) "
+                    "VALUES (:cid, :c, :h, CAST(:m AS jsonb), CAST(:e AS vector), :sid, "
+                    ":dd, :dk, :ci) "
                     "ON CONFLICT (context_id, content_hash) DO NOTHING"
                 ), {
                     "cid": context_id,
                     "c": chunk_content,
                     "h": chunk_hash,
                     "m": json.dumps(doc_metadata),
-                    "e": str(embedding),
+                    "e": _vector_param(sess, embedding),
                     "sid": SOURCE_ID,
+                    "dd": _doc_date(doc_metadata),
+                    "dk": _document_key(doc_metadata),
+                    "ci": _chunk_index(doc_metadata),
                 })
                 if result.rowcount and result.rowcount > 0:
                     inserted += 1
@@ -144,6 +155,8 @@ def write_decision(
                     chunk_index + 1, total_chunks, page_id, exc,
                 )
                 continue
+        if inserted:
+            _touch_contexts(sess, [context_id])
 
     return inserted
 
@@ -184,13 +197,14 @@ def write_decisions_batched(
         2. Batch the plan's chunks into groups of ``embedding_batch_size``
            and call ``client.embeddings.create(input=[batch])`` once per
            batch.
-        3. INSERT each chunk row with ``ON CONFLICT (context_id,
-           content_hash) DO NOTHING`` so re-runs over an already-imported
-           Aurora are no-ops.
+        3. Bulk-load each batch's rows with ``_copy_documents`` (binary
+           COPY into a staging table, merged with ``ON CONFLICT
+           (context_id, content_hash) DO NOTHING``) so re-runs over an
+           already-imported Aurora are no-ops.
 
     Returns ``{"chunks_planned": N, "chunks_written": M, "decisions": K}``
-    where ``chunks_written`` reflects ``cursor.rowcount`` summed across
-    INSERTs — i.e., the count AFTER ON CONFLICT filtering.
+    where ``chunks_written`` reflects the merge INSERTs' rowcounts — i.e.,
+    the count AFTER ON CONFLICT filtering.
     """
     if embedding_batch_size <= 0:
         raise ValueError("embedding_batch_size must be positive")
@@ -258,22 +272,11 @@ def write_decisions_batched(
             )
 
         with get_session() as sess:
-            for item, datum in zip(batch, response.data):
-                result = sess.execute(sql_text(
-                    "INSERT INTO documents "
-                    "(context_id, content, content_hash, metadata, embedding, source_id) "
-                    "VALUES (:cid, :c, :h, CAST(:m AS jsonb), CAST(:e AS vector), :sid) "
-                    "ON CONFLICT (context_id, content_hash) DO NOTHING"
-                ), {
-                    "cid": item["context_id"],
-                    "c": item["chunk_content"],
-                    "h": item["content_hash"],
-                    "m": json.dumps(item["metadata"]),
-                    "e": str(datum.embedding),
-                    "sid": SOURCE_ID,
-                })
-                if result.rowcount and result.rowcount > 0:
-                    chunks_written += 1
+            chunks_written += _copy_documents(sess, (
+                (item["context_id"], item["chunk_content"], item["content_hash"],
+                 item["metadata"], datum.embedding, SOURCE_ID)
+                for item, datum in zip(batch, response.data)
+            ))
 
         cumulative += len(batch)
         logger.info(
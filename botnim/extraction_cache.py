@@ -5,14 +5,16 @@ the same raw text share one row — saves cost when content overlap exists
 between contexts (e.g. plenary_schedule vs knesset_protocols citing the
 same Knesset minute).
 
-The class is intentionally thin: get / put / purge. No connection pool of
-its own — reuses :func:`botnim.db.session.get_session` so this module
+The class is intentionally thin: get / put / purge, plus get_many /
+put_many for the sync pipeline, which looks up and writes a whole window of
+documents per round trip. No connection pool of its own — reuses :func:`botnim.db.session.get_session` so this module
 inherits the same env-var convention as every other Aurora caller.
 """
 from __future__ import annotations
 
 import json
-from typing import Any
+from itertools import islice
+from typing import Any, Iterable
 
 from sqlalchemy import text
 
@@ -21,6 +23,17 @@ from .db.session import get_session
 
 logger = get_logger(__name__)
 
+# Hashes per SELECT / rows per upsert in get_many and put_many. A page is
+# one round trip; hundreds keep the bound arrays small while a 30K-document
+# context needs ~60 statements instead of 30K sessions.
+PAGE_SIZE = 500
+
+
+def _pages(items: Iterable, size: int):
+    it = iter(items)
+    while page := list(islice(it, size)):
+        yield page
+
 
 class ExtractionCache:
     """Aurora-backed read-through cache for dynamic_extraction outputs."""
@@ -79,6 +92,33 @@ class ExtractionCache:
             "stale": from_version != current_version,
         }
 
+    def get_many(
+        self, content_hashes: Iterable[str], current_version: str, *, page_size: int = PAGE_SIZE,
+    ) -> dict[str, dict[str, Any]]:
+        """Batched ``get_with_fallback``: ``{content_hash: hit}`` for every
+        hash with a row at any version (misses are absent).
+
+        One session, one SELECT per ``page_size`` hashes. ``DISTINCT ON``
+        keeps the first row per hash under get_with_fallback's ordering —
+        the exact version if present, else the most recent older one.
+        """
+        hits: dict[str, dict[str, Any]] = {}
+        with get_session() as sess:
+            for page in _pages(dict.fromkeys(content_hashes), page_size):
+                rows = sess.execute(text(
+                    "SELECT DISTINCT ON (content_hash) content_hash, payload, extractor_version "
+                    "FROM extraction_cache "
+                    "WHERE content_hash = ANY(CAST(:hs AS text[])) "
+                    "ORDER BY content_hash, (extractor_version = :v) DESC, extracted_at DESC"
+                ), {"hs": page, "v": current_version}).fetchall()
+                for content_hash, payload, from_version in rows:
+                    hits[content_hash] = {
+                        "payload": payload if isinstance(payload, dict) else json.loads(payload),
+                        "from_version": from_version,
+                        "stale": from_version != current_version,
+                    }
+        return hits
+
     def put(
         self,
         content_hash: str,
@@ -107,6 +147,41 @@ class ExtractionCache:
                 "dt": document_type,
             })
 
+    def put_many(
+        self,
+        entries: Iterable[tuple[str, dict[str, Any], str | None]],
+        extractor_version: str,
+        *,
+        bot: str,
+        context: str,
+        page_size: int = PAGE_SIZE,
+    ) -> int:
+        """Batched ``put`` of ``(content_hash, payload, document_type)``
+        entries: one session, one upsert per ``page_size`` rows. A hash
+        repeated within the batch keeps its last payload, as repeated puts
+        would. Returns the number of distinct rows written."""
+        latest = {h: (payload, document_type) for h, payload, document_type in entries}
+        with get_session() as sess:
+            for page in _pages(latest.items(), page_size):
+                sess.execute(text(
+                    "INSERT INTO extraction_cache "
+                    "(content_hash, extractor_version, payload, bot, context, document_type) "
+                    "SELECT h, :v, CAST(p AS jsonb), :b, :c, dt "
+                    "FROM unnest(CAST(:hs AS text[]), CAST(:ps AS text[]), CAST(:dts AS text[])) "
+                    "    AS t(h, p, dt) "
+                    "ON CONFLICT (content_hash, extractor_version) DO UPDATE SET "
+                    "    payload = EXCLUDED.payload, "
+                    "    extracted_at = now()"
+                ), {
+                    "hs": [h for h, _ in page],
+                    "ps": [json.dumps(payload, ensure_ascii=False) for _, (payload, _) in page],
+                    "dts": [document_type for _, (_, document_type) in page],
+                    "v": extractor_version,
+                    "b": bot,
+                    "c": context,
+                })
+        return len(latest)
+
     def purge(
         self,
         bot: str,
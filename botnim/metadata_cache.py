@@ -0,0 +1,181 @@
+"""Local (L1) cache of extraction metadata, keyed by content hash.
+
+Replaces the ``CachedKVFileSQLite`` store ``collect_sources`` used to keep at
+``<repo_root>/cache/metadata.sqlite``. That one committed on its own
+schedule and needed ``SyncConcurrency.cache_lock`` around every write, so
+hundreds of extractions completing together queued on one lock. This store
+is built for the sync pipeline's access pattern instead:
+
+- WAL journal: readers never block on the writer (or on another sync
+  process writing the same file).
+- Lock-free reads on their own connection; entries written but not yet
+  flushed are served from the in-memory buffer, so reads see every write.
+- Batched writes: ``set`` only buffers; every ``flush_every`` entries the
+  buffer goes to sqlite in one transaction (and on ``flush`` / ``close``).
+  An entry lost to a crash before its flush is re-served by the Aurora L2.
+- ``used_at`` per row (refreshed on hits, in the same batches), so
+  ``compact`` can drop what no sync has asked for in a while.
+
+Values are JSON; the table lives next to the legacy KVFile table ``d`` in
+the same file until ``compact`` drops that.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from .config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_FLUSH_EVERY = 256
+# How long a connection waits for another process's write transaction.
+_BUSY_TIMEOUT_SECONDS = 30.0
+
+
+class MetadataCache:
+    """WAL-mode sqlite key/value store with buffered writes and hit metrics."""
+
+    def __init__(self, path: str | Path, flush_every: int = DEFAULT_FLUSH_EVERY) -> None:
+        self.path = Path(path)
+        self.flush_every = max(1, flush_every)
+        self._writer = self._connect()
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        self._writer.execute("PRAGMA synchronous=NORMAL")
+        self._writer.execute(
+            "CREATE TABLE IF NOT EXISTS metadata_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, used_at REAL NOT NULL)"
+        )
+        self._reader = self._connect()
+        # Guards the write buffers and the writer connection; reads never
+        # take it.
+        self._lock = threading.Lock()
+        self._pending: dict[str, str] = {}
+        # The batch being written: still served from memory until committed.
+        self._flushing: dict[str, str] = {}
+        self._touched: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.flushes = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit: flush opens its own transaction; VACUUM needs none open.
+        return sqlite3.connect(
+            self.path, timeout=_BUSY_TIMEOUT_SECONDS, isolation_level=None, check_same_thread=False,
+        )
+
+    def _read(self, key: str) -> str | None:
+        raw = self._pending.get(key) or self._flushing.get(key)
+        if raw is None:
+            row = self._reader.execute("SELECT value FROM metadata_cache WHERE key = ?", (key,)).fetchone()
+            raw = row[0] if row else None
+        return raw
+
+    def get(self, key: str, default: Any = None) -> Any:
+        raw = self._read(key)
+        if raw is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touched.add(key)
+        return json.loads(raw)
+
+    def peek(self, key: str, default: Any = None) -> Any:
+        """``get`` that isn't counted in the metrics or ``used_at``."""
+        raw = self._read(key)
+        return default if raw is None else json.loads(raw)
+
+    def set(self, key: str, value: Any) -> None:
+        raw = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._pending[key] = raw
+            self.writes += 1
+            due = len(self._pending) >= self.flush_every
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered entries and hit timestamps in one transaction."""
+        with self._lock:
+            if not self._pending and not self._touched:
+                return
+            pending, self._pending = self._pending, {}
+            touched, self._touched = self._touched - pending.keys(), set()
+            self._flushing = pending
+            now = time.time()
+            self._writer.execute("BEGIN IMMEDIATE")
+            try:
+                self._writer.executemany(
+                    "INSERT OR REPLACE INTO metadata_cache (key, value, used_at) VALUES (?, ?, ?)",
+                    [(k, v, now) for k, v in pending.items()],
+                )
+                self._writer.executemany(
+                    "UPDATE metadata_cache SET used_at = ? WHERE key = ?",
+                    [(now, k) for k in touched],
+                )
+                self._writer.execute("COMMIT")
+            except BaseException:
+                self._writer.execute("ROLLBACK")
+                raise
+            finally:
+                self._flushing = {}
+            self.flushes += 1
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._reader.close()
+            self._writer.close()
+
+    def size_bytes(self) -> int:
+        """The database file plus its WAL."""
+        return sum(
+            p.stat().st_size for p in (self.path, Path(f"{self.path}-wal")) if p.exists()
+        )
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": self._reader.execute("SELECT count(*) FROM metadata_cache").fetchone()[0],
+            "bytes": self.size_bytes(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "writes": self.writes,
+            "flushes": self.flushes,
+            "pending": len(self._pending),
+        }
+
+    def compact(self, max_age_days: float | None = None) -> dict[str, Any]:
+        """Drop entries unused for ``max_age_days`` (all kept when None) and
+        the legacy KVFile table, then checkpoint the WAL and VACUUM."""
+        self.flush()
+        bytes_before = self.size_bytes()
+        with self._lock:
+            removed = 0
+            if max_age_days is not None:
+                cutoff = time.time() - max_age_days * 86400
+                removed = self._writer.execute(
+                    "DELETE FROM metadata_cache WHERE used_at < ?", (cutoff,)
+                ).rowcount
+            legacy = self._writer.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'd'"
+            ).fetchone() is not None
+            if legacy:
+                self._writer.execute("DROP TABLE d")
+            self._writer.execute("VACUUM")
+            self._writer.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        result = {
+            "removed": removed,
+            "legacy_table_dropped": legacy,
+            "bytes_before": bytes_before,
+            "bytes_after": self.size_bytes(),
+        }
+        logger.info("Compacted %s: %s", self.path, result)
+        return result
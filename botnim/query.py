@@ -1,10 +1,15 @@
 import os
+import threading
+import time
 from pathlib import Path
 from typing import List, Dict, Union, Optional, Any
 from dataclasses import dataclass
 from botnim.vector_store.vector_store_es import VectorStoreES
-from botnim.vector_store.vector_store_aurora import VectorStoreAurora
+from botnim.vector_store.vector_store_aurora import VectorStoreAurora, context_id_cache_stats, law_catalog_stats
+from botnim.db.session import pool_stats, statement_deadline
 from botnim.config import DEFAULT_EMBEDDING_MODEL, DEFAULT_ENVIRONMENT, get_logger, SPECS, is_production
+from botnim.query_embedding_cache import embed_query, get_query_embedding_cache
+from botnim.retrieve_cache import get_retrieve_cache
 from botnim.vector_store.search_config import SearchModeConfig
 from botnim.vector_store.search_modes import SEARCH_MODES, DEFAULT_SEARCH_MODE
 import yaml
@@ -219,18 +224,14 @@ class QueryClient:
             List[SearchResult]: List of search results with enhanced explanations
         """
         try:
-            # Use num_results from the search mode config if not provided
-            if num_results is None:
-                num_results = search_mode.num_results
-            if num_results is None:
-                num_results = self.context_config.get('default_num_results', DEFAULT_NUM_RESULTS)
-
-            # Get embedding using the vector store's OpenAI client
-            response = self.vector_store.openai_client.embeddings.create(
-                input=query_text,
-                model=DEFAULT_EMBEDDING_MODEL,
+            num_results = self._resolve_num_results(num_results, search_mode)
+
+            # Get embedding using the vector store's OpenAI client. Repeated
+            # query text (multi-context fan-out, retries) is served from the
+            # process-wide query-embedding cache.
+            embedding = embed_query(
+                self.vector_store.openai_client, query_text, model=DEFAULT_EMBEDDING_MODEL,
             )
-            embedding = response.data[0].embedding
 
             # Execute search with explanations
             results = self.vector_store.search(
@@ -240,26 +241,37 @@ class QueryClient:
                 explain=explain,
                 metadata_filter=metadata_filter,
             )
-            
-            # Format results with enhanced explanations
-            # For METADATA_BROWSE mode, we'll format differently in the format_search_results function
-            return [
-                SearchResult(
-                    score=hit['_score'],
-                    id=hit['_id'],
-                    content=_scrub_fabricated_urls(hit['_source']['content']).strip().split('\n')[0],
-                    full_content=_scrub_fabricated_urls(hit['_source']['content']) if search_mode.name not in ("METADATA_BROWSE", "RECENCY_BROWSE") else None,
-                    metadata=_scrub_fabricated_urls_in_metadata(hit['_source'].get('metadata', None)),
-                    _explanation=hit.get('_explanation', None) if explain else None,
-                    context_name=self.context_name
-                )
-                for hit in results['hits']['hits']
-            ]
-            
+            return self._to_search_results(results, search_mode, explain)
+
         except Exception as e:
             logger.error(f"Search failed: {str(e)}")
             raise
 
+    def _resolve_num_results(self, num_results: int | None, search_mode: SearchModeConfig) -> int:
+        """Explicit value, else the search mode's, else the context default."""
+        if num_results is None:
+            num_results = search_mode.num_results
+        if num_results is None:
+            num_results = self.context_config.get('default_num_results', DEFAULT_NUM_RESULTS)
+        return num_results
+
+    def _to_search_results(self, results: dict, search_mode: SearchModeConfig, explain: bool) -> List[SearchResult]:
+        """Convert a backend ``{"hits": {"hits": [...]}}`` payload to SearchResults."""
+        # Format results with enhanced explanations
+        # For METADATA_BROWSE mode, we'll format differently in the format_search_results function
+        return [
+            SearchResult(
+                score=hit['_score'],
+                id=hit['_id'],
+                content=_scrub_fabricated_urls(hit['_source']['content']).strip().split('\n')[0],
+                full_content=_scrub_fabricated_urls(hit['_source']['content']) if search_mode.name not in ("METADATA_BROWSE", "RECENCY_BROWSE") else None,
+                metadata=_scrub_fabricated_urls_in_metadata(hit['_source'].get('metadata', None)),
+                _explanation=hit.get('_explanation', None) if explain else None,
+                context_name=self.context_name
+            )
+            for hit in results['hits']['hits']
+        ]
+
     def get_index_mapping(self) -> Dict:
         """Get the schema for the current context.
 
@@ -285,7 +297,144 @@ class QueryClient:
             logger.error(f"Failed to get index mapping: {str(e)}")
             raise
 
-def run_query(*, store_id: str, query_text: str, num_results: int=DEFAULT_NUM_RESULTS, format: str='dict', explain: bool=False, search_mode: SearchModeConfig = DEFAULT_SEARCH_MODE, metadata_filter: dict | None = None) -> Union[List[Dict], str]:
+
+def _config_mtime(bot_name: str) -> float | None:
+    """mtime of ``specs/<bot>/config.yaml``, or None when it doesn't exist
+    (QueryClient falls back to a default config in that case)."""
+    try:
+        return (SPECS / bot_name / 'config.yaml').stat().st_mtime
+    except OSError:
+        return None
+
+
+class _QueryClientPool:
+    """Process-wide registry of ready QueryClients for the retrieve path.
+
+    Building a QueryClient re-parses ``specs/<bot>/config.yaml``, constructs
+    a fresh OpenAI client and a new vector store — pure overhead repeated on
+    every /retrieve tool call. The pool keeps one client per
+    (bot, context, environment) and hands it back on subsequent calls.
+
+    Config edits are still picked up without a restart: every lookup stats
+    the bot's config.yaml (one syscall) and rebuilds the client when the
+    mtime moved.
+
+    Thread-safety: /retrieve runs ``run_query`` in worker threads. Lookups
+    and counters share one lock that is never held while a client is
+    built; construction runs under a per-key lock instead, so a cold or
+    reloading store_id doesn't stall lookups of the others, and concurrent
+    misses on the same key build it once.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # key -> (client, config mtime)
+        self._clients: dict[tuple[str, str, str], tuple[Any, float | None]] = {}
+        self._build_locks: dict[tuple[str, str, str], threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.construction_ms_total = 0.0
+        self.construction_ms_last = 0.0
+
+    def _cached(self, key: tuple[str, str, str], mtime: float | None) -> Any:
+        """The pooled client for ``key`` if still current, counting the hit.
+        Call with ``self._lock`` held."""
+        cached = self._clients.get(key)
+        if cached is not None and cached[1] == mtime:
+            self.hits += 1
+            return cached[0]
+        return None
+
+    def get(self, store_id: str) -> "QueryClient":
+        key = parse_store_id(store_id)
+        mtime = _config_mtime(key[0])
+        with self._lock:
+            client = self._cached(key, mtime)
+            if client is not None:
+                return client
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+        with build_lock:
+            with self._lock:
+                # Built by another thread while this one waited for build_lock.
+                client = self._cached(key, mtime)
+                if client is not None:
+                    return client
+                if key in self._clients:
+                    self.reloads += 1
+                    logger.info("query client pool: rebuilding %s (config changed)", store_id)
+                self.misses += 1
+            started = time.perf_counter()
+            client = QueryClient(store_id)
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            with self._lock:
+                self.construction_ms_total += elapsed_ms
+                self.construction_ms_last = elapsed_ms
+                self._clients[key] = (client, mtime)
+        logger.info("query client pool: built %s in %.1fms", store_id, elapsed_ms)
+        return client
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            avg_ms = self.construction_ms_total / self.misses if self.misses else 0.0
+            return {
+                "size": len(self._clients),
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "construction_ms_total": round(self.construction_ms_total, 1),
+                "construction_ms_last": round(self.construction_ms_last, 1),
+                # Every hit skipped one construction; the mean construction
+                # cost is the best estimate of what each skip saved.
+                "saved_ms_estimate": round(self.hits * avg_ms, 1),
+            }
+
+
+_query_client_pool = _QueryClientPool()
+
+
+def get_query_client(store_id: str) -> "QueryClient":
+    """Return the pooled QueryClient for ``store_id`` (building it on first use)."""
+    return _query_client_pool.get(store_id)
+
+
+def query_client_pool_stats() -> Dict[str, Any]:
+    """Hit/miss and construction-time counters for the QueryClient pool."""
+    return _query_client_pool.stats()
+
+
+def query_embedding_cache_stats() -> Dict[str, Any]:
+    """Hit/miss, size and saved-latency counters for the query-embedding cache."""
+    return get_query_embedding_cache().stats()
+
+
+def context_id_stats() -> Dict[str, Any]:
+    """Hit/miss counters for the Aurora context-id cache."""
+    return context_id_cache_stats()
+
+
+def law_name_catalog_stats() -> Dict[str, Any]:
+    """Hit/recheck/load counters for the in-process law-name index."""
+    return law_catalog_stats()
+
+
+def retrieve_cache_stats() -> Dict[str, Any]:
+    """Hit/miss/bypass counters for the retrieve result cache."""
+    return get_retrieve_cache().stats()
+
+
+def db_pool_stats() -> Dict[str, Any]:
+    """Occupancy and checkout-wait counters per DB engine role (read/write)."""
+    return pool_stats()
+
+
+def run_query(*, store_id: str, query_text: str, num_results: int=DEFAULT_NUM_RESULTS, format: str='dict', explain: bool=False, search_mode: SearchModeConfig = DEFAULT_SEARCH_MODE, metadata_filter: dict | None = None, deadline_seconds: float | None = None) -> Union[List[Dict], str]:
     """
     Run a query against the vector store
 
@@ -298,23 +447,112 @@ def run_query(*, store_id: str, query_text: str, num_results: int=DEFAULT_NUM_RE
         search_mode (SearchModeConfig): Search mode configuration (required for custom modes)
         metadata_filter (dict | None): Optional JSONB containment filter
             forwarded to the underlying vector store search.
+        deadline_seconds (float | None): Overall budget. Database statements
+            still running when it expires are cancelled and the call raises
+            TimeoutError (see botnim.db.session.statement_deadline).
 
     Returns:
         Union[List[Dict], str]: Search results in the requested format
     """
     logger.info(f"Running vector search with query: {query_text}, store_id: {store_id}, num_results: {num_results}, format: {format}, search_mode: {search_mode.name if search_mode else None}")
 
-    client = QueryClient(store_id)
-    results = client.search(query_text=query_text, num_results=num_results, explain=explain, search_mode=search_mode, metadata_filter=metadata_filter)
+    def _run():
+        client = get_query_client(store_id)
+        results = client.search(query_text=query_text, num_results=num_results, explain=explain, search_mode=search_mode, metadata_filter=metadata_filter)
+
+        # Log the results
+        logger.info(f"Search results: {results}")
+
+        # Format results if requested
+        formatted_results = format_search_results(results, format, explain, search_mode)
+        if format.startswith('text') or format == 'yaml':
+            logger.info(f"Formatted results: {formatted_results}")
+        return formatted_results
+
+    # Repeated identical calls are served from the retrieve cache until the
+    # context's corpus version moves (see botnim.retrieve_cache).
+    bot, context, _ = parse_store_id(store_id)
+    params = {
+        "query_text": query_text, "num_results": num_results, "format": format,
+        "search_mode": search_mode, "metadata_filter": metadata_filter,
+    }
+    with statement_deadline(deadline_seconds):
+        return get_retrieve_cache().get_or_run(bot, context, params, _run, bypass=explain)
 
-    # Log the results
-    logger.info(f"Search results: {results}")
 
-    # Format results if requested
-    formatted_results = format_search_results(results, format, explain, search_mode)
-    if format.startswith('text') or format == 'yaml':
-        logger.info(f"Formatted results: {formatted_results}")
-    return formatted_results
+def run_query_many(*, bot: str, query_text: str, contexts: List[Dict[str, Any]], format: str='dict', deadline_seconds: float | None = None) -> List[Dict[str, Any]]:
+    """
+    Run one query against several contexts of ``bot`` in a single call
+
+    The query is embedded once and the per-context searches run concurrently
+    (``VectorStoreAurora.search_many``), so the whole fan-out costs one
+    embedding round-trip and roughly the latency of the slowest context.
+
+    Args:
+        bot (str): Bot slug, e.g. 'unified'
+        query_text (str): The text to search for
+        contexts (List[Dict]): One entry per context:
+            ``{"context": str, "search_mode": SearchModeConfig | None,
+            "num_results": int | None, "metadata_filter": dict | None}``
+        format (str): Format of each block's results ('dict', 'text', 'text-short', 'yaml')
+        deadline_seconds (float | None): Overall budget. Contexts still running
+            when it expires come back with status 'timeout'; the rest are kept.
+
+    Returns:
+        List[Dict]: One block per requested context, in request order —
+        ``{"context", "search_mode", "status": "ok", "results"}`` or
+        ``{"context", "search_mode", "status": "timeout" | "error", "detail"}``
+    """
+    deadline = time.monotonic() + deadline_seconds if deadline_seconds is not None else None
+    logger.info(f"Running multi-context search with query: {query_text}, bot: {bot}, contexts: {[c['context'] for c in contexts]}, format: {format}")
+
+    clients, requests = [], []
+    for spec in contexts:
+        client = get_query_client(f"{bot}__{spec['context']}")
+        mode = spec.get('search_mode') or DEFAULT_SEARCH_MODE
+        clients.append(client)
+        requests.append({
+            "context_name": client.context_name,
+            "search_mode": mode,
+            "num_results": client._resolve_num_results(spec.get('num_results'), mode),
+            "metadata_filter": spec.get('metadata_filter'),
+        })
+    if not clients:
+        return []
+
+    vector_store = clients[0].vector_store
+    # Under the request deadline, so a wait on another request's in-flight
+    # embedding of this text can't outlast it (see query_embedding_cache).
+    with statement_deadline(max(0.0, deadline - time.monotonic()) if deadline is not None else None):
+        embedding = embed_query(vector_store.openai_client, query_text, model=DEFAULT_EMBEDDING_MODEL)
+
+    if isinstance(vector_store, VectorStoreAurora):
+        remaining = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+        raw_blocks = vector_store.search_many(query_text, embedding, requests, timeout=remaining)
+    else:
+        # ES (parity backend only): no shared-pool fan-out, run in order.
+        raw_blocks = []
+        for client, r in zip(clients, requests):
+            try:
+                result = client.vector_store.search(
+                    r["context_name"], query_text, r["search_mode"], embedding,
+                    num_results=r["num_results"], metadata_filter=r["metadata_filter"],
+                )
+                raw_blocks.append({"context_name": r["context_name"], "status": "ok", "result": result})
+            except Exception as e:
+                logger.error(f"Search failed for context {r['context_name']}: {e}")
+                raw_blocks.append({"context_name": r["context_name"], "status": "error", "detail": str(e)})
+
+    blocks = []
+    for client, r, raw in zip(clients, requests, raw_blocks):
+        block = {"context": r["context_name"], "search_mode": r["search_mode"].name, "status": raw["status"]}
+        if raw["status"] == "ok":
+            results = client._to_search_results(raw["result"], r["search_mode"], False)
+            block["results"] = format_search_results(results, format, False, r["search_mode"])
+        else:
+            block["detail"] = raw["detail"]
+        blocks.append(block)
+    return blocks
 
 
 def government_distribution_sidecar(
@@ -333,7 +571,7 @@ def government_distribution_sidecar(
         decision_number: the bare decision number string, e.g. "550"
     """
     try:
-        client = QueryClient(store_id)
+        client = get_query_client(store_id)
         if not isinstance(client.vector_store, VectorStoreAurora):
             logger.debug(
                 "government_distribution_sidecar: backend is not Aurora, skipping"
@@ -0,0 +1,287 @@
+"""In-process cache of query-text → embedding vectors for the retrieve path.
+
+The LLM fans the same question out to several contexts (israeli_laws,
+legal_advisor_opinions, ...) and re-asks it verbatim after a 504, so
+``QueryClient.search`` used to pay one ``embeddings.create`` round-trip per
+tool call for text it had just embedded. This module makes that one
+round-trip per distinct query text:
+
+- L1: a byte-bounded LRU with a TTL, per process. Vectors are stored as
+  ``array('f')`` (the API returns float32 values, so this is lossless and
+  ~8× smaller than a list of Python floats).
+- L2 (optional, ``BOTNIM_QUERY_EMBEDDING_CACHE_SHARED=1``): the
+  ``query_embedding_cache`` table (alembic 0020), shared by every API task.
+  Failures there are logged and fall through to OpenAI — the shared tier
+  must never fail a retrieve.
+  Writes go through a one-thread background executor, so the upsert never
+  adds a round-trip to the request that paid for the embedding.
+- Single-flight: concurrent callers asking for the same text while it is
+  being embedded wait for the first caller instead of issuing duplicate
+  calls (parallel tool calls for one question land at the same instant).
+  The wait is bounded by the caller's remaining request deadline
+  (``botnim.db.session.statement_deadline``) as well as by
+  ``_SINGLE_FLIGHT_WAIT_SECONDS``.
+
+Key is ``(model, sha256(query_text))`` — the exact text, no normalisation,
+because the embedding itself is whitespace/case-sensitive.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from pgvector.psycopg import Vector
+from sqlalchemy import text
+
+from .config import DEFAULT_EMBEDDING_MODEL, get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024   # ~10K 1536-dim float32 vectors
+DEFAULT_TTL_SECONDS = 24 * 3600
+# Upper bound on how long a follower waits for the in-flight leader before
+# embedding on its own, for callers without a request deadline (a caller
+# under statement_deadline() waits at most until that deadline).
+_SINGLE_FLIGHT_WAIT_SECONDS = 10.0
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning("%s=%r is not an int; falling back to %d", name, raw, default)
+        return default
+
+
+def _query_hash(query_text: str) -> str:
+    return hashlib.sha256(query_text.encode("utf-8")).hexdigest()
+
+
+class QueryEmbeddingCache:
+    """Byte-bounded LRU + TTL of query embeddings, optionally backed by Postgres."""
+
+    def __init__(
+        self,
+        max_bytes: int | None = None,
+        ttl_seconds: int | None = None,
+        shared: bool | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_bytes = max_bytes if max_bytes is not None else _env_int(
+            "BOTNIM_QUERY_EMBEDDING_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else _env_int(
+            "BOTNIM_QUERY_EMBEDDING_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)
+        if shared is None:
+            shared = os.environ.get("BOTNIM_QUERY_EMBEDDING_CACHE_SHARED", "").lower() in ("1", "true", "yes")
+        self.shared = shared
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (vector, stored_at)
+        self._entries: OrderedDict[tuple[str, str], tuple[array, float]] = OrderedDict()
+        self._inflight: dict[tuple[str, str], threading.Event] = {}
+        # Shared-tier upserts, off the request path. One worker: writes are
+        # small and rare (one per miss), and it keeps them in order.
+        self._shared_writer: ThreadPoolExecutor | None = None
+        if shared:
+            self._shared_writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="query_embedding_cache")
+        self.bytes = 0
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.embed_ms_total = 0.0
+
+    # ---- L1 ---------------------------------------------------------------
+
+    def _get_local(self, key: tuple[str, str]) -> array | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        vec, stored_at = entry
+        if self.ttl_seconds and self._clock() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            self.bytes -= vec.itemsize * len(vec)
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return vec
+
+    def _put_local(self, key: tuple[str, str], vec: array) -> None:
+        size = vec.itemsize * len(vec)
+        if size > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old[0].itemsize * len(old[0])
+        self._entries[key] = (vec, self._clock())
+        self.bytes += size
+        while self.bytes > self.max_bytes and self._entries:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self.bytes -= evicted.itemsize * len(evicted)
+            self.evictions += 1
+
+    # ---- L2 ---------------------------------------------------------------
+
+    def _get_shared(self, key: tuple[str, str]) -> array | None:
+        from .db.session import READ, get_session
+        try:
+            with get_session(READ) as sess:
+                row = sess.execute(text(
+                    "SELECT embedding FROM query_embedding_cache "
+                    "WHERE query_hash = :h AND model = :m "
+                    "AND created_at > now() - make_interval(secs => :ttl)"
+                ), {"h": key[1], "m": key[0], "ttl": self.ttl_seconds or 10 ** 9}).fetchone()
+        except Exception as exc:  # noqa: BLE001 — shared tier is best-effort
+            logger.warning("query embedding cache: shared lookup failed: %s", exc)
+            return None
+        if row is None:
+            return None
+        # pgvector's binary loader hands back a native float32 ndarray.
+        return array("f", row[0].tobytes())
+
+    def _put_shared(self, key: tuple[str, str], vec: array) -> None:
+        from .db.session import get_session
+        try:
+            with get_session() as sess:
+                sess.execute(text(
+                    "INSERT INTO query_embedding_cache (query_hash, model, embedding) "
+                    "VALUES (:h, :m, CAST(:e AS vector)) "
+                    "ON CONFLICT (query_hash, model) DO UPDATE SET "
+                    "    embedding = EXCLUDED.embedding, created_at = now()"
+                ), {"h": key[1], "m": key[0], "e": Vector(vec)})
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("query embedding cache: shared write failed: %s", exc)
+
+    # ---- public -----------------------------------------------------------
+
+    def get_or_embed(
+        self,
+        query_text: str,
+        embed_fn: Callable[[str], list[float]],
+        model: str = DEFAULT_EMBEDDING_MODEL,
+    ) -> list[float]:
+        """Return the embedding for ``query_text``, calling ``embed_fn`` only
+        when neither tier has it and no other thread is already embedding it."""
+        key = (model, _query_hash(query_text))
+        leader = None
+        while True:
+            with self._lock:
+                vec = self._get_local(key)
+                if vec is not None:
+                    self.hits += 1
+                    return vec.tolist()
+                waiter = self._inflight.get(key)
+                if waiter is None:
+                    leader = threading.Event()
+                    self._inflight[key] = leader
+                    break
+            # Another thread is embedding this exact text — wait for it, then
+            # re-check L1. If the leader failed (nothing cached), the next
+            # loop iteration elects this thread as the new leader. If it is
+            # still running after the wait, embed without it: the slot stays
+            # the leader's, so a hung leader costs each follower one wait.
+            # The wait never outlasts the caller's request deadline; a
+            # follower whose deadline ran out gives up instead of embedding
+            # for a request that has already timed out.
+            from .db.session import current_deadline
+            deadline = current_deadline()
+            remaining = deadline.remaining() if deadline is not None else None
+            wait_seconds = _SINGLE_FLIGHT_WAIT_SECONDS
+            if remaining is not None and remaining < wait_seconds:
+                wait_seconds = max(0.0, remaining)
+            if not waiter.wait(wait_seconds):
+                if wait_seconds < _SINGLE_FLIGHT_WAIT_SECONDS:
+                    raise TimeoutError(
+                        f"deadline exceeded after {deadline.seconds:.1f}s waiting for an in-flight query embedding")
+                logger.warning(
+                    "query embedding cache: in-flight embed still running after %.1fs; embedding directly",
+                    wait_seconds,
+                )
+                break
+
+        try:
+            if self.shared:
+                vec = self._get_shared(key)
+                if vec is not None:
+                    with self._lock:
+                        self.shared_hits += 1
+                        self._put_local(key, vec)
+                    return vec.tolist()
+            started = time.perf_counter()
+            embedding = embed_fn(query_text)
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            vec = array("f", embedding)
+            with self._lock:
+                self.misses += 1
+                self.embed_ms_total += elapsed_ms
+                self._put_local(key, vec)
+            if self._shared_writer is not None:
+                self._shared_writer.submit(self._put_shared, key, vec)
+            return list(embedding)
+        finally:
+            if leader is not None:
+                with self._lock:
+                    self._inflight.pop(key, None)
+                leader.set()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            served = self.hits + self.shared_hits
+            lookups = served + self.misses
+            avg_ms = self.embed_ms_total / self.misses if self.misses else 0.0
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "shared": self.shared,
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_ratio": round(served / lookups, 4) if lookups else 0.0,
+                "embed_ms_avg": round(avg_ms, 1),
+                # Each served lookup skipped one embeddings.create round-trip;
+                # the mean observed miss latency is what it would have cost.
+                "saved_ms_estimate": round(served * avg_ms, 1),
+            }
+
+
+_cache: QueryEmbeddingCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_query_embedding_cache() -> QueryEmbeddingCache:
+    """Process-wide cache instance (env-configured on first use)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = QueryEmbeddingCache()
+    return _cache
+
+
+def embed_query(openai_client, query_text: str, model: str = DEFAULT_EMBEDDING_MODEL) -> list[float]:
+    """Embed ``query_text`` with ``openai_client``, served from the cache when possible."""
+    def _embed(q: str) -> list[float]:
+        response = openai_client.embeddings.create(input=q, model=model)
+        return response.data[0].embedding
+
+    return get_query_embedding_cache().get_or_embed(query_text, _embed, model=model)
@@ -0,0 +1,214 @@
+"""In-process cache of formatted ``run_query`` results for the retrieve path.
+
+Identical retrieve calls recur constantly: sanity runs and benchmarks replay
+fixed query sets, "regenerate answer" re-issues the previous tool calls, and
+the LLM re-asks the same (context, query) after a 504. Each of those used to
+pay the full hybrid search again for an answer that had not changed.
+
+Entries are keyed on the request tuple — store id, query text, search mode,
+num_results, format, metadata filter — plus the context's *corpus version*,
+built from two signals read in one round-trip:
+- the newest ``context_snapshots`` aggregate row (``source_id='*'``) for the
+  (bot, context), which ``sync_agents`` writes at the end of every
+  successful sync;
+- ``contexts.updated_at``, which every committed change to the context's
+  documents bumps in the same transaction (each upload_files window, each
+  gov.il decision write — see vector_store_aurora._touch_contexts). A sync
+  commits window by window, so without it a cached answer would be served
+  for the whole of a long sync that had already changed the documents.
+
+Staleness is bounded, not zero: the version is re-read at most every
+``BOTNIM_RETRIEVE_CACHE_VERSION_RECHECK_SECONDS`` (two one-row index
+lookups), so an answer can outlive a committed write by up to that long.
+``sync_agents`` drops this process's versions at the end of a sync, so the
+post-sync answer is immediate there. When the
+version can't be read (no DB, table missing) the request bypasses the cache.
+``explain`` requests always bypass: their output carries scoring detail that
+callers ask for precisely because they want a fresh run.
+"""
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from sqlalchemy import text
+
+from .config import get_logger
+from .query_embedding_cache import _env_int
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_VERSION_RECHECK_SECONDS = 5
+
+
+def _request_hash(params: dict[str, Any]) -> str:
+    raw = json.dumps(params, sort_keys=True, ensure_ascii=False, default=repr)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class RetrieveCache:
+    """Entry-bounded LRU + TTL of formatted retrieve results, keyed on corpus version."""
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        ttl_seconds: int | None = None,
+        version_recheck_seconds: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries if max_entries is not None else _env_int(
+            "BOTNIM_RETRIEVE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else _env_int(
+            "BOTNIM_RETRIEVE_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)
+        self.version_recheck_seconds = (
+            version_recheck_seconds if version_recheck_seconds is not None else _env_int(
+                "BOTNIM_RETRIEVE_CACHE_VERSION_RECHECK_SECONDS", DEFAULT_VERSION_RECHECK_SECONDS))
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (bot, context, version, request_hash) -> (result, stored_at)
+        self._entries: OrderedDict[tuple[str, str, str, str], tuple[Any, float]] = OrderedDict()
+        # (bot, context) -> (version, checked_at)
+        self._versions: dict[tuple[str, str], tuple[str, float]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.version_lookups = 0
+
+    # ---- corpus version ---------------------------------------------------
+
+    def _read_version(self, bot: str, context: str) -> str:
+        from .db.session import READ, get_session
+        with get_session(READ) as sess:
+            row = sess.execute(text(
+                "SELECT (SELECT max(snapshot_at) FROM context_snapshots "
+                "        WHERE bot = :bot AND context = :context AND source_id = '*'), "
+                "       (SELECT updated_at FROM contexts WHERE bot = :bot AND name = :context)"
+            ), {"bot": bot, "context": context}).one()
+        return "/".join(value.isoformat() if value is not None else "none" for value in row)
+
+    def corpus_version(self, bot: str, context: str) -> str | None:
+        """Current corpus version of (bot, context), or None when it can't be read."""
+        now = self._clock()
+        with self._lock:
+            entry = self._versions.get((bot, context))
+            if entry is not None and now - entry[1] < self.version_recheck_seconds:
+                return entry[0]
+        try:
+            version = self._read_version(bot, context)
+        except Exception as exc:  # noqa: BLE001 — the cache must never fail a retrieve
+            logger.warning("retrieve cache: corpus version lookup failed for %s/%s: %s", bot, context, exc)
+            return None
+        with self._lock:
+            self.version_lookups += 1
+            self._versions[(bot, context)] = (version, now)
+        return version
+
+    def forget_versions(self, bot: str | None = None) -> None:
+        """Re-read corpus versions (all bots, or one) on the next request."""
+        with self._lock:
+            if bot is None:
+                self._versions.clear()
+            else:
+                for key in [k for k in self._versions if k[0] == bot]:
+                    del self._versions[key]
+
+    # ---- entries ----------------------------------------------------------
+
+    def _get(self, key: tuple[str, str, str, str]) -> tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        result, stored_at = entry
+        if self.ttl_seconds and self._clock() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            self.expirations += 1
+            return False, None
+        self._entries.move_to_end(key)
+        return True, result
+
+    def _put(self, key: tuple[str, str, str, str], result: Any) -> None:
+        self._entries[key] = (result, self._clock())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    # ---- public -----------------------------------------------------------
+
+    def get_or_run(
+        self,
+        bot: str,
+        context: str,
+        params: dict[str, Any],
+        run: Callable[[], Any],
+        bypass: bool = False,
+    ) -> Any:
+        """Return the cached result for ``params`` against the current corpus
+        of (bot, context), calling ``run`` on a miss. ``bypass`` (and an
+        unreadable corpus version) runs without reading or writing the cache."""
+        version = None
+        if not bypass and self.max_entries > 0:
+            version = self.corpus_version(bot, context)
+        if version is None:
+            with self._lock:
+                self.bypasses += 1
+            return run()
+
+        key = (bot, context, version, _request_hash(params))
+        with self._lock:
+            found, result = self._get(key)
+            if found:
+                self.hits += 1
+        if found:
+            # dict-format results are lists of dicts the caller may mutate.
+            return result if isinstance(result, str) else copy.deepcopy(result)
+
+        result = run()
+        with self._lock:
+            self.misses += 1
+            self._put(key, result if isinstance(result, str) else copy.deepcopy(result))
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "bypasses": self.bypasses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "version_lookups": self.version_lookups,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_cache: RetrieveCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_retrieve_cache() -> RetrieveCache:
+    """Process-wide cache instance (env-configured on first use)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = RetrieveCache()
+    return _cache
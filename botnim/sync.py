@@ -29,7 +29,9 @@ import yaml
 from .bot_config import BotConfig, load_bot_config, publish_bot_config
 from .config import SPECS, get_logger, get_openai_client, is_production
 from .db.session import get_engine as _db_get_engine
+from .retrieve_cache import get_retrieve_cache
 from .vector_store import VectorStoreES, VectorStoreOpenAI, VectorStoreAurora
+from .vector_store.vector_store_aurora import invalidate_context_ids, invalidate_law_catalog
 
 logger = get_logger(__name__)
 
@@ -225,8 +227,16 @@ def sync_agents(environment: str, bots: str, backend: str = 'aurora',
         # Inside the bot loop so a multi-bot future writes one snapshot per bot;
         # any exception above this line skips the snapshot, which is the point.
         _write_snapshots(bot_id)
+        # The new snapshot rows bump every context's corpus version; make this
+        # process's retrieve cache notice now rather than at its next recheck.
+        get_retrieve_cache().forget_versions(bot_id)
 
     # Keep the distinct-law-name catalog (used by resolution + query-side detection)
     # current with the documents just synced. Best-effort; aurora only.
     if backend == "aurora":
         _refresh_law_name_catalog()
+        # Contexts may have been (re)created by this run; let the retrieve
+        # path re-read their ids instead of trusting the in-process cache.
+        invalidate_context_ids()
+        # Likewise the in-process law-name index built from the matview just refreshed.
+        invalidate_law_catalog()
@@ -14,6 +14,31 @@ def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
     logger.debug(f"Calculated cosine similarity: {similarity:.4f}")
     return similarity
 
+def cosine_similarities(query_vector: List[float], vectors: Any) -> np.ndarray:
+    """Cosine similarity of the query against every row of ``vectors``, as
+    one matrix-vector product"""
+    query = np.asarray(query_vector, dtype=np.float64)
+    matrix = np.asarray(vectors, dtype=np.float64).reshape(-1, query.shape[0])
+    return (matrix @ query) / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(query))
+
+def _explanation(sources: List[str], similarities: np.ndarray) -> Dict[str, Any]:
+    vector_scores = [
+        {
+            "source": source,
+            "similarity": score,
+            "description": f"Cosine similarity with {source} vector: {score:.4f}"
+        }
+        for source, score in zip(sources, similarities.tolist())
+    ]
+    # Calculate combined score using max to maximize recall
+    # This ensures a document is considered relevant if ANY of its vectors match well
+    combined_score = similarities.max()
+    return {
+        "value": combined_score,
+        "description": "Combined vector similarity score (max)",
+        "details": vector_scores
+    }
+
 def explain_vector_scores(query_vector: List[float], doc_vectors: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Calculate and explain vector similarity scores for document vectors.
@@ -27,32 +52,33 @@ def explain_vector_scores(query_vector: List[float], doc_vectors: List[Dict[str,
     Returns:
         Dict with vector similarity explanations
     """
-    logger.info(f"Processing {len(doc_vectors)} document vectors")
-    logger.debug(f"Vector sources: {[vec.get('source', 'unknown') for vec in doc_vectors]}")
-    
-    vector_scores = []
-    
-    for vec in doc_vectors:
-        source = vec.get("source", "unknown")
-        logger.debug(f"Processing vector from source: {source}")
-        score = cosine_similarity(query_vector, vec["vector"])
-        vector_scores.append({
-            "source": source,
-            "similarity": score,
-            "description": f"Cosine similarity with {source} vector: {score:.4f}"
-        })
-        logger.debug(f"Vector score for {source}: {score:.4f}")
-    
-    # Calculate combined score using max to maximize recall
-    # This ensures a document is considered relevant if ANY of its vectors match well
-    combined_score = np.max([s["similarity"] for s in vector_scores])
-    logger.info(f"Combined vector score (max similarity): {combined_score:.4f}")
+    return explain_vector_scores_many(query_vector, [doc_vectors])[0]
+
+def explain_vector_scores_many(query_vector: List[float],
+                               docs_vectors: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    explain_vector_scores for several documents at once: every vector of every
+    document is scored in a single matrix-vector product, then split back per
+    document.
     
-    return {
-        "value": combined_score,
-        "description": "Combined vector similarity score (max)",
-        "details": vector_scores
-    }
+    Args:
+        query_vector: Query embedding vector
+        docs_vectors: One list of vectors (with source field) per document
+        
+    Returns:
+        One explanation per document, in order
+    """
+    counts = [len(doc_vectors) for doc_vectors in docs_vectors]
+    logger.info(f"Processing {sum(counts)} vectors of {len(counts)} documents")
+    if not all(counts):
+        raise ValueError("every document needs at least one vector")
+    similarities = cosine_similarities(
+        query_vector, [vec["vector"] for doc_vectors in docs_vectors for vec in doc_vectors]
+    )
+    explanations = []
+    for doc_vectors, doc_similarities in zip(docs_vectors, np.split(similarities, np.cumsum(counts)[:-1])):
+        explanations.append(_explanation([vec.get("source", "unknown") for vec in doc_vectors], doc_similarities))
+    return explanations
 
 def combine_text_and_vector_scores(text_score: Dict[str, Any], vector_score: Dict[str, Any], 
                                  text_weight: float = 0.4, vector_weight: float = 0.6) -> Dict[str, Any]:
@@ -6,19 +6,34 @@ for design rationale.
 """
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import hashlib
 import json
+import multiprocessing
 import os
 import re
-from datetime import datetime
+import struct
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import date, datetime
 from typing import Any
 
+import numpy as np
 import tiktoken
 from openai import OpenAI
-from sqlalchemy import bindparam, text
+from pgvector.psycopg import Vector
+from sqlalchemy import text
+from sqlalchemy.orm import Session
 
+from .._concurrency import SyncConcurrency, async_retry_openai, get_chunk_workers, run_async
 from ..config import is_production, get_logger, DEFAULT_EMBEDDING_SIZE, DEFAULT_EMBEDDING_MODEL
-from ..db.session import get_engine, get_session
+from ..db.session import READ, get_engine, get_session, statement_deadline
 from .vector_store_base import VectorStoreBase
 
 logger = get_logger(__name__)
@@ -56,6 +71,37 @@ _HNSW_EF_SEARCH_DEFAULT = 100
 _HNSW_EF_SEARCH_MIN = 10
 _HNSW_EF_SEARCH_MAX = 1000
 
+# Upper bound on concurrent per-context searches in search_many(). A hybrid
+# search holds two pooled connections at once (vector + lexical branch, see
+# _run_branches), so keep 2x this below the engine's pool_size + max_overflow
+# (5 + 10 by default).
+_SEARCH_MANY_MAX_WORKERS = 6
+# search()'s num_results when a caller leaves it out (botnim.query's
+# DEFAULT_NUM_RESULTS; that module imports this one, so it's repeated here).
+_DEFAULT_NUM_RESULTS = 7
+# Threads available for running lexical branches alongside their vector
+# branch (see _run_branches). Sized for search_many fan-out on top of the
+# API's own to_thread workers; each in-flight branch holds one connection.
+_BRANCH_MAX_WORKERS = 16
+
+# Embedding batches in upload_files. One embeddings.create call accepts at
+# most 2048 inputs and ~300K tokens; the budget leaves headroom because the
+# per-chunk figure is an upper bound (chunk_max + overlap), not a count.
+_EMBED_BATCH_MAX_INPUTS = 2048
+_EMBED_BATCH_MAX_TOKENS = 250_000
+# Chunks planned (read + chunk + hash) before each existence probe / embed
+# round in upload_files. Bounds memory on 185K-chunk contexts while still
+# filling several batches per round so SYNC_CONCURRENCY has work to overlap.
+# A window closes at the first file boundary past this many chunks.
+_UPLOAD_WINDOW_CHUNKS = 8192
+# Files the chunk workers may run ahead of the embed/insert stage, per
+# worker (see _iter_chunked_files): bounds the chunked-but-not-yet-embedded
+# content held in memory while keeping every worker busy.
+_CHUNK_AHEAD_PER_WORKER = 8
+# Page size for loading a context's existing content hashes up front
+# (keyset pagination over the UNIQUE (context_id, content_hash) index).
+_CONTENT_HASH_PAGE_SIZE = 50_000
+
 # Per-context lexical strategies. `tsquery` is the existing prefix-OR
 # BM25 path; `trigram` uses pg_trgm.word_similarity() against the
 # documents_content_trgm GIN index (added in alembic 0015).
@@ -71,10 +117,38 @@ _LEXICAL_STRATEGIES = frozenset({_LEXICAL_STRATEGY_TSQUERY, _LEXICAL_STRATEGY_TR
 
 # pg_trgm.word_similarity_threshold default is 0.6 — too strict for our
 # corpus (real-relevance hits scored 0.55-0.76 in 2026-05-13 probes,
-# so the default cuts off the top of the ranking). 0.1 is a wide net
-# that still beats unrelated docs by a healthy margin under RRF.
+# so the default cuts off the top of the ranking). It was 0.1 until
+# 2026-10: at 0.1 pg_trgm estimates nearly every row as a match, so the
+# planner (correctly) skips documents_content_trgm for a seq scan — the
+# ~20s israeli_laws plans. 0.3 still keeps the observed relevant range
+# and is selective enough for the GIN index to win.
 # Set via SET LOCAL inside the search txn — never leaks.
-_TRIGRAM_WORD_SIMILARITY_THRESHOLD = 0.1
+_TRIGRAM_WORD_SIMILARITY_THRESHOLD = 0.3
+# Trigram candidates rechecked per lexical result wanted (see
+# _trigram_lexical_sql); bounds the heap work of a broad query.
+_TRIGRAM_CANDIDATES_PER_RESULT = 20
+# Planner guard (see _trigram_unindexed_scan): a trigram plan that would
+# scan `documents` without this index, at an estimated cost above the
+# bound, falls back to tsquery. documents is shared by every context, so
+# in production any such scan is far above it; test and dev tables aren't.
+_TRIGRAM_INDEX = "documents_content_trgm"
+_TRIGRAM_GUARD_MAX_SCAN_COST = 10_000.0
+
+# Reciprocal-rank-fusion constants shared by both fusion strategies (see
+# _rrf_fuse for why BM25 gets 3x).
+_RRF_K = 60
+_RRF_BM25_WEIGHT = 3.0
+
+# Per-context fusion strategies for the unscoped hybrid search (both branches
+# on, no law_name filter). `python` (default) fetches each branch's
+# candidates separately and fuses them in _rrf_fuse; `sql` runs KNN, lexical
+# ranking, weighted RRF and the top-k cut in one statement
+# (_fused_search_sql), so only the final rows come back and the search holds
+# one connection instead of two. Same ranking either way; opt in with
+# `fusion_strategy: sql` in `specs/<bot>/config.yaml` to A/B the latency.
+_FUSION_STRATEGY_PYTHON = "python"
+_FUSION_STRATEGY_SQL = "sql"
+_FUSION_STRATEGIES = frozenset({_FUSION_STRATEGY_PYTHON, _FUSION_STRATEGY_SQL})
 
 # Punctuation-only law_name normalization. Applied identically to the query-side
 # filter value (Python) and the stored value (SQL, _LAW_NAME_NORM_SQL) so a model
@@ -121,32 +195,273 @@ def _build_metadata_filter_sql(metadata_filter):
     return "".join(clauses), params
 
 
+# Context ids only change when a `contexts` row is deleted and re-created,
+# which no code path does outside an operator's manual cleanup. The TTL
+# bounds how long another process's such cleanup can go unnoticed here.
+_CONTEXT_ID_CACHE_TTL_SECONDS = 600
+
+
+class _ContextIdCache:
+    """In-process ``(bot, name) -> context id`` map for the search paths.
+
+    Saves the ``SELECT id FROM contexts WHERE bot=:bot AND name=:name``
+    round-trip every retrieve path would otherwise run (twice on
+    israeli_laws: detection pre-pass + search). Entries are kept per engine
+    (``sess.get_bind()``) they were read through, so a process talking to a
+    different database — tests, a DATABASE_URL swap — never sees another
+    DB's ids. Misses are not cached: a context created after the first
+    lookup is found right away. ``get_or_create_vector_store`` writes
+    through under both the write engine and the read engine the search
+    paths resolve on; ``sync_agents`` clears.
+    """
+
+    def __init__(self, ttl_seconds: float = _CONTEXT_ID_CACHE_TTL_SECONDS) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        # (bot, name, bind) -> (cid, stored_at)
+        self._ids: dict[tuple[str, str, Any], tuple[str, float]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, sess, bot: str, name: str) -> str | None:
+        """Context id for (bot, name), querying through ``sess`` on a miss;
+        None when the context doesn't exist."""
+        bind = sess.get_bind()
+        with self._lock:
+            entry = self._ids.get((bot, name, bind))
+            if entry is not None and time.monotonic() - entry[1] < self.ttl_seconds:
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        row = sess.execute(text(
+            "SELECT id FROM contexts WHERE bot=:bot AND name=:name"
+        ), {"bot": bot, "name": name}).fetchone()
+        if not row:
+            return None
+        cid = str(row[0])
+        self.put(bind, bot, name, cid)
+        return cid
+
+    def put(self, bind, bot: str, name: str, cid: str) -> None:
+        """Remember ``cid`` for lookups through ``bind`` (an engine)."""
+        with self._lock:
+            self._ids[(bot, name, bind)] = (cid, time.monotonic())
+
+    def invalidate(self, bot: str | None = None) -> None:
+        """Drop every entry, or only ``bot``'s."""
+        with self._lock:
+            if bot is None:
+                self._ids.clear()
+            else:
+                for key in [k for k in self._ids if k[0] == bot]:
+                    del self._ids[key]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._ids),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_context_ids = _ContextIdCache()
+
+
+def invalidate_context_ids(bot: str | None = None) -> None:
+    """Forget cached context ids (all bots, or one). Called after a sync."""
+    _context_ids.invalidate(bot)
+
+
+def context_id_cache_stats() -> dict[str, Any]:
+    return _context_ids.stats()
+
+
 _LAW_NAME_RESOLVE_THRESHOLD = 0.45
 
+# law_name_catalog only changes when sync refreshes the matview (and sync_agents
+# then drops this process's copy). The recheck interval bounds how long another
+# process's refresh can go unnoticed; a recheck is one aggregate over the
+# context's catalog rows and only reloads the names when they changed.
+_LAW_CATALOG_RECHECK_SECONDS = 60
+
+_TRGM_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def _trigrams(value: str) -> frozenset[str]:
+    """pg_trgm's trigram set for ``value``: lower-cased alphanumeric words,
+    each padded with two leading blanks and one trailing blank."""
+    grams = set()
+    for word in _TRGM_WORD_RE.findall(value.lower()):
+        padded = "  " + word + " "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def _trgm_similarity(common: int, n1: int, n2: int) -> float:
+    """pg_trgm ``similarity()`` from trigram counts, as the float4 Postgres
+    computes (``%`` compares this value against the threshold)."""
+    if n1 <= 0 or n2 <= 0:
+        return 0.0
+    return struct.unpack("f", struct.pack("f", common / (n1 + n2 - common)))[0]
+
+
+def _float4_text(value: float) -> float:
+    """The float a float4 reads back as over the wire (its shortest text form:
+    0.8, not 0.800000011920929) — what the SQL lookup used to return."""
+    packed = struct.pack("f", value)
+    for digits in range(1, 10):
+        candidate = float("%.*g" % (digits, value))
+        if struct.pack("f", candidate) == packed:
+            return candidate
+    return value
+
+
+def _law_match_key(value: str) -> str:
+    return _normalize_law_name(value).lower()
+
+
+class _LawNameIndex:
+    """Trigram index over one context's law_name_catalog rows.
+
+    Answers _best_law_match the way the ``%`` / ``similarity()`` SQL did:
+    an exact normalized-name hit short-circuits, otherwise the mention's
+    trigrams walk an inverted index (trigram -> law positions) so only laws
+    sharing at least one trigram are scored.
+    """
+
+    def __init__(self, names) -> None:
+        self.names = list(names)
+        self._exact: dict[str, int] = {}
+        self._postings: dict[str, list[int]] = {}
+        self._sizes: list[int] = []
+        for i, name in enumerate(self.names):
+            self._exact.setdefault(_law_match_key(name), i)
+            grams = _trigrams(name)
+            self._sizes.append(len(grams))
+            for g in grams:
+                self._postings.setdefault(g, []).append(i)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def best(self, mention: str, threshold: float) -> tuple[str, float] | None:
+        grams = _trigrams(mention)
+        if not grams:
+            return None
+        i = self._exact.get(_law_match_key(mention))
+        if i is not None and self._sizes[i]:
+            return (self.names[i], 1.0)
+        common: dict[int, int] = {}
+        for g in grams:
+            for i in self._postings.get(g, ()):
+                common[i] = common.get(i, 0) + 1
+        best = None  # (position, float4 score)
+        for i, c in common.items():
+            score = _trgm_similarity(c, len(grams), self._sizes[i])
+            if score >= threshold and (best is None or score > best[1]):
+                best = (i, score)
+        if best is None:
+            return None
+        return (self.names[best[0]], _float4_text(best[1]))
+
+
+def _bind_of(conn):
+    """Engine behind a Session or a Connection (cache entries are per-engine)."""
+    return conn.get_bind() if isinstance(conn, Session) else conn.engine
+
+
+class _LawNameCatalog:
+    """In-process ``context id -> _LawNameIndex`` map over law_name_catalog.
+
+    Saves the up-to-three trigram lookups _detect_law_in_query (plus the
+    prefix-less fallback and the scoped-filter resolver) would otherwise run
+    per israeli_laws search. Like _ContextIdCache, entries remember the engine
+    they were read through. Every ``recheck_seconds`` an entry is validated
+    against a ``count``/``hashtext`` fingerprint of the context's rows and
+    rebuilt only when it changed; ``sync_agents`` clears after refreshing.
+    """
+
+    def __init__(self, recheck_seconds: float = _LAW_CATALOG_RECHECK_SECONDS) -> None:
+        self.recheck_seconds = recheck_seconds
+        self._lock = threading.Lock()
+        # cid -> (index, version, bind, checked_at)
+        self._entries: dict[str, tuple[_LawNameIndex, tuple, Any, float]] = {}
+        self.hits = 0
+        self.rechecks = 0
+        self.loads = 0
+
+    def index(self, sess, cid: str) -> _LawNameIndex:
+        bind = _bind_of(sess)
+        with self._lock:
+            entry = self._entries.get(cid)
+            if entry is not None and entry[2] is not bind:
+                entry = None
+            if entry is not None and time.monotonic() - entry[3] < self.recheck_seconds:
+                self.hits += 1
+                return entry[0]
+        version = tuple(sess.execute(text(
+            "SELECT count(*), coalesce(sum(hashtext(law_name)::bigint), 0) "
+            "FROM law_name_catalog WHERE context_id = :cid"
+        ), {"cid": cid}).one())
+        if entry is not None and entry[1] == version:
+            with self._lock:
+                self.rechecks += 1
+                self._entries[cid] = (entry[0], version, bind, time.monotonic())
+            return entry[0]
+        rows = sess.execute(text(
+            "SELECT law_name FROM law_name_catalog WHERE context_id = :cid ORDER BY law_name"
+        ), {"cid": cid}).fetchall()
+        index = _LawNameIndex(r[0] for r in rows)
+        with self._lock:
+            self.loads += 1
+            self._entries[cid] = (index, version, bind, time.monotonic())
+        return index
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "contexts": len(self._entries),
+                "laws": sum(len(e[0]) for e in self._entries.values()),
+                "hits": self.hits,
+                "rechecks": self.rechecks,
+                "loads": self.loads,
+            }
+
+
+_law_catalog = _LawNameCatalog()
+
+
+def invalidate_law_catalog() -> None:
+    """Forget the in-process law_name_catalog copies. Called after a sync."""
+    _law_catalog.invalidate()
+
+
+def law_catalog_stats() -> dict[str, Any]:
+    return _law_catalog.stats()
+
 
 def _best_law_match(sess, cid, mention, threshold=_LAW_NAME_RESOLVE_THRESHOLD):
     """Best-matching formal law_name + its trigram similarity over the distinct
-    law_name set (the `law_name_catalog` matview, ~14k rows vs ~185k docs → ~200ms),
-    or None. The `%` operator is gated by pg_trgm.similarity_threshold; we set it to
-    `threshold`. `law_name_catalog_trgm` serves the `%` lookup. Returns (law_name, score).
+    law_name set (the `law_name_catalog` matview), or None. Same answer as the
+    pg_trgm `law_name % :m ORDER BY similarity(...) DESC` lookup with
+    similarity_threshold = `threshold`, served from the in-process
+    _LawNameCatalog index instead of a round-trip. Returns (law_name, score).
     """
     if not mention:
         return None
-    sess.execute(text("SET LOCAL pg_trgm.similarity_threshold = %s" % float(threshold)))
-    row = sess.execute(text(
-        "SELECT law_name, similarity(law_name, :m) AS s "
-        "FROM law_name_catalog "
-        "WHERE context_id = :cid AND law_name % :m "
-        "ORDER BY s DESC LIMIT 1"
-    ), {"cid": cid, "m": mention}).fetchone()
-    if row and row[1] is not None:
-        return (row[0], float(row[1]))
-    return None
+    return _law_catalog.index(sess, str(cid)).best(mention, float(threshold))
 
 
 def _resolve_law_name(sess, cid, mention, threshold=_LAW_NAME_RESOLVE_THRESHOLD):
     """Resolve a colloquial/partial/variant law mention to the formal `law_name`
-    in this context (pg_trgm similarity over law_name_catalog), or None if nothing
+    in this context (trigram similarity over law_name_catalog), or None if nothing
     is similar enough. Used on a scoped-filter exact-miss to rescue the scope
     (e.g. the model's "חוק המכרזים" -> "חוק חובת המכרזים").
     """
@@ -228,6 +543,110 @@ def _detect_law_in_query(sess, cid, query_text, threshold=_QUERY_DETECT_THRESHOL
 _SCOPED_OVERRIDE_VECTOR_WEIGHT = 0.5
 
 
+def _vector_param(conn, embedding):
+    """Bind value for a `CAST(:emb AS vector)` placeholder.
+
+    Binary float4 (`pgvector.psycopg.Vector`) when the connection has the
+    pgvector adapters `get_engine()` registers; otherwise the text literal,
+    so ad-hoc engines and pre-migration connections keep working.
+    """
+    if isinstance(conn, Session):
+        conn = conn.connection()
+    if conn.connection.driver_connection.adapters.types.get("vector") is not None:
+        return Vector(embedding)
+    return str(list(embedding))
+
+
+def _context_id_sql(cid) -> str:
+    """``cid`` as an inline uuid literal for the HNSW KNN statements.
+
+    The per-context partial HNSW indexes (scripts/ensure-partial-hnsw-indexes.py)
+    are ``WHERE context_id = '<uuid>'``. Once psycopg prepares a statement,
+    Postgres may switch it to a generic plan, and a generic plan can only use a
+    partial index whose predicate it can prove from the statement text — a
+    ``:cid`` bind parameter doesn't qualify. Inlining the id costs one prepared
+    statement per context instead of one overall.
+    """
+    return f"'{uuid.UUID(str(cid))}'::uuid"
+
+
+def _set_trigram_locals(sess) -> None:
+    """SET LOCALs every trigram lexical statement runs under.
+
+    The threshold is what makes ``%>`` selective (see
+    _TRIGRAM_WORD_SIMILARITY_THRESHOLD). Custom plans only: whether the
+    trigram index pays off depends on the query text, and a prepared
+    statement's generic plan can't see it — its default estimate picks a
+    seq scan, and the planner guard EXPLAINs with the real text.
+    """
+    sess.execute(text(
+        f"SET LOCAL pg_trgm.word_similarity_threshold = {_TRIGRAM_WORD_SIMILARITY_THRESHOLD}"
+    ))
+    sess.execute(text("SET LOCAL plan_cache_mode = force_custom_plan"))
+
+
+def _trigram_lexical_sql(cid, md_filter_sql: str, fetch: int, columns: str = "id, content, metadata") -> str:
+    """Trigram lexical statement: index-driven candidates, exact re-score.
+
+    ``content %> :q`` is ``word_similarity(:q, content) >= threshold`` with
+    the indexed column on the side gin_trgm_ops answers, so candidates come
+    from a bitmap scan of documents_content_trgm. The bitmap is unordered;
+    the inner LIMIT just bounds how many rows get rechecked, and the outer
+    query ranks those by the exact ``word_similarity`` and keeps ``fetch``.
+
+    That makes this a sample, not a top-k: when more than
+    ``fetch * _TRIGRAM_CANDIDATES_PER_RESULT`` rows pass the threshold, the
+    inner LIMIT keeps whichever ones the scan yields first (heap order, not
+    score order), so the best-scoring match can be cut before re-scoring.
+    Which subset survives depends on physical row placement and the plan —
+    it can change after VACUUM or new rows, and a parallel scan may return
+    different subsets for the same query. Narrow queries, under the bound,
+    are exact.
+    """
+    return f"""
+        SELECT {columns}, word_similarity(:q, content) AS score
+        FROM (
+            SELECT id, content, metadata
+            FROM documents
+            WHERE context_id = {_context_id_sql(cid)}
+              AND content %> :q{md_filter_sql}
+            LIMIT {int(fetch) * _TRIGRAM_CANDIDATES_PER_RESULT}
+        ) AS candidates
+        ORDER BY score DESC
+        LIMIT {int(fetch)}"""
+
+
+def _plan_nodes(node: dict):
+    yield node
+    for child in node.get("Plans", ()):
+        yield from _plan_nodes(child)
+
+
+def _trigram_unindexed_scan(plan: dict) -> dict | None:
+    """The first node of an EXPLAIN (FORMAT JSON) plan that reads
+    ``documents`` without the trigram index at an estimated cost above
+    _TRIGRAM_GUARD_MAX_SCAN_COST — a seq scan, or an index scan on
+    context_id that rechecks ``%>`` row by row — else None."""
+    for node in _plan_nodes(plan):
+        if node.get("Relation Name") != "documents" or node["Total Cost"] <= _TRIGRAM_GUARD_MAX_SCAN_COST:
+            continue
+        if _TRIGRAM_INDEX not in {n.get("Index Name") for n in _plan_nodes(node)}:
+            return node
+    return None
+
+
+def _trigram_plan_guard(sess, cid, query_text: str, md_filter_sql: str, md_params: dict, fetch: int) -> dict | None:
+    """EXPLAIN the trigram lexical statement for this query; the offending
+    plan node when it isn't index-driven (see _trigram_unindexed_scan).
+    Expects the caller to have run _set_trigram_locals on ``sess``."""
+    raw = sess.execute(
+        text("EXPLAIN (FORMAT JSON) " + _trigram_lexical_sql(cid, md_filter_sql, fetch)),
+        {"q": query_text, **md_params},
+    ).scalar()
+    plan = json.loads(raw) if isinstance(raw, str) else raw
+    return _trigram_unindexed_scan(plan[0]["Plan"])
+
+
 def _scoped_vector_knn_sql(rest_sql):
     """SQL for an EXACT vector KNN over a single law's docs.
 
@@ -258,7 +677,7 @@ def _scoped_vector_knn(sess, cid, law_norm, rest_sql, rest_params, embedding, fe
     the caller's transaction; hnsw.ef_search is irrelevant here (no HNSW on the
     materialized rows)."""
     return sess.execute(text(_scoped_vector_knn_sql(rest_sql)), {
-        "cid": cid, "law_norm": law_norm, "emb": str(embedding), "limit": fetch, **rest_params,
+        "cid": cid, "law_norm": law_norm, "emb": _vector_param(sess, embedding), "limit": fetch, **rest_params,
     }).fetchall()
 
 
@@ -318,6 +737,53 @@ def _get_tokenizer():
     return _tokenizer
 
 
+_token_byte_lengths = None
+
+
+def _get_token_byte_lengths() -> np.ndarray:
+    """UTF-8 byte length of every token id of the tokenizer (0 for unused
+    ids), for mapping token positions to byte offsets without decoding."""
+    global _token_byte_lengths
+    if _token_byte_lengths is None:
+        enc = _get_tokenizer()
+        lengths = np.zeros(enc.n_vocab, dtype=np.int64)
+        for token in range(enc.n_vocab):
+            try:
+                lengths[token] = len(enc.decode_single_token_bytes(token))
+            except KeyError:
+                pass
+        _token_byte_lengths = lengths
+    return _token_byte_lengths
+
+
+def _section_token_ids(enc, content: str, token_ids: list[int], spans: list[tuple[int, int]]) -> list[list[int]]:
+    """Token ids of each ``content[start:end]`` span, sliced out of
+    ``token_ids`` (the encoding of the whole of ``content``).
+
+    A span whose start and end fall on token boundaries of the whole
+    encoding tokenizes exactly like its slice: cl100k's pre-tokenizer never
+    joins a newline to the non-newline character after it, so section and
+    paragraph starts are always such boundaries. A span that doesn't line
+    up — e.g. a paragraph ending in punctuation, which pre-tokenizes
+    together with the blank line after it — is encoded on its own.
+    """
+    token_starts = np.zeros(len(token_ids) + 1, dtype=np.int64)
+    np.cumsum(_get_token_byte_lengths()[token_ids], out=token_starts[1:])
+    out = []
+    char_pos = byte_pos = 0
+    for start, end in spans:
+        byte_pos += len(content[char_pos:start].encode("utf-8"))
+        byte_start = byte_pos
+        byte_pos += len(content[start:end].encode("utf-8"))
+        char_pos = end
+        first, last = np.searchsorted(token_starts, (byte_start, byte_pos)).tolist()
+        if last < len(token_starts) and token_starts[first] == byte_start and token_starts[last] == byte_pos:
+            out.append(token_ids[first:last])
+        else:
+            out.append(enc.encode(content[start:end]))
+    return out
+
+
 def _chunk_for_embedding(
     content: str,
     max_tokens: int = CHUNK_MAX_TOKENS,
@@ -335,11 +801,18 @@ def _chunk_for_embedding(
     avoid losing context at split points (a query landing right at a chunk
     boundary still hits at least one chunk that contains the surrounding
     context). Standard RAG technique — see e.g. LangChain's
-    RecursiveCharacterTextSplitter for the same idea.
+    RecursiveCharacterTextSplitter for the same idea. `overlap_tokens=0`
+    carries no tail.
 
     Content shorter than `max_tokens` returns as a single-element list — no
     splitting work, no overlap. The vast majority of files take this path
     and pay zero tokenization cost beyond the initial count.
+
+    Tokenization is single-pass: the content is encoded once, sections and
+    paragraphs are token slices of that encoding (_section_token_ids), and
+    hard-split windows and overlap tails are slices of those. The tail is
+    re-encoded only when the chunk's last section is shorter than the
+    overlap.
     """
     enc = _get_tokenizer()
     token_ids = enc.encode(content)
@@ -348,20 +821,25 @@ def _chunk_for_embedding(
 
     # Multi-chunk path: split at semantic boundaries first.
     # Try ## section headers — split keeping the marker with the following text.
-    sections = re.split(r"(?m)(?=^##\s)", content)
-    sections = [s for s in sections if s.strip()]
-    if len(sections) <= 1:
+    bounds = sorted({0, len(content), *(m.start() for m in re.finditer(r"(?m)(?=^##\s)", content))})
+    spans = [(start, end) for start, end in zip(bounds, bounds[1:]) if content[start:end].strip()]
+    if len(spans) <= 1:
         # Fallback: split on blank-line paragraph boundaries.
-        sections = re.split(r"\n\s*\n", content)
-        sections = [s for s in sections if s.strip()]
+        separators = list(re.finditer(r"\n\s*\n", content))
+        starts = [0] + [m.end() for m in separators]
+        ends = [m.start() for m in separators] + [len(content)]
+        spans = [(start, end) for start, end in zip(starts, ends) if content[start:end].strip()]
+    sections = [content[start:end] for start, end in spans]
+    sections_ids = _section_token_ids(enc, content, token_ids, spans)
 
     # Greedy pack sections into chunks under the limit; if a single section
     # is itself too large, hard-split it by token windows with overlap.
     chunks: list[str] = []
     current: list[str] = []
     current_tokens = 0
-    for section in sections:
-        section_tokens = len(enc.encode(section))
+    last_ids: list[int] = []
+    for section, section_token_ids in zip(sections, sections_ids):
+        section_tokens = len(section_token_ids)
         if section_tokens > max_tokens:
             # Section itself oversized — flush whatever we've packed, then
             # hard-split this section by token windows.
@@ -369,7 +847,6 @@ def _chunk_for_embedding(
                 chunks.append("\n\n".join(current))
                 current = []
                 current_tokens = 0
-            section_token_ids = enc.encode(section)
             step = max_tokens - overlap_tokens
             for start in range(0, len(section_token_ids), step):
                 window = section_token_ids[start : start + max_tokens]
@@ -379,8 +856,15 @@ def _chunk_for_embedding(
             continue
         if current_tokens + section_tokens > max_tokens and current:
             chunks.append("\n\n".join(current))
-            # Carry overlap from end of previous chunk into the new one.
-            prev_tail_tokens = enc.encode(chunks[-1])[-overlap_tokens:]
+            # Carry overlap from end of previous chunk into the new one. The
+            # chunk ends with its last section, on a token boundary, so its
+            # tail is the tail of that section's ids when they are long enough.
+            if not overlap_tokens:
+                prev_tail_tokens = []
+            elif len(last_ids) >= overlap_tokens:
+                prev_tail_tokens = last_ids[-overlap_tokens:]
+            else:
+                prev_tail_tokens = enc.encode(chunks[-1])[-overlap_tokens:]
             tail_text = enc.decode(prev_tail_tokens) if prev_tail_tokens else ""
             current = [tail_text, section] if tail_text else [section]
             current_tokens = (
@@ -389,14 +873,126 @@ def _chunk_for_embedding(
         else:
             current.append(section)
             current_tokens += section_tokens
+        last_ids = section_token_ids
     if current:
         chunks.append("\n\n".join(current))
 
     return chunks
 
 
+def _chunk_and_hash(content: str, max_tokens: int, overlap_tokens: int) -> tuple[list[tuple[str, str]], float]:
+    """Chunk stage of upload_files, run in a chunk worker process: the
+    file's chunks paired with their sha256 content hashes, and the CPU
+    seconds it took."""
+    started = time.process_time()
+    chunks = _chunk_for_embedding(content, max_tokens=max_tokens, overlap_tokens=overlap_tokens)
+    hashed = [(chunk, hashlib.sha256(chunk.encode("utf-8")).hexdigest()) for chunk in chunks]
+    return hashed, time.process_time() - started
+
+
+_chunk_pool: ProcessPoolExecutor | None = None
+_chunk_pool_lock = threading.Lock()
+
+
+def _get_chunk_pool(workers: int) -> ProcessPoolExecutor:
+    """The process pool every upload_files call submits chunk jobs to
+    (contexts upload on parallel threads; they share it). Sized by the
+    first caller. Workers are spawned, not forked — the syncing process
+    holds threads, locks and DB connections a fork would copy mid-use."""
+    global _chunk_pool
+    with _chunk_pool_lock:
+        if _chunk_pool is None:
+            _chunk_pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _chunk_pool
+
+
+def _discard_chunk_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool (a worker died, e.g. OOM-killed) so the next
+    _get_chunk_pool call starts a fresh one."""
+    global _chunk_pool
+    with _chunk_pool_lock:
+        if _chunk_pool is pool:
+            _chunk_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+@dataclass
+class _UploadStageStats:
+    """Per-stage counters for one upload_files run (the SYNC_STAGES line)."""
+    files_chunked: int = 0
+    chunks: int = 0
+    chunk_cpu_s: float = 0.0   # worker CPU spent chunking + hashing
+    chunk_wait_s: float = 0.0  # embed/insert stage idle, waiting on a chunk result
+    embedded: int = 0
+    embed_s: float = 0.0
+    inserted: int = 0
+    insert_s: float = 0.0
+
+
+def _iter_chunked_files(file_streams, max_tokens: int, overlap_tokens: int, workers: int,
+                        stats: _UploadStageStats):
+    """Chunk stage of upload_files: yields ``(fname, metadata, chunks)``
+    for each markdown file, in input order. ``chunks`` is _chunk_and_hash's
+    ``(chunk, hash)`` list, or the exception reading the file raised.
+
+    With ``workers`` > 0 the files are read here and chunked in the shared
+    process pool, up to ``workers * _CHUNK_AHEAD_PER_WORKER`` files ahead
+    of the consumer — so chunking continues while the caller embeds and
+    inserts the files already yielded. With 0 (or once the pool breaks)
+    each file is chunked inline. An exception raised by chunking itself
+    propagates, as before.
+    """
+    pool = _get_chunk_pool(workers) if workers > 0 else None
+    ahead = max(1, workers * _CHUNK_AHEAD_PER_WORKER)
+    pending: deque = deque()
+
+    def _collect(entry):
+        nonlocal pool
+        fname, metadata, content, job = entry
+        if isinstance(job, BaseException):
+            return fname, metadata, job
+        if isinstance(job, Future):
+            waited = time.monotonic()
+            try:
+                job = job.result()
+            except BrokenProcessPool:
+                if pool is not None:
+                    logger.warning("Chunk worker pool broke; chunking the remaining files in-process")
+                    _discard_chunk_pool(pool)
+                    pool = None
+                job = _chunk_and_hash(content, max_tokens, overlap_tokens)
+            stats.chunk_wait_s += time.monotonic() - waited
+        chunks, cpu_s = job
+        stats.files_chunked += 1
+        stats.chunks += len(chunks)
+        stats.chunk_cpu_s += cpu_s
+        return fname, metadata, chunks
+
+    for fname, content_file, _file_type, metadata in file_streams:
+        if not fname.endswith(".md"):
+            logger.debug("Skipping non-markdown file: %s", fname)
+            continue
+        try:
+            raw_content = content_file.read().decode("utf-8")
+        except Exception as exc:
+            pending.append((fname, metadata, None, exc))
+        else:
+            if pool is None:
+                job = _chunk_and_hash(raw_content, max_tokens, overlap_tokens)
+            else:
+                job = pool.submit(_chunk_and_hash, raw_content, max_tokens, overlap_tokens)
+            pending.append((fname, metadata, raw_content, job))
+        while len(pending) >= ahead:
+            yield _collect(pending.popleft())
+    while pending:
+        yield _collect(pending.popleft())
+
+
 def _get_embedding_client(environment: str):
-    """Return an object with an .embed(text) -> list[float] method.
+    """Return an object with an .embed(text) -> list[float] method and,
+    optionally, an .embed_many(texts) -> list[list[float]] batch method.
 
     Real impl returns a thin wrapper around OpenAI; tests monkeypatch
     this function to inject a fake. Kept as a module-level function
@@ -416,12 +1012,242 @@ def _get_embedding_client(environment: str):
             )
             return response.data[0].embedding
 
+        def embed_many(self, texts: list[str]) -> list[list]:
+            response = client.embeddings.create(
+                input=list(texts),
+                model=DEFAULT_EMBEDDING_MODEL,
+            )
+            return [d.embedding for d in sorted(response.data, key=lambda d: d.index)]
+
     return _Wrapper()
 
 
+def _embed_texts(client, texts: list[str]) -> list[list]:
+    """Embed ``texts`` in one request when the client supports batches.
+
+    Clients without ``embed_many`` (test fakes, older wrappers) fall back
+    to one ``embed`` call per text so callers don't have to care.
+    """
+    embed_many = getattr(client, "embed_many", None)
+    if embed_many is not None:
+        return embed_many(texts)
+    return [client.embed(t) for t in texts]
+
+
+@async_retry_openai()
+async def _embed_texts_async(client, texts: list[str]) -> list[list]:
+    """One (blocking) batch embed on a worker thread, with 429 backoff."""
+    return await asyncio.to_thread(_embed_texts, client, texts)
+
+
+def _load_content_hashes(sess, context_id: str) -> dict[str, str | None]:
+    """Return every content_hash stored for ``context_id``, mapped to its
+    row's ``metadata.filename`` (for upload_files' per-file reconcile).
+
+    Pages through the UNIQUE (context_id, content_hash) index in hash
+    order so a 185K-chunk context costs a handful of range scans
+    rather than one SELECT per chunk.
+    """
+    hashes: dict[str, str | None] = {}
+    after = ""
+    while True:
+        page = sess.execute(text(
+            "SELECT content_hash, metadata->>'filename' FROM documents "
+            "WHERE context_id = :cid AND content_hash > :after "
+            "ORDER BY content_hash LIMIT :n"
+        ), {"cid": context_id, "after": after, "n": _CONTENT_HASH_PAGE_SIZE}).all()
+        hashes.update(page)
+        if len(page) < _CONTENT_HASH_PAGE_SIZE:
+            return hashes
+        after = page[-1][0]
+
+
+# Metadata keys that hold a document's date, in precedence order — contexts
+# disagree on the name (see _recency_search) — checked at the top level
+# first, then under the older schema's `extracted_data`.
+_DOC_DATE_KEYS = ("תאריך", "תאריך_מכתב", "PublicationDate", "publish_date")
+# Strict: realistic year (1900-2039), valid month (01-12), valid day (01-31).
+# The loose `^[0-9]{4}-[0-9]{2}-[0-9]{2}` admitted garbage like '3390-06-91'
+# (committee_decisions _427.md), which sorted to position [0] under
+# ORDER BY doc_date DESC and poisoned every recency query. Anything after
+# the date (a time of day) is ignored.
+_DOC_DATE_RE = re.compile(r"^(19[0-9]{2}|20[0-3][0-9])-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])")
+# gov.il's DD.MM.YYYY (government_decisions' publish_date, as stored by
+# aurora_writer.write_decision); same ranges, whole value only.
+_DOC_DATE_DMY_RE = re.compile(r"^(0[1-9]|[12][0-9]|3[01])\.(0[1-9]|1[0-2])\.(19[0-9]{2}|20[0-3][0-9])$")
+
+
+def _doc_date(metadata: dict | None) -> date | None:
+    """The ``documents.doc_date`` value for a row's metadata.
+
+    The first non-empty date key wins (see _DOC_DATE_KEYS); a value that
+    isn't a valid ISO or DD.MM.YYYY date is None, so the row is left out of
+    RECENCY_BROWSE rather than sorted by garbage. Migration 0021 backfills
+    existing rows with the same rules in SQL.
+    """
+    metadata = metadata or {}
+    extracted = metadata.get("extracted_data")
+    sources = (metadata, extracted if isinstance(extracted, dict) else {})
+    value = next((source[key] for source in sources for key in _DOC_DATE_KEYS
+                  if source.get(key) not in (None, "")), None)
+    if value is None:
+        return None
+    if match := _DOC_DATE_RE.match(str(value)):
+        year, month, day = match.groups()
+    elif match := _DOC_DATE_DMY_RE.match(str(value)):
+        day, month, year = match.groups()
+    else:
+        return None
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:  # e.g. 2025-02-30
+        return None
+
+
+def _document_key(metadata: dict | None) -> str | None:
+    """The ``documents.document_key`` for a row's metadata: md5 of its
+    DocumentTitle — the unit _expand_to_documents reassembles — or None.
+    Hashed so the (context_id, document_key, chunk_index) index stays
+    compact whatever the title length; migration 0022 backfills with md5()."""
+    title = (metadata or {}).get("DocumentTitle")
+    if not title:
+        return None
+    return hashlib.md5(str(title).encode("utf-8")).hexdigest()
+
+
+def _chunk_index(metadata: dict | None) -> int:
+    """The ``documents.chunk_index`` for a row's metadata. Single-chunk files
+    carry no ``chunk_index`` key (see upload_files) and are chunk 0."""
+    value = str((metadata or {}).get("chunk_index", ""))
+    return int(value) if value.isascii() and value.isdigit() else 0
+
+
+# Column order for _copy_documents rows and the staging table it fills.
+# The last three aren't part of the row tuples — _copy_documents derives
+# them from the metadata.
+_DOCUMENT_COPY_COLUMNS = (
+    "context_id", "content", "content_hash", "metadata", "embedding", "source_id",
+    "doc_date", "document_key", "chunk_index",
+)
+_DOCUMENT_COPY_TYPES = ["uuid", "text", "text", "jsonb", "vector", "text", "date", "text", "int4"]
+
+
+def _copy_documents(sess, rows) -> int:
+    """Bulk-load document rows; return how many were actually inserted.
+
+    ``rows`` yields ``(context_id, content, content_hash, metadata,
+    embedding, source_id)`` tuples with ``metadata`` a dict and
+    ``embedding`` a list of floats. Rows stream through binary
+    ``COPY ... FROM STDIN`` into a session-local staging table (vectors
+    go over the wire in pgvector's binary format rather than as ~20KB
+    text literals) and are merged with one
+    ``INSERT ... ON CONFLICT (context_id, content_hash) DO NOTHING``,
+    so re-loading rows that already exist is a no-op. ``doc_date``,
+    ``document_key`` and ``chunk_index`` are derived from ``metadata``
+    here (see _doc_date / _document_key / _chunk_index), so every bulk
+    writer keeps the recency and document-expansion indexes current.
+
+    Runs inside the caller's transaction; the staging table is dropped
+    on commit and truncated after each merge so repeated calls in one
+    transaction are fine. Contexts that gained rows are touched (see
+    _touch_contexts) in the same transaction.
+    """
+    cols = ", ".join(_DOCUMENT_COPY_COLUMNS)
+    sess.execute(text(
+        "CREATE TEMP TABLE IF NOT EXISTS _documents_stage ("
+        "context_id uuid, content text, content_hash text, "
+        "metadata jsonb, embedding vector, source_id text, doc_date date, "
+        "document_key text, chunk_index int"
+        ") ON COMMIT DROP"
+    ))
+    raw = sess.connection().connection.driver_connection
+    with raw.cursor() as cur:
+        # `vector` in set_types relies on the pgvector adapters get_engine()
+        # registers on every connection.
+        with cur.copy(f"COPY _documents_stage ({cols}) FROM STDIN WITH (FORMAT BINARY)") as copy:
+            copy.set_types(_DOCUMENT_COPY_TYPES)
+            for context_id, content, content_hash, metadata, embedding, source_id in rows:
+                copy.write_row((
+                    uuid.UUID(str(context_id)), content, content_hash,
+                    metadata, embedding, source_id, _doc_date(metadata),
+                    _document_key(metadata), _chunk_index(metadata),
+                ))
+    merged = sess.execute(text(
+        f"INSERT INTO documents ({cols}) SELECT {cols} FROM _documents_stage "
+        "ON CONFLICT (context_id, content_hash) DO NOTHING"
+    ))
+    inserted = merged.rowcount or 0
+    if inserted:
+        _touch_contexts(sess, sess.execute(text(
+            "SELECT DISTINCT context_id FROM _documents_stage")).scalars())
+    sess.execute(text("TRUNCATE _documents_stage"))
+    return inserted
+
+
+def _touch_contexts(sess, context_ids) -> None:
+    """Bump ``contexts.updated_at`` for contexts whose documents the caller's
+    transaction changed. The retrieve cache folds it into each context's
+    corpus version (botnim.retrieve_cache), so every committed write — a
+    sync window, a gov.il decision — invalidates the answers cached before it.
+    """
+    ids = sorted({str(cid) for cid in context_ids})
+    if ids:
+        sess.execute(text(
+            "UPDATE contexts SET updated_at = now() WHERE id = ANY(CAST(:ids AS uuid[]))"
+        ), {"ids": ids})
+
+
+def _plan_embed_batches(texts: list[str], tokens_per_text: int) -> list[list[str]]:
+    """Split ``texts`` into request-sized batches by input count and token budget."""
+    per_batch = max(1, min(
+        _EMBED_BATCH_MAX_INPUTS, _EMBED_BATCH_MAX_TOKENS // max(1, tokens_per_text),
+    ))
+    return [texts[i:i + per_batch] for i in range(0, len(texts), per_batch)]
+
+
+async def _embed_batches_async(
+    client, batches: list[list[str]], concurrency: SyncConcurrency,
+) -> list:
+    """Embed every batch, at most ``concurrency.concurrency`` in flight.
+
+    Returns one entry per input text, in input order: the embedding, or
+    the exception that text failed with. A batch that fails outright is
+    retried one text at a time so a single bad chunk only costs itself,
+    matching the per-chunk skip semantics of the serial path. Once the
+    daily request quota is gone every remaining text fails fast.
+    """
+    from ..dynamic_extraction import RpdExhausted
+
+    async def _one(texts: list[str]) -> list:
+        try:
+            return list(await concurrency.run_bounded(_embed_texts_async, client, texts))
+        except RpdExhausted as exc:
+            concurrency.rpd_tripped.set()
+            return [exc] * len(texts)
+        except Exception as exc:
+            if len(texts) == 1:
+                return [exc]
+            logger.warning(
+                "Embedding batch of %d failed (%s); retrying one chunk at a time",
+                len(texts), exc,
+            )
+            results: list = []
+            for t in texts:
+                results.extend(await _one([t]))
+            return results
+
+    per_batch = await asyncio.gather(*(_one(b) for b in batches))
+    return [r for batch in per_batch for r in batch]
+
+
 class VectorStoreAurora(VectorStoreBase):
     """Vector store backed by Aurora Serverless v2 (PostgreSQL 16.4 + pgvector)."""
 
+    # upload_files reads file_streams in one pass; delete_existing_files is a no-op.
+    streaming_upload = True
+    # One contexts row per context and per-call sessions: contexts sync in parallel.
+    parallel_contexts = True
+
     def __init__(self, config: dict, config_dir, environment: str | None = None):
         if environment is None:
             raise ValueError(
@@ -456,6 +1282,21 @@ class VectorStoreAurora(VectorStoreBase):
         extraction_cache table — always supported."""
         return True
 
+    def _context_size_hints(self) -> dict[str, int]:
+        """Stored chunk count per context — the cheapest proxy for how long
+        each context's sync takes, used to schedule the largest first."""
+        try:
+            with get_session() as sess:
+                rows = sess.execute(text(
+                    "SELECT c.name, count(d.id) FROM contexts c "
+                    "LEFT JOIN documents d ON d.context_id = c.id "
+                    "WHERE c.bot = :bot GROUP BY c.name"
+                ), {"bot": self.config["slug"]}).fetchall()
+        except Exception as exc:
+            logger.warning("Could not size contexts for scheduling: %s", exc)
+            return {}
+        return {name: n for name, n in rows}
+
     # ---- abstract method overrides -----------------------------------------
 
     def get_or_create_vector_store(self, context, context_name, replace_context, force_rebuild=False):
@@ -478,6 +1319,9 @@ class VectorStoreAurora(VectorStoreBase):
                 "RETURNING id"
             ), {"bot": bot, "name": context_name}).fetchone()
             cid = str(row[0])
+            # Search paths resolve through the read engine: seed its entry too.
+            _context_ids.put(sess.get_bind(), bot, context_name, cid)
+            _context_ids.put(get_engine(READ), bot, context_name, cid)
 
             if force_rebuild:
                 sess.execute(text(
@@ -505,6 +1349,22 @@ class VectorStoreAurora(VectorStoreBase):
         the LLM citation layer can collapse same-source chunks into one
         citation if it wants.
 
+        The context's stored content hashes are loaded once and each chunk's
+        hash is checked against that set; only missing chunks are embedded, in token-budgeted
+        `embeddings.create` batches with SYNC_CONCURRENCY requests in flight
+        (see `_UPLOAD_WINDOW_CHUNKS` / `_EMBED_BATCH_MAX_TOKENS`). Chunking
+        and hashing run in a shared process pool (`SYNC_CHUNK_WORKERS`, see
+        `_iter_chunked_files`) a bounded number of files ahead, so they
+        overlap the embedding and insert of the files before them; the
+        SYNC_STAGES log line reports each stage's throughput.
+
+        ``file_streams`` may be a lazy iterator that runs extraction as it is
+        pulled, so no transaction spans those pulls. Windows end on file
+        boundaries, and each commits its inserts together with the delete
+        of its files' stale chunks: a reader sees a file's old chunks or its
+        new ones, never both, and files committed before a failure stay
+        updated.
+
         Per-chunk errors (embedding failures, malformed UTF-8) are logged and
         skipped at the chunk level — one bad chunk does not abort the batch
         nor the rest of the file's chunks. Mirrors VectorStoreES's
@@ -525,12 +1385,12 @@ class VectorStoreAurora(VectorStoreBase):
         # vs orphans_deleted (reconcile replacements).
         chunks_unchanged = 0  # (cid, content_hash) row already existed → no embed, no INSERT
         chunks_inserted  = 0  # row didn't exist → embed + INSERT happened
-        # Every chunk content_hash this run produces (whether skipped as
-        # unchanged or freshly inserted). Used after the upload pass to
-        # delete rows whose content the run no longer produces.
+        # Every chunk content_hash this run has produced so far (whether
+        # skipped as unchanged or freshly inserted). A flushed file's stored
+        # rows whose hash isn't in here are stale and deleted.
         seen_hashes: set[str] = set()
         # Distinct filenames this run actually processed. The reconcile is
-        # scoped to this set so rows from files the run did NOT read are
+        # scoped to these files so rows from files the run did NOT read are
         # NEVER deleted — protects e.g. historical seeds whose source file
         # is not in the current run's input but whose chunks are still
         # legitimate. Without this scope the reconcile becomes a
@@ -549,164 +1409,220 @@ class VectorStoreAurora(VectorStoreBase):
             context, 'chunk_overlap_tokens', _CHUNK_OVERLAP_TOKENS_DEFAULT,
             minimum=0, maximum=chunk_max // 2,
         )
+        chunk_workers = get_chunk_workers()
         logger.info(
-            "Chunking %s/%s with max_tokens=%d, overlap=%d",
-            self.config.get('slug', '?'), context_name, chunk_max, chunk_overlap,
+            "Chunking %s/%s with max_tokens=%d, overlap=%d, workers=%d",
+            self.config.get('slug', '?'), context_name, chunk_max, chunk_overlap, chunk_workers,
         )
 
-        with get_session() as sess:
-            for fname, content_file, file_type, metadata in file_streams:
-                if not fname.endswith(".md"):
-                    logger.debug("Skipping non-markdown file: %s", fname)
+        # Chunks are planned (read, chunk, hash — the hashing and chunking in
+        # the chunk worker pool, see _iter_chunked_files) in windows of
+        # _UPLOAD_WINDOW_CHUNKS. The context's stored hashes are loaded once
+        # up front, so each window embeds only the chunks it doesn't already
+        # have — in token-budgeted batches run SYNC_CONCURRENCY at a time —
+        # without a SELECT or a serial embeddings round-trip per chunk. An
+        # unchanged corpus costs the hash load plus nothing per window.
+        tokens_per_chunk = min(EMBEDDING_TOKEN_LIMIT, chunk_max + chunk_overlap)
+        # Stored hashes, plus every hash this run inserts (duplicates within
+        # the run reuse the row their first occurrence inserts).
+        known_hashes: set[str] = set()
+        # Stored hashes by filename, for the reconcile; a file's entry is
+        # consumed when the window holding the file is flushed.
+        stored_by_file: dict[str | None, set[str]] = {}
+        window: list[tuple[str, int, int, str, str, dict]] = []
+        window_files: set[str] = set()
+        orphaned = 0
+        embed_batches = 0
+        stages = _UploadStageStats()
+        started = time.monotonic()
+
+        def _flush_window() -> None:
+            nonlocal successful, skipped, chunks_unchanged, chunks_inserted, embed_batches, orphaned
+            if not window and not window_files:
+                return
+            # One embed per distinct missing hash.
+            missing: dict[str, str] = {}
+            for _, _, _, chunk_content, chunk_hash, _ in window:
+                if chunk_hash not in known_hashes:
+                    missing.setdefault(chunk_hash, chunk_content)
+            vectors: dict[str, Any] = {}
+            if missing:
+                batches = _plan_embed_batches(list(missing.values()), tokens_per_chunk)
+                embed_batches += len(batches)
+                embed_started = time.monotonic()
+                results = run_async(_embed_batches_async(
+                    client, batches, SyncConcurrency(run_budget=self.run_budget),
+                ))
+                stages.embed_s += time.monotonic() - embed_started
+                stages.embedded += len(missing)
+                vectors = dict(zip(missing.keys(), results))
+
+            rows = []
+            for fname, chunk_index, total_chunks, chunk_content, chunk_hash, doc_metadata in window:
+                if chunk_hash in known_hashes:
+                    logger.debug(
+                        "Skipping unchanged content for %s (chunk %d/%d)",
+                        fname, chunk_index + 1, total_chunks,
+                    )
+                    successful += 1
+                    chunks_unchanged += 1
                     continue
-                files_seen += 1
-                files_processed.add(fname)
-
-                try:
-                    raw_content = content_file.read().decode("utf-8")
-                except Exception as exc:
-                    logger.error("Failed to read file %s: %s", fname, exc)
+                embedding = vectors[chunk_hash]
+                if isinstance(embedding, BaseException):
+                    logger.error(
+                        "Failed to process %s (chunk %d/%d): %s",
+                        fname, chunk_index + 1, total_chunks, embedding,
+                    )
                     skipped += 1
                     continue
+                rows.append((
+                    cid, chunk_content, chunk_hash, doc_metadata,
+                    embedding, doc_metadata.get("source_id"),
+                ))
+                known_hashes.add(chunk_hash)
+                successful += 1
+                chunks_inserted += 1
+            # Reconcile: the window's files' stored chunks this run no
+            # longer produces. Per-file scope means rows from files NOT
+            # touched this run are never deleted — a partial / incomplete
+            # input must never wipe orthogonal context data. Checked against
+            # every hash produced so far, so a chunk another file already
+            # re-produced is kept; one only produced later is deleted here
+            # and re-inserted (under its new file) when that file comes.
+            # Guard: while the run has produced no chunk at all, nothing is
+            # deleted (a transient zero-chunk run can never produce DELETEs).
+            stale: set[str] = set()
+            for fname in window_files:
+                stale |= stored_by_file.pop(fname, set())
+            stale = stale - seen_hashes if seen_hashes else set()
+            if rows or stale:
+                insert_started = time.monotonic()
+                # One short transaction per window, opened after embedding:
+                # the new chunks and the removal of the old land together.
+                with get_session() as sess:
+                    if rows:
+                        _copy_documents(sess, rows)
+                    deleted = sess.execute(text(
+                        "DELETE FROM documents WHERE context_id = :cid "
+                        "AND content_hash = ANY(CAST(:hs AS text[])) RETURNING content_hash"
+                    ), {"cid": cid, "hs": sorted(stale)}).scalars().all() if stale else []
+                    if deleted:
+                        _touch_contexts(sess, [cid])
+                known_hashes.difference_update(deleted)
+                orphaned += len(deleted)
+                stages.insert_s += time.monotonic() - insert_started
+                stages.inserted += len(rows)
+            window.clear()
+            window_files.clear()
 
-                chunks = _chunk_for_embedding(raw_content, max_tokens=chunk_max, overlap_tokens=chunk_overlap)
-                total_chunks = len(chunks)
-                if total_chunks > 1:
-                    logger.info(
-                        "Chunked %s into %d pieces (oversize content)",
-                        fname, total_chunks,
-                    )
+        with get_session() as sess:
+            for chunk_hash, fname in _load_content_hashes(sess, cid).items():
+                known_hashes.add(chunk_hash)
+                stored_by_file.setdefault(fname, set()).add(chunk_hash)
+
+        for fname, metadata, chunks in _iter_chunked_files(
+            file_streams, chunk_max, chunk_overlap, chunk_workers, stages,
+        ):
+            files_seen += 1
+            files_processed.add(fname)
+            window_files.add(fname)
+
+            if isinstance(chunks, BaseException):
+                logger.error("Failed to read file %s: %s", fname, chunks)
+                skipped += 1
+                continue
 
-                for chunk_index, chunk_content in enumerate(chunks):
-                    try:
-                        chunk_hash = hashlib.sha256(chunk_content.encode("utf-8")).hexdigest()
-                        seen_hashes.add(chunk_hash)
-
-                        # Content-hash skip: if this exact (context_id, content_hash)
-                        # is already present, do nothing.
-                        existing = sess.execute(text(
-                            "SELECT id FROM documents "
-                            "WHERE context_id=:cid AND content_hash=:h"
-                        ), {"cid": cid, "h": chunk_hash}).fetchone()
-                        if existing:
-                            logger.debug(
-                                "Skipping unchanged content for %s (chunk %d/%d)",
-                                fname, chunk_index + 1, total_chunks,
-                            )
-                            successful += 1
-                            chunks_unchanged += 1
-                            continue
-
-                        # New or changed content — embed and insert
-                        embedding = client.embed(chunk_content)
-                        doc_metadata = dict(metadata or {})
-                        doc_metadata["filename"] = fname
-                        doc_metadata["context_name"] = context_name
-                        doc_metadata["context_type"] = context.get("type", "")
-                        doc_metadata["extracted_at"] = datetime.utcnow().isoformat()
-                        if total_chunks > 1:
-                            doc_metadata["chunk_index"] = chunk_index
-                            doc_metadata["total_chunks"] = total_chunks
-
-                        sess.execute(text(
-                            "INSERT INTO documents "
-                            "(context_id, content, content_hash, metadata, embedding, source_id) "
-                            "VALUES (:cid, :c, :h, CAST(:m AS jsonb), CAST(:e AS vector), :sid)"
-                        ), {
-                            "cid": cid,
-                            "c": chunk_content,
-                            "h": chunk_hash,
-                            "m": json.dumps(doc_metadata),
-                            "e": str(embedding),
-                            "sid": (metadata or {}).get("source_id"),
-                        })
-                        successful += 1
-                        chunks_inserted += 1
-                    except Exception as exc:
-                        logger.error(
-                            "Failed to process %s (chunk %d/%d): %s",
-                            fname, chunk_index + 1, total_chunks, exc,
-                        )
-                        skipped += 1
-                        continue
-
-            # Reconcile: delete stale chunks of files the current run
-            # actually processed. Per-file scope (metadata.filename IN
-            # files_processed) means rows from files NOT touched this run
-            # are never deleted — a partial / incomplete input must never
-            # wipe orthogonal context data. Per-hash filter (content_hash
-            # NOT IN seen_hashes) cleans up chunks superseded by new
-            # content within the files we did process.
-            #
-            # Safety guards:
-            #   1. Empty seen_hashes — skip entirely (a transient zero-chunk
-            #      run can never produce DELETEs).
-            #   2. Empty files_processed — same; if no files were touched,
-            #      no per-file delete is meaningful.
-            if seen_hashes and files_processed:
-                sess.execute(text(
-                    "CREATE TEMP TABLE _seen_hashes (h text PRIMARY KEY) "
-                    "ON COMMIT DROP"
-                ))
-                sess.execute(text(
-                    "INSERT INTO _seen_hashes (h) "
-                    "SELECT DISTINCT unnest(CAST(:hs AS text[]))"
-                ), {"hs": list(seen_hashes)})
-                sess.execute(text(
-                    "CREATE TEMP TABLE _processed_files (f text PRIMARY KEY) "
-                    "ON COMMIT DROP"
-                ))
-                sess.execute(text(
-                    "INSERT INTO _processed_files (f) "
-                    "SELECT DISTINCT unnest(CAST(:fs AS text[]))"
-                ), {"fs": list(files_processed)})
-                reconcile = sess.execute(text(
-                    "DELETE FROM documents WHERE context_id = :cid "
-                    "AND metadata->>'filename' IN (SELECT f FROM _processed_files) "
-                    "AND content_hash NOT IN (SELECT h FROM _seen_hashes)"
-                ), {"cid": cid})
-                orphaned = reconcile.rowcount or 0
+            total_chunks = len(chunks)
+            if total_chunks > 1:
                 logger.info(
-                    "Reconcile: removed %d stale chunks across %d processed "
-                    "files for context_id=%s (%d distinct content hashes kept)",
-                    orphaned, len(files_processed), cid, len(seen_hashes),
-                )
-            else:
-                orphaned = 0
-                logger.warning(
-                    "upload_files produced 0 chunks for context_id=%s — skipping "
-                    "orphan reconcile so a transient empty run cannot wipe the "
-                    "context.", cid,
+                    "Chunked %s into %d pieces (oversize content)",
+                    fname, total_chunks,
                 )
 
-            # Structured per-context SYNC_DELTA marker (2026-05-27). One line,
-            # grep-friendly. Distinguishes the three meaningful outcomes of a
-            # delta sync that the unsplit `successful` counter could not:
-            #   - chunks_unchanged: existed at the same content_hash → cache hit
-            #   - chunks_inserted:  embedded + INSERTed (content_hash didn't exist)
-            #   - orphans_deleted:  removed by per-file reconcile (stale chunks
-            #                       in files the run touched but no longer
-            #                       produces this content_hash for)
-            #
-            # churn_ratio = orphans_deleted / chunks_inserted:
-            #   ~0.0 → inserts are net-new content (good, expected for genuine
-            #          upstream additions)
-            #   ~1.0 → every insert displaced an old chunk in the same file
-            #          (= re-extraction churn — extraction non-determinism,
-            #          chunking drift, etc. costs LLM money for ~0 new info)
-            if chunks_inserted > 0:
-                churn_pct_str = f"{int(round(100.0 * orphaned / chunks_inserted))}%"
-            else:
-                churn_pct_str = "N/A"
+            for chunk_index, (chunk_content, chunk_hash) in enumerate(chunks):
+                seen_hashes.add(chunk_hash)
+                doc_metadata = dict(metadata or {})
+                doc_metadata["filename"] = fname
+                doc_metadata["context_name"] = context_name
+                doc_metadata["context_type"] = context.get("type", "")
+                doc_metadata["extracted_at"] = datetime.utcnow().isoformat()
+                if total_chunks > 1:
+                    doc_metadata["chunk_index"] = chunk_index
+                    doc_metadata["total_chunks"] = total_chunks
+                window.append((fname, chunk_index, total_chunks, chunk_content, chunk_hash, doc_metadata))
+            # Windows end on file boundaries, so a file's inserts and its
+            # stale-chunk delete commit together.
+            if len(window) >= _UPLOAD_WINDOW_CHUNKS:
+                _flush_window()
+        _flush_window()
+
+        if seen_hashes and files_processed:
             logger.info(
-                "SYNC_DELTA: bot=%s context=%s files_processed=%d "
-                "chunks_unchanged=%d chunks_inserted=%d orphans_deleted=%d "
-                "chunks_skipped_error=%d churn_ratio=%s",
-                self.config.get('slug', '?'), context_name, len(files_processed),
-                chunks_unchanged, chunks_inserted, orphaned,
-                skipped, churn_pct_str,
+                "Reconcile: removed %d stale chunks across %d processed "
+                "files for context_id=%s (%d distinct content hashes kept)",
+                orphaned, len(files_processed), cid, len(seen_hashes),
+            )
+        else:
+            logger.warning(
+                "upload_files produced 0 chunks for context_id=%s — skipping "
+                "orphan reconcile so a transient empty run cannot wipe the "
+                "context.", cid,
             )
 
+        # Structured per-context SYNC_DELTA marker (2026-05-27). One line,
+        # grep-friendly. Distinguishes the three meaningful outcomes of a
+        # delta sync that the unsplit `successful` counter could not:
+        #   - chunks_unchanged: existed at the same content_hash → cache hit
+        #   - chunks_inserted:  embedded + INSERTed (content_hash didn't exist)
+        #   - orphans_deleted:  removed by per-file reconcile (stale chunks
+        #                       in files the run touched but no longer
+        #                       produces this content_hash for)
+        #
+        # churn_ratio = orphans_deleted / chunks_inserted:
+        #   ~0.0 → inserts are net-new content (good, expected for genuine
+        #          upstream additions)
+        #   ~1.0 → every insert displaced an old chunk in the same file
+        #          (= re-extraction churn — extraction non-determinism,
+        #          chunking drift, etc. costs LLM money for ~0 new info)
+        if chunks_inserted > 0:
+            churn_pct_str = f"{int(round(100.0 * orphaned / chunks_inserted))}%"
+        else:
+            churn_pct_str = "N/A"
+        #
+        # chunks_per_sec covers every chunk the run accounted for
+        # (unchanged + inserted + errored) over the whole upload,
+        # including reconcile; embed_batches is the embeddings.create
+        # request count (fakes without embed_many still count batches).
+        elapsed = time.monotonic() - started
+        chunks_total = chunks_unchanged + chunks_inserted + skipped
+        logger.info(
+            "SYNC_DELTA: bot=%s context=%s files_processed=%d "
+            "chunks_unchanged=%d chunks_inserted=%d orphans_deleted=%d "
+            "chunks_skipped_error=%d churn_ratio=%s "
+            "embed_batches=%d elapsed_s=%.1f chunks_per_sec=%.1f",
+            self.config.get('slug', '?'), context_name, len(files_processed),
+            chunks_unchanged, chunks_inserted, orphaned,
+            skipped, churn_pct_str,
+            embed_batches, elapsed, chunks_total / elapsed if elapsed > 0 else 0.0,
+        )
+        # Per-stage throughput of the same run. chunk_wait_s is how long
+        # the embed/insert stage sat waiting on the chunk workers: near 0
+        # means chunking kept ahead (the run is bound by embedding or the
+        # DB), close to elapsed_s means it is CPU-bound on chunking.
+        logger.info(
+            "SYNC_STAGES: bot=%s context=%s chunk_workers=%d "
+            "files_chunked=%d chunks=%d chunk_cpu_s=%.1f chunk_wait_s=%.1f "
+            "chunks_per_cpu_sec=%.1f embedded=%d embed_s=%.1f "
+            "embedded_per_sec=%.1f inserted=%d insert_s=%.1f inserted_per_sec=%.1f",
+            self.config.get('slug', '?'), context_name, chunk_workers,
+            stages.files_chunked, stages.chunks, stages.chunk_cpu_s, stages.chunk_wait_s,
+            stages.chunks / stages.chunk_cpu_s if stages.chunk_cpu_s > 0 else 0.0,
+            stages.embedded, stages.embed_s,
+            stages.embedded / stages.embed_s if stages.embed_s > 0 else 0.0,
+            stages.inserted, stages.insert_s,
+            stages.inserted / stages.insert_s if stages.insert_s > 0 else 0.0,
+        )
+
         if callable(callback):
             callback(successful)
         if skipped:
@@ -748,77 +1664,46 @@ class VectorStoreAurora(VectorStoreBase):
         """Pure date-desc browse — returns the calendar-newest distinct
         documents in the context. Bypasses pgvector + tsvector entirely.
 
-        Date field is resolved against a small list of known names because
-        contexts disagree on which key holds the document date:
+        Reads ``documents.doc_date``, normalized at ingest from whichever
+        metadata key holds the date in this context (see _doc_date):
           - legal_advisor_letters / opinions: metadata->>'PublicationDate'
           - committee_decisions / ethics_decisions: metadata->>'תאריך'
+          - government_decisions: metadata->>'publish_date' (DD.MM.YYYY)
           - older extraction schema: metadata->'extracted_data'->>'<same>'
+        Docs with a null or unparseable date have no doc_date and are
+        skipped (they can't be ranked by recency anyway). If the user wants
+        those, REGULAR or METADATA_BROWSE is the right tool.
 
         Dedup: each upstream document can be split into N chunks (chunk_index
-        0..N-1, sharing `filename` / `source_id`). The query returns one row
-        per dedup key (lowest chunk_index — usually 0 — picked deterministically
-        via ROW_NUMBER). Without this the LLM saw 5 copies of the same letter.
-
-        Filter: only documents whose date matches the ISO `YYYY-MM-DD` shape
-        are eligible. Docs with a null or unparseable date are skipped (they
-        can't be ranked by recency anyway). If the user wants those, REGULAR
-        or METADATA_BROWSE is the right tool.
+        0..N-1, sharing `filename` / `source_id`). Only a document's first
+        chunk is returned — without this the LLM saw 5 copies of the same
+        letter. The doc_date predicate and the chunk-0 predicate match the
+        partial index documents_context_doc_date (migration 0023), so this is
+        an index range scan that stops after ``num_results`` rows instead of
+        ranking every row of the context.
         """
         bot = self.config["slug"]
-        with get_session() as sess:
-            row = sess.execute(text(
-                "SELECT id FROM contexts WHERE bot=:bot AND name=:name"
-            ), {"bot": bot, "name": context_name}).fetchone()
-            if not row:
+        with get_session(READ) as sess:
+            cid = _context_ids.resolve(sess, bot, context_name)
+            if cid is None:
                 logger.warning(
                     "recency_search: context (%s, %s) not found", bot, context_name
                 )
                 return {"hits": {"hits": []}}
-            cid = str(row[0])
 
             md_filter_sql, md_params = _build_metadata_filter_sql(metadata_filter)
 
+            # LIMIT inlined: a generic plan costs `LIMIT $n` as 10% of the
+            # rows, which can lose the index walk to a sort (see _context_id_sql).
             rows = sess.execute(text(f"""
-                WITH dated AS (
-                  SELECT
-                    id, content, metadata,
-                    COALESCE(
-                      NULLIF(metadata->>'תאריך', ''),
-                      NULLIF(metadata->>'תאריך_מכתב', ''),
-                      NULLIF(metadata->>'PublicationDate', ''),
-                      NULLIF(metadata->'extracted_data'->>'תאריך', ''),
-                      NULLIF(metadata->'extracted_data'->>'תאריך_מכתב', ''),
-                      NULLIF(metadata->'extracted_data'->>'PublicationDate', '')
-                    ) AS doc_date,
-                    COALESCE(
-                      NULLIF(metadata->>'filename', ''),
-                      NULLIF(metadata->>'source_id', ''),
-                      id::text
-                    ) AS dedup_key
-                  FROM documents
-                  WHERE context_id = :cid{md_filter_sql}
-                ),
-                ranked AS (
-                  SELECT
-                    id, content, metadata, doc_date,
-                    ROW_NUMBER() OVER (
-                      PARTITION BY dedup_key
-                      ORDER BY COALESCE((metadata->>'chunk_index')::int, 0) ASC, id ASC
-                    ) AS rn
-                  FROM dated
-                  WHERE doc_date IS NOT NULL
-                    -- Strict: realistic year (1900-2039), valid month (01-12), valid day (01-31).
-                    -- The loose `^[0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}}` admitted garbage like
-                    -- '3390-06-91' (committee_decisions _427.md), which sorted to position [0]
-                    -- under ORDER BY doc_date DESC and poisoned every recency query.
-                    AND doc_date ~ '^(19[0-9]{{2}}|20[0-3][0-9])-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])'
-                )
                 SELECT id, content, metadata
-                FROM ranked
-                WHERE rn = 1
+                FROM documents
+                WHERE context_id = :cid
+                  AND doc_date IS NOT NULL
+                  AND chunk_index = 0{md_filter_sql}
                 ORDER BY doc_date DESC, id DESC
-                LIMIT :limit
-            """), {"cid": cid, "limit": num_results, **md_params}).fetchall()
+                LIMIT {int(num_results)}
+            """), {"cid": cid, **md_params}).fetchall()
 
         hits = [{
             "_id": str(r[0]),
@@ -833,7 +1718,7 @@ class VectorStoreAurora(VectorStoreBase):
         query_text: str,
         search_mode,           # SearchModeConfig — kept for ES-parity signature
         embedding: list[float],
-        num_results: int = 7,
+        num_results: int = _DEFAULT_NUM_RESULTS,
         explain: bool = False,
         metadata_filter: dict | None = None,
         _qd_skip: bool = False,
@@ -896,6 +1781,13 @@ class VectorStoreAurora(VectorStoreBase):
                 context_name, ctx_strategy, _LEXICAL_STRATEGY_TSQUERY,
             )
             ctx_strategy = _LEXICAL_STRATEGY_TSQUERY
+        fusion = (ctx_cfg or {}).get("fusion_strategy", _FUSION_STRATEGY_PYTHON)
+        if fusion not in _FUSION_STRATEGIES:
+            logger.warning(
+                "context %s: unknown fusion_strategy=%r, falling back to %s",
+                context_name, fusion, _FUSION_STRATEGY_PYTHON,
+            )
+            fusion = _FUSION_STRATEGY_PYTHON
 
         # Query-side law detection + filter-mismatch guard (with prefix-less resolution). Runs on
         # EVERY israeli_laws vector search. Two ways to find the law the QUERY is about:
@@ -913,12 +1805,9 @@ class VectorStoreAurora(VectorStoreBase):
         if context_name == "israeli_laws" and use_vector and not _qd_skip:
             detected = None
             resolved = None  # prefix-less whole-query match; only computed when detected is None & filter present
-            with get_session() as ds:
-                _drow = ds.execute(text(
-                    "SELECT id FROM contexts WHERE bot=:bot AND name=:name"
-                ), {"bot": bot, "name": context_name}).fetchone()
-                if _drow:
-                    _cid = str(_drow[0])
+            with get_session(READ) as ds:
+                _cid = _context_ids.resolve(ds, bot, context_name)
+                if _cid is not None:
                     detected = _detect_law_in_query(ds, _cid, query_text, _QUERY_DETECT_THRESHOLD)
                     if detected is None and _q_law_norm:
                         m = _best_law_match(ds, _cid, query_text, _QUERY_RESOLVE_THRESHOLD)
@@ -957,135 +1846,179 @@ class VectorStoreAurora(VectorStoreBase):
                     hit.setdefault("_source", {}).setdefault("metadata", {})["_query_detected_law"] = override
                 return df
 
-        # Resolve context_id from (bot, name) — small extra round-trip but
-        # keeps the search call self-contained and resilient to context
-        # rows being added/removed mid-process.
-        with get_session() as sess:
-            # HNSW `ef_search` per-context — see _HNSW_EF_SEARCH_DEFAULT for
-            # rationale. Default 100 trades a small latency hit for recall on
-            # small Hebrew corpora; overridable per context in
-            # `specs/<bot>/config.yaml`. SET LOCAL keeps the override scoped
-            # to this txn so it doesn't leak across the connection pool.
-            # (See migration 0007 for the ivfflat → hnsw swap rationale.)
-            # Only set when we'll actually use the vector branch — saves a
-            # no-op SET on BM25-only modes.
-            if use_vector:
-                ef = _resolve_int_setting(
-                    ctx_cfg, 'hnsw_ef_search', _HNSW_EF_SEARCH_DEFAULT,
-                    minimum=_HNSW_EF_SEARCH_MIN, maximum=_HNSW_EF_SEARCH_MAX,
-                )
-                sess.execute(text(f"SET LOCAL hnsw.ef_search = {ef}"))
-
-            row = sess.execute(text(
-                "SELECT id FROM contexts WHERE bot=:bot AND name=:name"
-            ), {"bot": bot, "name": context_name}).fetchone()
-            if not row:
-                logger.warning("search: context (%s, %s) not found", bot, context_name)
-                return {"hits": {"hits": []}}
-            cid = str(row[0])
-
-            # A law_name filter is a scoping directive ("answer from THIS law").
-            # An empty-string law_name (LLM bug) normalizes to "" — treat as no filter.
-            law_value = (metadata_filter or {}).get("law_name")
-            law_norm = _normalize_law_name(str(law_value)) if law_value is not None else None
-            if law_value is not None and not law_norm:
-                logger.warning("search: empty law_name filter for (%s, %s); ignoring it", bot, context_name)
-                metadata_filter = {k: v for k, v in metadata_filter.items() if k != "law_name"} or None
-                law_norm = None
-            has_law_name = law_norm is not None
-            other_keys = bool({k for k in (metadata_filter or {}) if k != "law_name"})
-
-            md_filter_sql, md_params = _build_metadata_filter_sql(metadata_filter)
-
-            if has_law_name:
-                # Scope-preserving recall: exact vector KNN over the law's docs, regardless
-                # of the mode's use_vector flag, via a MATERIALIZED CTE (no global HNSW
-                # post-filter). Wider fetch than default — the right section may sit deeper
-                # than num_results*5 within a multi-hundred-doc law, and a lexical-only mode
-                # has no lexical safety net.
-                rest_sql, rest_params = _build_metadata_filter_sql(
-                    {k: v for k, v in metadata_filter.items() if k != "law_name"})
-                scoped_fetch = max(fetch, num_results * 15)
-                vector_rows = _scoped_vector_knn(sess, cid, law_norm, rest_sql, rest_params,
-                                                 embedding, scoped_fetch)
-                # (Observability log is emitted in Task 4, after the lexical branch and the
-                # fallback decision, where scoped_lex and gate_fired are also known.)
-            elif use_vector:
-                vector_rows = sess.execute(text(
+        # Resolve context_id from (bot, name). Served from the in-process
+        # cache after the first lookup (see _ContextIdCache); a session that
+        # runs no statement never checks out a connection.
+        with get_session(READ) as sess:
+            cid = _context_ids.resolve(sess, bot, context_name)
+        if cid is None:
+            logger.warning("search: context (%s, %s) not found", bot, context_name)
+            return {"hits": {"hits": []}}
+
+        # A law_name filter is a scoping directive ("answer from THIS law").
+        # An empty-string law_name (LLM bug) normalizes to "" — treat as no filter.
+        law_value = (metadata_filter or {}).get("law_name")
+        law_norm = _normalize_law_name(str(law_value)) if law_value is not None else None
+        if law_value is not None and not law_norm:
+            logger.warning("search: empty law_name filter for (%s, %s); ignoring it", bot, context_name)
+            metadata_filter = {k: v for k, v in metadata_filter.items() if k != "law_name"} or None
+            law_norm = None
+        has_law_name = law_norm is not None
+        other_keys = bool({k for k in (metadata_filter or {}) if k != "law_name"})
+
+        md_filter_sql, md_params = _build_metadata_filter_sql(metadata_filter)
+
+        # The vector and lexical branches are independent queries; each runs
+        # in its own session (own pooled connection, own transaction for the
+        # SET LOCALs) and _run_branches issues them concurrently, so a hybrid
+        # search costs max(vector, lexical) instead of their sum.
+        def _vector_branch():
+            with get_session(READ) as vs:
+                # HNSW `ef_search` per-context — see _HNSW_EF_SEARCH_DEFAULT for
+                # rationale. Default 100 trades a small latency hit for recall on
+                # small Hebrew corpora; overridable per context in
+                # `specs/<bot>/config.yaml`. SET LOCAL keeps the override scoped
+                # to this txn so it doesn't leak across the connection pool.
+                # (See migration 0007 for the ivfflat → hnsw swap rationale.)
+                # Only set when we'll actually use the vector branch — saves a
+                # no-op SET on BM25-only modes.
+                if use_vector:
+                    ef = _resolve_int_setting(
+                        ctx_cfg, 'hnsw_ef_search', _HNSW_EF_SEARCH_DEFAULT,
+                        minimum=_HNSW_EF_SEARCH_MIN, maximum=_HNSW_EF_SEARCH_MAX,
+                    )
+                    vs.execute(text(f"SET LOCAL hnsw.ef_search = {ef}"))
+                if has_law_name:
+                    # Scope-preserving recall: exact vector KNN over the law's docs, regardless
+                    # of the mode's use_vector flag, via a MATERIALIZED CTE (no global HNSW
+                    # post-filter). Wider fetch than default — the right section may sit deeper
+                    # than num_results*5 within a multi-hundred-doc law, and a lexical-only mode
+                    # has no lexical safety net.
+                    rest_sql, rest_params = _build_metadata_filter_sql(
+                        {k: v for k, v in metadata_filter.items() if k != "law_name"})
+                    scoped_fetch = max(fetch, num_results * 15)
+                    # (Observability log is emitted in Task 4, after the lexical branch and the
+                    # fallback decision, where scoped_lex and gate_fired are also known.)
+                    return _scoped_vector_knn(vs, cid, law_norm, rest_sql, rest_params,
+                                              embedding, scoped_fetch)
+                # Context id and LIMIT are inlined so the prepared statement's
+                # generic plan keeps the (partial) HNSW index scan — see
+                # _context_id_sql; a `LIMIT $n` is costed as 10% of the rows.
+                return vs.execute(text(
                     f"""
                     SELECT id, content, metadata, 1 - (embedding <=> CAST(:emb AS vector)) AS score
                     FROM documents
-                    WHERE context_id = :cid{md_filter_sql}
+                    WHERE context_id = {_context_id_sql(cid)}{md_filter_sql}
                     ORDER BY embedding <=> CAST(:emb AS vector)
-                    LIMIT :limit
+                    LIMIT {int(fetch)}
                     """
-                ), {"cid": cid, "emb": str(embedding), "limit": fetch, **md_params}).fetchall()
-            else:
-                vector_rows = []
-
-            # Lexical scoring branch. Two strategies, opt-in per context:
-            #
-            # 1. `tsquery` (default, back-compat): prefix-OR BM25.
-            #    Can't use plainto_tsquery directly — it ANDs every term
-            #    and uses exact match, both fatal for Hebrew:
-            #      - AND fails on stopword-y interrogatives ("מהן", "מה")
-            #      - construct/absolute alternation ("ועדת"/"ועדה"/"ועדות")
-            #        misses 90%+ of relevant docs under exact match
-            #    Mitigation: prefix-OR `term:*` against the weighted
-            #    multi-field tsv (migration 0004) via ts_rank_cd.
-            #
-            # 2. `trigram`: pg_trgm.word_similarity() ranking.
-            #    Hebrew-aware via character 3-grams — bridges construct
-            #    alternation natively. Index: `documents_content_trgm`
-            #    (migration 0015). On the prod query, surfaced 3/3
-            #    prod-cited sections in top-8; tsquery hit 0/3.
-            if not use_lexical:
-                lexical_rows = []
-            elif ctx_strategy == _LEXICAL_STRATEGY_TRIGRAM:
-                # Lower the threshold so word_similarity returns hits in the
-                # 0.1-0.6 range we observed as legitimately relevant.
-                sess.execute(text(
-                    f"SET LOCAL pg_trgm.word_similarity_threshold = "
-                    f"{_TRIGRAM_WORD_SIMILARITY_THRESHOLD}"
-                ))
-                # `%>` is the word-similarity-above-threshold operator and
-                # is GIN-indexable via gin_trgm_ops — short-circuits before
-                # word_similarity() runs against every row.
-                lexical_rows = sess.execute(text(
+                ), {"emb": _vector_param(vs, embedding), **md_params}).fetchall()
+
+        # Lexical scoring branch. Two strategies, opt-in per context:
+        #
+        # 1. `tsquery` (default, back-compat): prefix-OR BM25.
+        #    Can't use plainto_tsquery directly — it ANDs every term
+        #    and uses exact match, both fatal for Hebrew:
+        #      - AND fails on stopword-y interrogatives ("מהן", "מה")
+        #      - construct/absolute alternation ("ועדת"/"ועדה"/"ועדות")
+        #        misses 90%+ of relevant docs under exact match
+        #    Mitigation: prefix-OR `term:*` against the weighted
+        #    multi-field tsv (migration 0004) via ts_rank_cd.
+        #
+        # 2. `trigram`: pg_trgm.word_similarity() ranking.
+        #    Hebrew-aware via character 3-grams — bridges construct
+        #    alternation natively. Index: `documents_content_trgm`
+        #    (migration 0015). On the prod query, surfaced 3/3
+        #    prod-cited sections in top-8; tsquery hit 0/3.
+        #    Planner guard: a query whose trigrams are too common for the
+        #    index to pay off would plan a full scan of documents (~20s on
+        #    the 185K-doc law book) — EXPLAIN it first and use tsquery then.
+        #    The guard runs in the lexical statement's own session, so it
+        #    overlaps the vector branch instead of delaying both.
+        def _trigram_usable(sess) -> bool:
+            """Planner guard on ``sess`` (after _set_trigram_locals)."""
+            unindexed = _trigram_plan_guard(sess, cid, query_text, md_filter_sql, md_params, fetch)
+            if unindexed is None:
+                return True
+            logger.warning(
+                "search: trigram plan would read documents via %s (est. cost %.0f); "
+                "using tsquery for query=%r (%s, %s)",
+                unindexed.get("Index Name") or unindexed["Node Type"], unindexed["Total Cost"],
+                query_text, bot, context_name,
+            )
+            return False
+
+        ts_query_str = None
+        if use_lexical and ctx_strategy != _LEXICAL_STRATEGY_TRIGRAM:
+            ts_query_str = _build_prefix_or_tsquery(query_text)
+            # All tokens too short / stopwords — the lexical pass is skipped.
+
+        def _lexical_branch():
+            with get_session(READ) as ls:
+                ts_q = ts_query_str
+                if ctx_strategy == _LEXICAL_STRATEGY_TRIGRAM:
+                    _set_trigram_locals(ls)
+                    if _trigram_usable(ls):
+                        return ls.execute(
+                            text(_trigram_lexical_sql(cid, md_filter_sql, fetch)),
+                            {"q": query_text, **md_params},
+                        ).fetchall()
+                    ts_q = _build_prefix_or_tsquery(query_text)
+                    if not ts_q:
+                        return []
+                # to_tsquery in FROM runs once per statement; in the select
+                # list a generic plan (:q unknown) would re-run it per row.
+                return ls.execute(text(
                     f"""
                     SELECT id, content, metadata,
-                           word_similarity(:q, content) AS score
-                    FROM documents
+                           ts_rank_cd(tsv, query) AS score
+                    FROM documents, to_tsquery('simple', :q) AS query
                     WHERE context_id = :cid
-                      AND :q %> content{md_filter_sql}
+                      AND tsv @@ query{md_filter_sql}
                     ORDER BY score DESC
-                    LIMIT :limit
+                    LIMIT {int(fetch)}
                     """
-                ), {"cid": cid, "q": query_text, "limit": fetch, **md_params}).fetchall()
-            else:
-                ts_query_str = _build_prefix_or_tsquery(query_text)
-                if ts_query_str:
-                    lexical_rows = sess.execute(text(
-                        f"""
-                        SELECT id, content, metadata,
-                               ts_rank_cd(tsv, to_tsquery('simple', :q)) AS score
-                        FROM documents
-                        WHERE context_id = :cid
-                          AND tsv @@ to_tsquery('simple', :q){md_filter_sql}
-                        ORDER BY score DESC
-                        LIMIT :limit
-                        """
-                    ), {"cid": cid, "q": ts_query_str, "limit": fetch, **md_params}).fetchall()
+                ), {"cid": cid, "q": ts_q, **md_params}).fetchall()
+
+        run_lexical = use_lexical and (ctx_strategy == _LEXICAL_STRATEGY_TRIGRAM or bool(ts_query_str))
+        result = None
+        if fusion == _FUSION_STRATEGY_SQL and use_vector and run_lexical and not has_law_name:
+            # Single-statement variant of the two branches + _rrf_fuse below.
+            # law_name-scoped searches keep the Python path (scoped exact KNN,
+            # gate/fallback bookkeeping on the per-branch row counts).
+            with get_session(READ) as fs:
+                ef = _resolve_int_setting(
+                    ctx_cfg, 'hnsw_ef_search', _HNSW_EF_SEARCH_DEFAULT,
+                    minimum=_HNSW_EF_SEARCH_MIN, maximum=_HNSW_EF_SEARCH_MAX,
+                )
+                fs.execute(text(f"SET LOCAL hnsw.ef_search = {ef}"))
+                fused_strategy, fused_q = ctx_strategy, ts_query_str
+                if ctx_strategy == _LEXICAL_STRATEGY_TRIGRAM:
+                    _set_trigram_locals(fs)
+                    if _trigram_usable(fs):
+                        fused_q = query_text
+                    else:
+                        fused_strategy, fused_q = _LEXICAL_STRATEGY_TSQUERY, _build_prefix_or_tsquery(query_text)
+                if fused_q:
+                    result = _fused_search_sql(
+                        fs, cid, _vector_param(fs, embedding), fused_strategy, fused_q,
+                        md_filter_sql, md_params, fetch, num_results,
+                    )
                 else:
-                    # All tokens too short / stopwords — skip the lexical pass.
-                    lexical_rows = []
-            bm25_rows = lexical_rows  # kept name for back-compat with _rrf_fuse call below
-
-        # Reduce the scoped vector's weight only when we OVERRODE a lexical-only mode
-        # (e.g. SECTION_NUMBER), so an injected scoped-vector hit can't displace an exact
-        # §86 lexical match. For modes where vector was already on, weight is unchanged.
-        _vw = _SCOPED_OVERRIDE_VECTOR_WEIGHT if (has_law_name and not use_vector) else 1.0
-        result = _rrf_fuse(vector_rows, bm25_rows, num_results, vector_weight=_vw)
+                    # Trigram fell back to a tsquery with no usable terms:
+                    # vector-only, through the branch path below.
+                    run_lexical = False
+        if result is None:
+            vector_rows, bm25_rows = _run_branches(
+                _vector_branch if (has_law_name or use_vector) else None,
+                _lexical_branch if run_lexical else None,
+            )
+
+            # Reduce the scoped vector's weight only when we OVERRODE a lexical-only mode
+            # (e.g. SECTION_NUMBER), so an injected scoped-vector hit can't displace an exact
+            # §86 lexical match. For modes where vector was already on, weight is unchanged.
+            _vw = _SCOPED_OVERRIDE_VECTOR_WEIGHT if (has_law_name and not use_vector) else 1.0
+            result = _rrf_fuse(vector_rows, bm25_rows, num_results, vector_weight=_vw)
         # Spec §D observability + scope-preserving fallback. The fallback fires ONLY when
         # law_name is the SOLE filter key and the fully-scoped result is empty — i.e. the
         # named law has zero docs (a genuinely absent colloquial name like "חוק המכרזים").
@@ -1097,7 +2030,7 @@ class VectorStoreAurora(VectorStoreBase):
             logger.info("search scoped: law_name=%r scoped_vec=%d scoped_lex=%d gate_fired=%s (%s, %s)",
                         law_norm, len(vector_rows), len(bm25_rows), gate_fired, bot, context_name)
         if gate_fired:
-            with get_session() as rs:
+            with get_session(READ) as rs:
                 resolved = _resolve_law_name(rs, cid, law_norm, _LAW_NAME_RESOLVE_THRESHOLD)
             if resolved and _normalize_law_name(resolved) != law_norm:
                 logger.info("search: law_name=%r resolved to %r in (%s, %s); re-scoping",
@@ -1121,23 +2054,92 @@ class VectorStoreAurora(VectorStoreBase):
         if ctx_cfg and ctx_cfg.get("expand_to_document") and result["hits"]["hits"]:
             _ecap = _resolve_int_setting(ctx_cfg, "expand_max_chunks", _EXPAND_MAX_CHUNKS_DEFAULT,
                                          minimum=1, maximum=200)
-            with get_session() as es:
+            with get_session(READ) as es:
                 result["hits"]["hits"] = _expand_to_documents(es, cid, result["hits"]["hits"], _ecap)
         return result
 
+    def search_many(
+        self,
+        query_text: str,
+        embedding: list[float],
+        requests: list[dict],
+        timeout: float | None = None,
+        max_workers: int | None = None,
+    ) -> list[dict]:
+        """Run one query against several contexts concurrently.
+
+        ``requests`` is a list of ``{"context_name", "search_mode",
+        "num_results", "metadata_filter"}`` dicts; the same ``embedding`` is
+        reused for all of them. Each context runs ``search()`` in its own
+        worker thread and therefore on its own connection from the read pool
+        (every ``get_session(READ)`` checks one out), so the slowest context —
+        not the sum — bounds the latency.
+
+        Returns one block per request, in request order:
+        ``{"context_name", "status": "ok", "result": <search() dict>}`` or
+        ``{"context_name", "status": "timeout" | "error", "detail": str}``.
+        A context that misses ``timeout`` (seconds, shared by all contexts)
+        is reported as ``timeout`` while the others still return; the
+        searches run under a ``statement_deadline`` of the same length, so
+        its in-flight statement is cancelled and its connection goes back
+        to the pool instead of finishing in the background.
+        """
+        if not requests:
+            return []
+        workers = max_workers or min(len(requests), _SEARCH_MANY_MAX_WORKERS)
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="search_many")
+        try:
+            with statement_deadline(timeout) as deadline:
+                futures = [
+                    # copy_context so OTel spans opened inside search() parent
+                    # under the caller's request span, and the deadline applies.
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        self.search,
+                        r["context_name"], query_text, r.get("search_mode"), embedding,
+                        num_results=(
+                            _DEFAULT_NUM_RESULTS if r.get("num_results") is None else r["num_results"]
+                        ),
+                        metadata_filter=r.get("metadata_filter"),
+                    )
+                    for r in requests
+                ]
+                _, pending = wait(futures, timeout=timeout)
+                if pending and deadline is not None:
+                    deadline.cancel()  # don't race the deadline's own timer
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        blocks = []
+        for r, fut in zip(requests, futures):
+            name = r["context_name"]
+            # Futures still queued behind the worker cap at the deadline were
+            # cancelled by the shutdown above; a statement cancelled at the
+            # deadline can finish its future with TimeoutError before we look.
+            # Either way the context missed the deadline.
+            timed_out = not fut.done() or fut.cancelled()
+            exc = None if timed_out else fut.exception()
+            if timed_out or isinstance(exc, TimeoutError):
+                logger.warning("search_many: context %s missed the %.1fs deadline", name, timeout or 0)
+                detail = f"deadline exceeded after {timeout:.1f}s" if timeout is not None else "deadline exceeded"
+                blocks.append({"context_name": name, "status": "timeout", "detail": detail})
+            elif exc is not None:
+                logger.error("search_many: context %s failed: %s", name, exc)
+                blocks.append({"context_name": name, "status": "error", "detail": str(exc)})
+            else:
+                blocks.append({"context_name": name, "status": "ok", "result": fut.result()})
+        return blocks
+
     def government_distribution(self, context_name: str, decision_number: str) -> list[dict]:
         """One entry per distinct government_number with the given decision_number.
         Returns [] when <2 governments match — callers skip injection in that case.
         """
         bot = self.config.get("slug")
-        with get_session() as sess:
-            row = sess.execute(text(
-                "SELECT id FROM contexts WHERE bot=:bot AND name=:name"
-            ), {"bot": bot, "name": context_name}).fetchone()
-            if not row:
+        with get_session(READ) as sess:
+            cid = _context_ids.resolve(sess, bot, context_name)
+            if cid is None:
                 logger.warning("government_distribution: context (%s, %s) not found", bot, context_name)
                 return []
-            cid = str(row[0])
             rows = sess.execute(text(r"""
                 SELECT
                     metadata->>'government_number'          AS government_number,
@@ -1337,12 +2339,108 @@ def _build_prefix_or_tsquery(query_text: str) -> str:
     return " | ".join(parts)
 
 
+_branch_executor: ThreadPoolExecutor | None = None
+_branch_executor_lock = threading.Lock()
+
+
+def _get_branch_executor() -> ThreadPoolExecutor:
+    """Shared pool for the lexical half of a hybrid search (the vector half
+    runs on the calling thread). Lazily created; lives for the process."""
+    global _branch_executor
+    if _branch_executor is None:
+        with _branch_executor_lock:
+            if _branch_executor is None:
+                _branch_executor = ThreadPoolExecutor(
+                    max_workers=_BRANCH_MAX_WORKERS, thread_name_prefix="search_branch",
+                )
+    return _branch_executor
+
+
+def _run_branches(vector_fn, lexical_fn) -> tuple[list, list]:
+    """Run the vector and lexical retrieval branches, concurrently when both
+    are enabled, and return ``(vector_rows, lexical_rows)``.
+
+    A disabled branch is passed as None and yields ``[]``. Per-branch wall
+    time is recorded on an ``aurora.search.branches`` span so traces show
+    which branch is the long pole. An exception in either branch propagates
+    (same as when they ran back-to-back in one session).
+    """
+    try:
+        from opentelemetry import trace as otel_trace
+        tracer = otel_trace.get_tracer(__name__)
+    except ImportError:
+        tracer = None
+
+    timings: dict[str, float] = {}
+
+    def _timed(name, fn):
+        started = time.perf_counter()
+        try:
+            return fn()
+        finally:
+            timings[name] = (time.perf_counter() - started) * 1000.0
+
+    def _do(_span):
+        lexical_future = None
+        if vector_fn is not None and lexical_fn is not None:
+            lexical_future = _get_branch_executor().submit(
+                contextvars.copy_context().run, _timed, "lexical", lexical_fn,
+            )
+        vector_rows = _timed("vector", vector_fn) if vector_fn is not None else []
+        if lexical_future is not None:
+            lexical_rows = lexical_future.result()
+        elif lexical_fn is not None:
+            lexical_rows = _timed("lexical", lexical_fn)
+        else:
+            lexical_rows = []
+        if _span is not None:
+            _span.set_attribute("search.parallel", lexical_future is not None)
+            _span.set_attribute("search.vector_rows", len(vector_rows))
+            _span.set_attribute("search.lexical_rows", len(lexical_rows))
+            for name, ms in timings.items():
+                _span.set_attribute(f"search.{name}_ms", round(ms, 2))
+            if len(timings) == 2:
+                _span.set_attribute("search.long_pole", max(timings, key=timings.get))
+        return vector_rows, lexical_rows
+
+    if tracer is None:
+        return _do(None)
+    with tracer.start_as_current_span("aurora.search.branches") as span:
+        return _do(span)
+
+
+def _rrf_rank(vector_rows: list, bm25_rows: list, num_results: int, k: int,
+              bm25_weight: float, vector_weight: float) -> list[tuple[str, float, tuple]]:
+    """The weighted-RRF top ``num_results`` as ``(id, score, row)``.
+
+    Array-based: every candidate is keyed by the position of its id's first
+    appearance in the vector list followed by the BM25 list, the rank terms
+    are summed per key with one bincount (in list order, so the floats equal
+    a per-row accumulation), and a stable sort on -score breaks ties by that
+    position — vector rank first, then BM25 rank.
+    """
+    rows = list(vector_rows) + list(bm25_rows)
+    first_seen: dict[str, int] = {}
+    keys = np.fromiter(
+        (first_seen.setdefault(str(row[0]), pos) for pos, row in enumerate(rows)),
+        dtype=np.intp, count=len(rows),
+    )
+    num_vector = len(vector_rows)
+    terms = np.empty(len(rows))
+    terms[:num_vector] = vector_weight / np.arange(k + 1, k + 1 + num_vector)
+    terms[num_vector:] = bm25_weight / np.arange(k + 1, k + 1 + len(rows) - num_vector)
+    scores = np.bincount(keys, weights=terms, minlength=len(rows))
+    candidates = np.fromiter(first_seen.values(), dtype=np.intp, count=len(first_seen))
+    top = candidates[np.argsort(-scores[candidates], kind="stable")[:num_results]]
+    return [(str(rows[pos][0]), float(scores[pos]), rows[pos]) for pos in top.tolist()]
+
+
 def _rrf_fuse(
     vector_rows: list,
     bm25_rows: list,
     num_results: int,
-    k: int = 60,
-    bm25_weight: float = 3.0,
+    k: int = _RRF_K,
+    bm25_weight: float = _RRF_BM25_WEIGHT,
     vector_weight: float = 1.0,
 ) -> dict:
     """Weighted reciprocal-rank-fusion.
@@ -1378,24 +2476,10 @@ def _rrf_fuse(
             _span.set_attribute("rrf.bm25_candidates", len(bm25_rows))
             _span.set_attribute("rrf.num_results", num_results)
 
-        scores: dict[str, float] = {}
-        docs: dict[str, tuple] = {}
-
-        for rank, row in enumerate(vector_rows):
-            doc_id = str(row[0])
-            scores[doc_id] = scores.get(doc_id, 0.0) + vector_weight / (k + rank + 1)
-            docs[doc_id] = row
-
-        for rank, row in enumerate(bm25_rows):
-            doc_id = str(row[0])
-            scores[doc_id] = scores.get(doc_id, 0.0) + bm25_weight / (k + rank + 1)
-            docs.setdefault(doc_id, row)
-
-        ordered = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)[:num_results]
+        ordered = _rrf_rank(vector_rows, bm25_rows, num_results, k, bm25_weight, vector_weight)
 
         hits = []
-        for doc_id, fused_score in ordered:
-            row = docs[doc_id]
+        for doc_id, fused_score, row in ordered:
             hits.append({
                 "_id": doc_id,
                 "_score": fused_score,
@@ -1415,6 +2499,107 @@ def _rrf_fuse(
         return result
 
 
+# Lexical candidate CTE for tsquery; same statement as the search() lexical
+# branch, minus the row payload (fetched once, for the winners only). The
+# trigram CTE is _trigram_lexical_sql with ``columns="id"``.
+_FUSED_TSQUERY_CTE = """
+        SELECT id, ts_rank_cd(tsv, query) AS score
+        FROM documents, to_tsquery('simple', :q) AS query
+        WHERE context_id = :cid
+          AND tsv @@ query{md}
+        ORDER BY score DESC
+        LIMIT {limit}"""
+
+
+def _fused_search_sql(
+    sess,
+    cid,
+    embedding,
+    lexical_strategy: str,
+    lexical_query: str,
+    md_filter_sql: str,
+    md_params: dict,
+    fetch: int,
+    num_results: int,
+    k: int = _RRF_K,
+    bm25_weight: float = _RRF_BM25_WEIGHT,
+    vector_weight: float = 1.0,
+) -> dict:
+    """Hybrid search in one statement: the vector KNN and lexical candidate
+    lists (``fetch`` each) as MATERIALIZED CTEs, weighted RRF over their
+    1-based ranks, and the ``num_results`` cut — only the winners' content
+    and metadata leave the database.
+
+    Ranks and scores match _rrf_fuse over the same candidate lists (the
+    per-row terms are the same float8 divisions, summed in the same order),
+    and ties break the way _rrf_fuse's insertion order does: vector rank
+    first, then lexical rank. The caller owns the SET LOCALs
+    (``hnsw.ef_search``, _set_trigram_locals).
+    """
+    if lexical_strategy == _LEXICAL_STRATEGY_TRIGRAM:
+        lex_sql = _trigram_lexical_sql(cid, md_filter_sql, fetch, columns="id")
+    else:
+        lex_sql = _FUSED_TSQUERY_CTE.format(md=md_filter_sql, limit=int(fetch))
+    stmt = text(f"""
+        WITH vec AS MATERIALIZED (
+            SELECT id, embedding <=> CAST(:emb AS vector) AS distance
+            FROM documents
+            WHERE context_id = {_context_id_sql(cid)}{md_filter_sql}
+            ORDER BY embedding <=> CAST(:emb AS vector)
+            LIMIT {int(fetch)}
+        ),
+        lex AS MATERIALIZED ({lex_sql}
+        ),
+        fused AS (
+            SELECT id,
+                   coalesce(CAST(:vw AS float8) / (:k + v.rank), 0)
+                     + coalesce(CAST(:bw AS float8) / (:k + l.rank), 0) AS score,
+                   v.rank AS vector_rank,
+                   l.rank AS lexical_rank
+            FROM (SELECT id, row_number() OVER (ORDER BY distance) AS rank FROM vec) v
+            FULL JOIN (SELECT id, row_number() OVER (ORDER BY score DESC) AS rank FROM lex) l
+                USING (id)
+            ORDER BY score DESC, vector_rank NULLS LAST, lexical_rank
+            LIMIT :num_results
+        )
+        SELECT d.id, d.content, d.metadata, f.score
+        FROM fused f
+        JOIN documents d ON d.id = f.id
+        ORDER BY f.score DESC, f.vector_rank NULLS LAST, f.lexical_rank
+    """)
+    params = {
+        "cid": cid, "emb": embedding, "q": lexical_query,
+        "num_results": num_results, "k": k, "vw": vector_weight, "bw": bm25_weight,
+        **md_params,
+    }
+
+    try:
+        from opentelemetry import trace as otel_trace
+        tracer = otel_trace.get_tracer(__name__)
+    except ImportError:
+        tracer = None
+
+    def _do(_span):
+        started = time.perf_counter()
+        rows = sess.execute(stmt, params).fetchall()
+        if _span is not None:
+            _span.set_attribute("search.fused_ms", round((time.perf_counter() - started) * 1000.0, 2))
+            _span.set_attribute("rrf.returned", len(rows))
+        return {"hits": {"hits": [{
+            "_id": str(r[0]),
+            "_score": r[3],
+            "_source": {
+                "content": r[1],
+                "metadata": r[2] if isinstance(r[2], dict) else json.loads(r[2]),
+            },
+        } for r in rows]}}
+
+    if tracer is None:
+        return _do(None)
+    with tracer.start_as_current_span("aurora.search.fused_sql") as span:
+        return _do(span)
+
+
 _EXPAND_MAX_CHUNKS_DEFAULT = 12
 _EXPAND_TOTAL_CHUNKS_BUDGET = 40  # aggregate cap across all hits in one result (bounds tool-response size)
 
@@ -1432,6 +2617,10 @@ def _expand_to_documents(sess, cid, hits, max_chunks=_EXPAND_MAX_CHUNKS_DEFAULT,
     (in their original RRF position) instead of ballooning the tool response.
     Hits that pass through (no title, already-seen dedup, or budget-spent) do NOT
     count against the budget.
+
+    Siblings are found through the (context_id, document_key, chunk_index) index
+    (migration 0022): one LATERAL index scan per title, already in chunk order and
+    stopped at max_chunks + 1 rows (the extra row only flags truncation).
     """
     try:
         titles = []
@@ -1441,16 +2630,21 @@ def _expand_to_documents(sess, cid, hits, max_chunks=_EXPAND_MAX_CHUNKS_DEFAULT,
                 titles.append(t)
         if not titles:
             return hits
+        keys = {_document_key({"DocumentTitle": t}): t for t in titles}
         stmt = text(
-            "SELECT metadata->>'DocumentTitle' AS t, content, "
-            "COALESCE((metadata->>'chunk_index')::int, 0) AS ci "
-            "FROM documents "
-            "WHERE context_id = :cid AND metadata->>'DocumentTitle' IN :titles "
-            "ORDER BY t, ci, id"
-        ).bindparams(bindparam("titles", expanding=True))
+            "SELECT k.key, c.content "
+            "FROM unnest(CAST(:keys AS text[])) WITH ORDINALITY AS k(key, ord) "
+            "CROSS JOIN LATERAL ("
+            "  SELECT content, chunk_index, id FROM documents "
+            "  WHERE context_id = :cid AND document_key = k.key "
+            "  ORDER BY chunk_index, id "
+            f"  LIMIT {int(max_chunks) + 1}"
+            ") c "
+            "ORDER BY k.ord, c.chunk_index, c.id"
+        )
         by_title = {}
-        for row in sess.execute(stmt, {"cid": cid, "titles": titles}).fetchall():
-            by_title.setdefault(row[0], []).append(row[1])
+        for row in sess.execute(stmt, {"cid": cid, "keys": list(keys)}).fetchall():
+            by_title.setdefault(keys[row[0]], []).append(row[1])
         out, seen = [], set()
         used = 0
         for h in hits:
@@ -1,14 +1,58 @@
+import contextvars
+import sys
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
-from ..collect_sources import collect_context_sources
-from .._concurrency import RunBudget
+from ..collect_sources import collect_context_sources, iter_context_sources
+from .._concurrency import RunBudget, SharedSlots, get_context_concurrency, get_sync_concurrency
 from ..config import get_logger
 
 logger = get_logger(__name__)
 
 
+def _peak_rss_mb() -> float | None:
+    """Peak resident set size of this process so far, in MB (None where
+    the ``resource`` module is unavailable). A high-water mark: with
+    contexts synced in parallel it covers all of them."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS.
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def _timed_streams(file_streams, stats: dict):
+    """Pass ``file_streams`` through, counting them into ``stats['files']``
+    and the time spent waiting for each into ``stats['collect_s']``."""
+    it = iter(file_streams)
+    while True:
+        waited = time.monotonic()
+        try:
+            item = next(it)
+        except StopIteration:
+            stats['collect_s'] += time.monotonic() - waited
+            return
+        stats['collect_s'] += time.monotonic() - waited
+        stats['files'] += 1
+        yield item
+
+
 class VectorStoreBase(ABC):
 
+    # True when upload_files consumes file_streams as an iterator in one
+    # pass and delete_existing_files doesn't need the names up front: the
+    # context is then streamed from its sources to upload_files instead of
+    # collected into a list first.
+    streaming_upload = False
+    # True when a sync may run several contexts of one bot at once
+    # (SYNC_CONTEXT_CONCURRENCY): their get_or_create_vector_store /
+    # upload_files calls must not share unguarded per-bot state. Other
+    # backends sync their contexts one at a time.
+    parallel_contexts = False
+
     def __init__(self, config, config_dir, production):
         self.config = config
         self.config_dir = config_dir
@@ -19,6 +63,9 @@ class VectorStoreBase(ABC):
         # this in their own __init__. The OpenAI backend leaves it as None,
         # which short-circuits the extraction_cache wiring below.
         self.environment: str | None = None
+        # Set by vector_store_update for the duration of a sync run so
+        # upload_files can draw on the same OpenAI slot pool.
+        self.run_budget: RunBudget | None = None
 
     def _supports_extraction_cache(self) -> bool:
         """True iff this backend has Aurora connectivity (and therefore the
@@ -54,79 +101,197 @@ class VectorStoreBase(ABC):
         # One RunBudget for the whole sync run — shared across every
         # context's collect_context_sources call so the extraction
         # circuit breaker (EXTRACTION_MAX_LLM_CALLS_PER_RUN) is genuinely
-        # per-run, not per-context. See RunBudget.
-        run_budget = RunBudget()
-
-        for context_ in context:
-            context_name = context_['slug']
-            # `replace_context` selects WHICH contexts to process this run:
-            #   'all'       -> every context (delta semantics by default)
-            #   '<slug>'    -> just that context
-            #   'none'      -> explicit no-op for the data layer
-            #   None        -> treated as 'all' for back-compat (callers
-            #                  using positional / no-flag CLI)
-            # `force_rebuild` (when True AND this context is being processed)
-            # adds a DELETE-then-re-embed; without it, upload_files's
-            # content-hash skip handles the delta naturally.
-            normalized = replace_context if replace_context is not None else 'all'
-            if normalized == 'none':
-                # `reindex` is the explicit "force processing regardless of
-                # selection" override and beats even an explicit 'none'.
-                should_process = bool(reindex)
-            elif normalized == 'all' or normalized == context_name:
-                should_process = True
-            else:
-                should_process = bool(reindex)
-            should_force_rebuild = force_rebuild and should_process
-
-            # Force-rebuild path: purge extraction_cache rows for this
-            # (bot, context, current extractor_version) so the next
-            # collect_context_sources call re-extracts them rather than
-            # serving stale cached payloads.
-            if should_force_rebuild and extraction_cache is not None and bot_slug:
-                from ..dynamic_extraction import EXTRACTION_VERSION
+        # per-run, not per-context. It also carries the run-wide OpenAI
+        # slot pool, so contexts synced in parallel never exceed
+        # SYNC_CONCURRENCY in-flight calls between them. See RunBudget.
+        run_budget = RunBudget(openai_slots=SharedSlots(get_sync_concurrency()))
+        self.run_budget = run_budget
+
+        # Contexts are independent, so their data phase (collect + upload)
+        # runs SYNC_CONTEXT_CONCURRENCY at a time, largest first so the
+        # long pole starts immediately. Tool registration stays sequential
+        # and in config order below so self.tools is deterministic.
+        # Only backends that declare parallel_contexts run them concurrently.
+        parallel = 1
+        if self.parallel_contexts:
+            parallel = min(get_context_concurrency(), max(1, len(context)))
+        sizes = self._context_size_hints() if parallel > 1 else {}
+        order = sorted(range(len(context)), key=lambda i: -sizes.get(context[i]['slug'], 0))
+
+        def _run(i):
+            return self._sync_context(
+                context[i], replace_context, reindex, force_rebuild,
+                extraction_cache, run_budget, bot_slug,
+            )
+
+        started = time.monotonic()
+        results = [None] * len(context)
+        if parallel == 1:
+            for i in order:
+                results[i] = _run(i)
+        else:
+            with ThreadPoolExecutor(max_workers=parallel, thread_name_prefix="sync-context") as pool:
+                # copy_context per task: the fap_sync_context() OpenAI-key
+                # override lives in a contextvar the workers must inherit.
+                futures = {i: pool.submit(contextvars.copy_context().run, _run, i) for i in order}
+            errors = []
+            for i in range(len(context)):
                 try:
-                    extraction_cache.purge(
-                        bot=bot_slug,
-                        context=context_name,
-                        extractor_version=EXTRACTION_VERSION,
-                    )
+                    results[i] = futures[i].result()
                 except Exception as exc:
-                    logger.warning(
-                        "extraction_cache.purge failed for %s/%s: %s",
-                        bot_slug, context_name, exc,
-                    )
+                    logger.error("Sync failed for context %s: %s", context[i]['slug'], exc)
+                    errors.append(exc)
+            if errors:
+                raise errors[0]
+
+        for context_, (vector_store, _) in zip(context, results):
+            self.update_tool_resources(context_, vector_store)
+            self.update_tools(context_, vector_store)
 
-            vector_store = self.get_or_create_vector_store(
-                context_, context_name, should_process, force_rebuild=should_force_rebuild,
+        timings = [t for _, t in results if t is not None]
+        for t in sorted(timings, key=lambda t: -t['total_s']):
+            logger.info(
+                "SYNC_CONTEXT_TIMING: bot=%s context=%s files=%d "
+                "collect_s=%.1f upload_s=%.1f total_s=%.1f peak_rss_mb=%s",
+                bot_slug or '?', t['context'], t['files'],
+                t['collect_s'], t['upload_s'], t['total_s'], t['peak_rss_mb'],
             )
+        logger.info(
+            "SYNC_RUN_TIMING: bot=%s contexts=%d parallel=%d wall_s=%.1f sum_s=%.1f",
+            bot_slug or '?', len(timings), parallel,
+            time.monotonic() - started, sum(t['total_s'] for t in timings),
+        )
+        return self.tools, self.tool_resources
 
-            if should_process:
-                if force_rebuild or reindex:
-                    print(f'Processing context (force_rebuild={should_force_rebuild}, reindex={reindex}): {context_name}')
-                else:
-                    print(f'Processing context (delta): {context_name}')
-                file_streams = collect_context_sources(
-                    context_, self.config_dir,
-                    bot=bot_slug, extraction_cache=extraction_cache,
-                    run_budget=run_budget,
+    def _sync_context(self, context_, replace_context, reindex, force_rebuild,
+                      extraction_cache, run_budget, bot_slug):
+        """Data phase for one context: select, collect, upload.
+
+        Returns ``(vector_store, timing)``; ``timing`` is ``None`` when the
+        context wasn't selected for processing this run.
+        """
+        context_name = context_['slug']
+        # `replace_context` selects WHICH contexts to process this run:
+        #   'all'       -> every context (delta semantics by default)
+        #   '<slug>'    -> just that context
+        #   'none'      -> explicit no-op for the data layer
+        #   None        -> treated as 'all' for back-compat (callers
+        #                  using positional / no-flag CLI)
+        # `force_rebuild` (when True AND this context is being processed)
+        # adds a DELETE-then-re-embed; without it, upload_files's
+        # content-hash skip handles the delta naturally.
+        normalized = replace_context if replace_context is not None else 'all'
+        if normalized == 'none':
+            # `reindex` is the explicit "force processing regardless of
+            # selection" override and beats even an explicit 'none'.
+            should_process = bool(reindex)
+        elif normalized == 'all' or normalized == context_name:
+            should_process = True
+        else:
+            should_process = bool(reindex)
+        should_force_rebuild = force_rebuild and should_process
+
+        # Force-rebuild path: purge extraction_cache rows for this
+        # (bot, context, current extractor_version) so the next
+        # collect_context_sources call re-extracts them rather than
+        # serving stale cached payloads.
+        if should_force_rebuild and extraction_cache is not None and bot_slug:
+            from ..dynamic_extraction import EXTRACTION_VERSION
+            try:
+                extraction_cache.purge(
+                    bot=bot_slug,
+                    context=context_name,
+                    extractor_version=EXTRACTION_VERSION,
+                )
+            except Exception as exc:
+                logger.warning(
+                    "extraction_cache.purge failed for %s/%s: %s",
+                    bot_slug, context_name, exc,
                 )
-                file_streams = [((fname if self.production else '_' + fname), f, t, m) for fname, f, t, m in file_streams]
-                file_names = [fname for fname, _, _, _ in file_streams]
 
-                # Force-rebuild path: existing files were already wiped via
-                # get_or_create_vector_store. Skip the per-name delete.
-                if not should_force_rebuild:
-                    deleted = self.delete_existing_files(context_, vector_store, file_names)
-                    print(f'VECTOR STORE {context_name} deleted {deleted}')
+        vector_store = self.get_or_create_vector_store(
+            context_, context_name, should_process, force_rebuild=should_force_rebuild,
+        )
+        if not should_process:
+            return vector_store, None
 
-                total = len(file_streams)
-                self.upload_files(context_, context_name, vector_store, file_streams,
-                                  lambda x: print(f'VECTOR STORE {context_name} uploaded {x}/{total}'))
+        started = time.monotonic()
+        if force_rebuild or reindex:
+            print(f'Processing context (force_rebuild={should_force_rebuild}, reindex={reindex}): {context_name}')
+        else:
+            print(f'Processing context (delta): {context_name}')
+        if self.streaming_upload:
+            return vector_store, self._stream_context(
+                context_, context_name, vector_store, extraction_cache, run_budget, bot_slug, started,
+            )
+        file_streams = collect_context_sources(
+            context_, self.config_dir,
+            bot=bot_slug, extraction_cache=extraction_cache,
+            run_budget=run_budget,
+        )
+        file_streams = [((fname if self.production else '_' + fname), f, t, m) for fname, f, t, m in file_streams]
+        file_names = [fname for fname, _, _, _ in file_streams]
+        collected = time.monotonic()
 
-            self.update_tool_resources(context_, vector_store)
-            self.update_tools(context_, vector_store)
-        return self.tools, self.tool_resources
+        # Force-rebuild path: existing files were already wiped via
+        # get_or_create_vector_store. Skip the per-name delete.
+        if not should_force_rebuild:
+            deleted = self.delete_existing_files(context_, vector_store, file_names)
+            print(f'VECTOR STORE {context_name} deleted {deleted}')
+
+        total = len(file_streams)
+        self.upload_files(context_, context_name, vector_store, file_streams,
+                          lambda x: print(f'VECTOR STORE {context_name} uploaded {x}/{total}'))
+        finished = time.monotonic()
+        return vector_store, {
+            'context': context_name,
+            'files': total,
+            'collect_s': collected - started,
+            'upload_s': finished - collected,
+            'total_s': finished - started,
+            'peak_rss_mb': _peak_rss_mb(),
+        }
+
+    def _stream_context(self, context_, context_name, vector_store, extraction_cache,
+                        run_budget, bot_slug, started):
+        """Upload phase of _sync_context for a ``streaming_upload`` backend.
+
+        upload_files gets the files as extraction yields them, so only the
+        SYNC_COLLECT_WINDOW in flight are held in memory. The two phases
+        overlap: ``collect_s`` is the time upload_files spent waiting on
+        extraction, ``upload_s`` the rest.
+        """
+        stats = {'files': 0, 'collect_s': 0.0}
+        sources = iter_context_sources(
+            context_, self.config_dir,
+            bot=bot_slug, extraction_cache=extraction_cache,
+            run_budget=run_budget,
+        )
+        file_streams = (
+            ((fname if self.production else '_' + fname), f, t, m) for fname, f, t, m in sources
+        )
+        try:
+            self.upload_files(context_, context_name, vector_store, _timed_streams(file_streams, stats),
+                              lambda x: print(f'VECTOR STORE {context_name} uploaded {x}/{stats["files"]}'))
+        finally:
+            sources.close()
+        finished = time.monotonic()
+        return {
+            'context': context_name,
+            'files': stats['files'],
+            'collect_s': stats['collect_s'],
+            'upload_s': finished - started - stats['collect_s'],
+            'total_s': finished - started,
+            'peak_rss_mb': _peak_rss_mb(),
+        }
+
+    def _context_size_hints(self) -> dict[str, int]:
+        """Relative size per context slug, for largest-first scheduling.
+
+        Backends that can count what they already store override this;
+        the default keeps config order.
+        """
+        return {}
 
     @abstractmethod
     def get_or_create_vector_store(self, context, context_name, replace_context, force_rebuild=False):
@@ -17,7 +17,7 @@ from ..config import get_async_openai_client
 from .._concurrency import SyncConcurrency, async_retry_openai, run_async
 
 from .vector_store_base import VectorStoreBase
-from .vector_score_explainer import explain_vector_scores, combine_text_and_vector_scores
+from .vector_score_explainer import explain_vector_scores_many, combine_text_and_vector_scores
 from .search_config import SearchModeConfig
 from .search_modes import SEARCH_MODES, DEFAULT_SEARCH_MODE
 
@@ -272,24 +272,21 @@ class VectorStoreES(VectorStoreBase):
         
         # Add vector similarity explanations if explain=True
         if explain:
-            for hit in results['hits']['hits']:
+            hits = results['hits']['hits']
+            # Score every vector of every hit against the query in one batch
+            docs_vectors = [hit['_source']['vectors'] for hit in hits if 'vectors' in hit['_source']]
+            vector_scores = iter(explain_vector_scores_many(embedding, docs_vectors) if docs_vectors else [])
+
+            for hit in hits:
                 logger.debug(f"Processing explanation for document: {hit['_id']}")
                 
                 if 'vectors' in hit['_source']:
-                    logger.debug(f"Found {len(hit['_source']['vectors'])} vectors in document {hit['_id']}")
-                    
-                    # Calculate vector similarity scores
-                    vector_score = explain_vector_scores(
-                        embedding,
-                        hit['_source']['vectors']
-                    )
-                    
                     # Get text similarity explanation
                     text_score = hit.get('_explanation', {})
                     
                     hit['_explanation'] = combine_text_and_vector_scores(
                         text_score=text_score,
-                        vector_score=vector_score
+                        vector_score=next(vector_scores)
                     )
                     
                     logger.debug(f"Generated explanation for document {hit['_id']}")
@@ -383,7 +380,7 @@ class VectorStoreES(VectorStoreBase):
         ``SYNC_CONCURRENCY=1`` the async path is effectively serial and
         produces byte-equal output to the pre-parallel implementation.
         """
-        concurrency = SyncConcurrency()
+        concurrency = SyncConcurrency(run_budget=self.run_budget)
         return run_async(
             self._upload_files_async(context, context_name, vector_store, file_streams, callback, concurrency)
         )
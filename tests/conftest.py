@@ -86,3 +86,14 @@ def database_url(postgresql) -> str:
     info = postgresql.info
     # Use the psycopg v3 dialect; psycopg2 is not installed in this project.
     return f"postgresql+psycopg://{info.user}:{info.password}@{info.host}:{info.port}/{info.dbname}"
+
+
+@pytest.fixture
+def fresh_query_client_pool():
+    """Empty botnim.query's QueryClient pool around the test, so a client
+    built from a patched ``QueryClient`` neither serves nor outlives it."""
+    from botnim.query import _query_client_pool
+
+    _query_client_pool.clear()
+    yield _query_client_pool
+    _query_client_pool.clear()
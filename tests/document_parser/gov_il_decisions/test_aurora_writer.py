@@ -98,6 +98,50 @@ def test_round_trip(aurora_db, fake_embedder):
     assert row[0] == "gov_il_decisions"
 
 
+
+def test_write_decision_sets_doc_date(aurora_db, fake_embedder):
+    from botnim.document_parser.gov_il_decisions.aurora_writer import (
+        get_or_create_context,
+        write_decision,
+    )
+    from botnim.db.session import get_engine
+
+    cid = get_or_create_context("unified", "government_decisions")
+    write_decision(cid, page_id="dated", title="t", text="גוף",
+                   metadata={"תאריך": "2026-03-01"}, environment="staging")
+    write_decision(cid, page_id="undated", title="t", text="גוף אחר",
+                   metadata={}, environment="staging")
+    with get_engine().connect() as conn:
+        rows = dict(conn.execute(text(
+            "SELECT metadata->>'page_id', doc_date::text FROM documents WHERE context_id=:cid"
+        ), {"cid": cid}).fetchall())
+    assert rows == {"dated": "2026-03-01", "undated": None}
+
+
+def test_decisions_browse_by_publish_date(aurora_db, fake_embedder):
+    """gov.il's DD.MM.YYYY publish_date fills doc_date, so RECENCY_BROWSE
+    over government_decisions returns the newest decisions first."""
+    from botnim.document_parser.gov_il_decisions.aurora_writer import (
+        get_or_create_context,
+        write_decision,
+    )
+    from botnim.vector_store.search_modes import RECENCY_BROWSE_CONFIG
+    from botnim.vector_store.vector_store_aurora import VectorStoreAurora
+
+    cid = get_or_create_context("unified", "government_decisions")
+    for page_id, publish_date in [("dec1", "02.01.2025"), ("dec2", "12.03.2025"),
+                                  ("dec3", "28.11.2024"), ("dec4", "")]:
+        write_decision(cid, page_id=page_id, title=page_id, text=f"גוף {page_id}",
+                       metadata={"publish_date": publish_date}, environment="staging")
+
+    store = VectorStoreAurora(config={"slug": "unified", "name": "Unified"},
+                              config_dir=".", environment="staging")
+    hits = store.search(context_name="government_decisions", query_text="x",
+                        search_mode=RECENCY_BROWSE_CONFIG, embedding=[0.0] * 1536,
+                        num_results=10)["hits"]["hits"]
+    assert [h["_source"]["metadata"]["page_id"] for h in hits] == ["dec2", "dec1", "dec3"]
+
+
 def test_chunking_produces_multiple_rows(aurora_db, fake_embedder):
     from botnim.document_parser.gov_il_decisions.aurora_writer import write_decision
     from botnim.db.session import get_engine
@@ -0,0 +1,67 @@
+"""Golden test: the single-pass _chunk_for_embedding returns exactly the
+chunks of the multi-encode chunker it replaced
+(botnim.benchmark.chunker_throughput.loop_chunk_for_embedding), over the
+spec's extraction corpus and hand-picked tokenizer edge cases."""
+import pytest
+
+from botnim.benchmark.chunker_throughput import load_corpus, loop_chunk_for_embedding
+from botnim.vector_store.vector_store_aurora import _chunk_for_embedding, _get_tokenizer
+
+# (max_tokens, overlap_tokens): production default, and a small window that
+# makes nearly every document multi-chunk with overlap longer than many sections.
+SETTINGS = [(600, 80), (128, 64)]
+
+_WORDS = "סעיף 12 לחוק הכנסת, התשנ\"ד-1994 (להלן: \"החוק\") קובע כי"
+EDGE_CASES = {
+    "hebrew_sections": "".join(f"## סעיף {i}\n{_WORDS * (i % 7 + 1)}\n\n" for i in range(40)),
+    "preamble_then_sections": "מבוא\n\n" + "".join(f"## Part {i}\ntext {i}. " * 30 + "\n" for i in range(12)),
+    "whitespace_preamble": "  \n\n" + "".join(f"## h{i}\n" + "word " * 90 for i in range(8)),
+    "punctuation_paragraph_ends": "\n\n".join(f"{_WORDS} {i}." * 9 for i in range(30)),
+    "trailing_spaces_and_crlf": "\r\n\r\n".join(f"line {i} {_WORDS}   " * 6 for i in range(30)) + "  \n",
+    "indented_paragraphs": "\n\n".join(f"   {_WORDS}\t" * 8 for _ in range(25)),
+    "emoji_and_marks": "\n\n".join("שָׁלוֹם 👋🏽 — עוֹלָם… " * 20 for _ in range(20)),
+    "short_sections_under_overlap": "".join(f"## {i}\nא.\n" for i in range(400)),
+    "one_oversized_section": "## Only\n" + "word " * 3000,
+    "oversized_between_small": "## a\nsmall\n## b\n" + "x" * 9000 + "\n## c\nsmall again\n" * 3,
+    "no_blank_lines": "שורה אחת ארוכה מאוד " * 900,
+    "heading_without_space": "##NotAHeading\n" + "\n\n".join(["text " * 80] * 12),
+}
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    return load_corpus()
+
+
+def test_corpus_exercises_the_multi_chunk_paths(corpus):
+    enc = _get_tokenizer()
+    long_docs = [doc for doc in corpus if len(enc.encode(doc)) > 600]
+    assert len(long_docs) > 100
+    assert any(doc.count("\n## ") > 5 for doc in long_docs)
+
+
+@pytest.mark.parametrize("max_tokens,overlap", SETTINGS)
+def test_single_pass_matches_the_reference_on_the_spec_corpus(corpus, max_tokens, overlap):
+    mismatched = [
+        i for i, doc in enumerate(corpus)
+        if _chunk_for_embedding(doc, max_tokens=max_tokens, overlap_tokens=overlap)
+        != loop_chunk_for_embedding(doc, max_tokens, overlap)
+    ]
+    assert mismatched == []
+
+
+@pytest.mark.parametrize("name", sorted(EDGE_CASES))
+@pytest.mark.parametrize("max_tokens,overlap", SETTINGS + [(64, 32), (64, 1)])
+def test_single_pass_matches_the_reference_on_edge_cases(name, max_tokens, overlap):
+    doc = EDGE_CASES[name]
+    chunks = _chunk_for_embedding(doc, max_tokens=max_tokens, overlap_tokens=overlap)
+    assert chunks == loop_chunk_for_embedding(doc, max_tokens, overlap)
+
+
+def test_zero_overlap_carries_no_tail():
+    enc = _get_tokenizer()
+    doc = "".join(f"## s{i}\n" + "word " * 40 + "\n" for i in range(20))
+    chunks = _chunk_for_embedding(doc, max_tokens=128, overlap_tokens=0)
+    assert len(chunks) > 1
+    assert sum(c.count("## s") for c in chunks) == 20
+    assert all(len(enc.encode(c)) <= 128 for c in chunks)
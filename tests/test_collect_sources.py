@@ -310,3 +310,92 @@ def test_split_glob_reads_all_law_jsons(tmp_path: Path):
     assert names == ["חוק_א_סעיף_1.md", "חוק_ב_סעיף_1.md"]
     bodies = " ".join(c for _f, c, _t, _m in out)
     assert "תוכן א" in bodies and "תוכן ב" in bodies
+
+
+# ---------------------------------------------------------------------------
+# Streaming collection: iter_context_sources / iter_context_sources_async
+# ---------------------------------------------------------------------------
+
+import asyncio as _asyncio  # noqa: E402
+
+import pytest  # noqa: E402
+
+from botnim import collect_sources as _collect_sources  # noqa: E402
+from botnim.collect_sources import collect_context_sources, iter_context_sources  # noqa: E402
+
+
+class _FakeExtractor:
+    """Stands in for _get_metadata_for_content_async: no cache, no OpenAI;
+    records how many extractions are in flight at once."""
+
+    def __init__(self, fail_on=None):
+        self.started = 0
+        self.in_flight = 0
+        self.peak = 0
+        self.fail_on = fail_on
+
+    async def __call__(self, text, fname, ctype, concurrency, **kw):
+        self.started += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await _asyncio.sleep(0.001)
+            if fname == self.fail_on:
+                raise RuntimeError("extraction broke")
+            return {"title": text.splitlines()[1]}
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def fake_extractor(monkeypatch):
+    fake = _FakeExtractor()
+    monkeypatch.setattr(_collect_sources, "_get_metadata_for_content_async", fake)
+    return fake
+
+
+def _rows_context(tmp_path: Path, n: int, sources: int = 1) -> dict:
+    for s in range(sources):
+        _write_csv(tmp_path / f"rows{s}.csv", [{"body": f"row {s}-{i}"} for i in range(n)])
+    return {"name": "ctx", "slug": "ctx",
+            "sources": [{"type": "csv", "source": f"rows{s}.csv"} for s in range(sources)]}
+
+
+def _materialize(streams):
+    return [(fname, f.read(), t, m) for fname, f, t, m in streams]
+
+
+def test_iter_context_sources_matches_the_list_collector(tmp_path, fake_extractor):
+    context_ = _rows_context(tmp_path, 25, sources=2)
+    expected = _materialize(collect_context_sources(context_, tmp_path))
+    streamed = _materialize(iter_context_sources(context_, tmp_path, window=3))
+    assert streamed == expected
+    # Positional names continue across sources, as before.
+    assert [fname for fname, *_ in streamed][24:26] == ["ctx_24.md", "ctx_25.md"]
+    assert streamed[0][3]["title"] == "row 0-0"
+
+
+def test_iter_context_sources_bounds_extractions_in_flight(tmp_path, fake_extractor):
+    context_ = _rows_context(tmp_path, 40)
+    assert len(list(iter_context_sources(context_, tmp_path, window=4))) == 40
+    assert fake_extractor.peak <= 4
+
+
+def test_iter_context_sources_drops_failed_extractions(tmp_path, fake_extractor):
+    fake_extractor.fail_on = "ctx_2.md"
+    names = [fname for fname, *_ in iter_context_sources(_rows_context(tmp_path, 5), tmp_path, window=2)]
+    assert names == ["ctx_0.md", "ctx_1.md", "ctx_3.md", "ctx_4.md"]
+
+
+def test_closing_iter_context_sources_early_stops_extraction(tmp_path, fake_extractor):
+    streams = iter_context_sources(_rows_context(tmp_path, 500), tmp_path, window=4)
+    assert next(streams)[0] == "ctx_0.md"
+    streams.close()
+    assert fake_extractor.started < 500
+    assert fake_extractor.in_flight == 0
+
+
+def test_iter_context_sources_raises_source_errors(tmp_path, fake_extractor):
+    context_ = {"name": "ctx", "slug": "ctx", "type": "csv", "source": "missing.csv"}
+    with pytest.raises(FileNotFoundError):
+        list(iter_context_sources(context_, tmp_path))
@@ -236,3 +236,94 @@ async def test_error_isolation_one_failure_does_not_poison_batch():
     assert successes == [0, 1, 2, 3, 4, 6, 7, 8, 9]
     assert len(failures) == 1
     assert "doc 5" in str(failures[0])
+
+
+# ---------------------------------------------------------------------------
+# Parallel contexts: run-wide OpenAI slots + thread-safe RunBudget
+# ---------------------------------------------------------------------------
+
+def test_get_context_concurrency(monkeypatch):
+    from botnim._concurrency import get_context_concurrency
+    monkeypatch.delenv("SYNC_CONTEXT_CONCURRENCY", raising=False)
+    assert get_context_concurrency() == 3
+    monkeypatch.setenv("SYNC_CONTEXT_CONCURRENCY", "5")
+    assert get_context_concurrency() == 5
+    monkeypatch.setenv("SYNC_CONTEXT_CONCURRENCY", "0")
+    assert get_context_concurrency() == 1
+
+
+
+def test_get_chunk_workers(monkeypatch):
+    from botnim._concurrency import get_chunk_workers
+    monkeypatch.delenv("SYNC_CHUNK_WORKERS", raising=False)
+    assert get_chunk_workers() == min(4, os.cpu_count() or 1)
+    monkeypatch.setenv("SYNC_CHUNK_WORKERS", "6")
+    assert get_chunk_workers() == 6
+    monkeypatch.setenv("SYNC_CHUNK_WORKERS", "0")
+    assert get_chunk_workers() == 0
+    monkeypatch.setenv("SYNC_CHUNK_WORKERS", "-2")
+    assert get_chunk_workers() == 0
+
+
+def test_get_collect_window(monkeypatch):
+    from botnim._concurrency import DEFAULT_COLLECT_WINDOW, get_collect_window
+    monkeypatch.delenv("SYNC_COLLECT_WINDOW", raising=False)
+    assert get_collect_window() == DEFAULT_COLLECT_WINDOW
+    monkeypatch.setenv("SYNC_COLLECT_WINDOW", "32")
+    assert get_collect_window() == 32
+    monkeypatch.setenv("SYNC_COLLECT_WINDOW", "0")
+    assert get_collect_window() == 1
+    monkeypatch.setenv("SYNC_COLLECT_WINDOW", "lots")
+    assert get_collect_window() == DEFAULT_COLLECT_WINDOW
+
+
+def test_shared_slots_cap_calls_across_event_loops():
+    """Two contexts on two threads (two asyncio.run loops) with their own
+    SyncConcurrency(concurrency=4) still never exceed the run-wide 3 slots."""
+    import threading
+    from botnim._concurrency import RunBudget, SharedSlots
+
+    budget = RunBudget(openai_slots=SharedSlots(3))
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    async def fake_call():
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        with lock:
+            in_flight -= 1
+
+    async def one_context():
+        concurrency = SyncConcurrency(concurrency=4, run_budget=budget)
+        await asyncio.gather(*(concurrency.run_bounded(fake_call) for _ in range(8)))
+
+    threads = [threading.Thread(target=lambda: asyncio.run(one_context())) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert peak == 3
+
+
+def test_run_budget_ceiling_is_exact_across_threads():
+    import threading
+    from botnim._concurrency import RunBudget
+
+    budget = RunBudget(llm_call_ceiling=50)
+    granted = []
+
+    def worker():
+        granted.extend(budget.take_llm_call() for _ in range(40))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sum(granted) == 50
+    assert budget.llm_calls_made == 50
+    assert budget.circuit_broken
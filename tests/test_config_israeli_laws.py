@@ -10,7 +10,7 @@ def test_israeli_laws_context_registered():
     assert "israeli_laws" in ctx
     il = ctx["israeli_laws"]
     assert il.get("use_lexical_search") is True
-    assert il.get("lexical_strategy") == "trigram"
+    assert il.get("lexical_strategy") == "tsquery"
     srcs = il["sources"]
     assert any(s.get("type") == "split" and "*" in s.get("source", "") for s in srcs)
     fetcher = next(s["fetcher"] for s in srcs if s.get("fetcher"))
@@ -1,4 +1,7 @@
+import contextvars
 import os
+import threading
+import time
 
 import pytest
 from sqlalchemy import text
@@ -62,3 +65,152 @@ def test_session_executes_against_real_pg(database_url, monkeypatch):
     with get_session() as sess:
         result = sess.execute(text("SELECT 1")).scalar()
     assert result == 1
+
+
+@pytest.fixture
+def real_pg(database_url, monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", database_url)
+    from botnim.db import session as s
+    s._engine = None
+    yield s
+    s._engine = None
+
+
+def test_statement_deadline_times_out_slow_statement(real_pg):
+    started = time.monotonic()
+    with pytest.raises(TimeoutError, match="deadline exceeded"):
+        with real_pg.statement_deadline(0.5):
+            with get_session() as sess:
+                sess.execute(text("SELECT pg_sleep(10)"))
+    assert time.monotonic() - started < 5
+    assert get_engine().pool.checkedout() == 0
+    # The connection went back clean: no statement_timeout leaks past the txn.
+    with get_session() as sess:
+        assert sess.execute(text("SHOW statement_timeout")).scalar() == "0"
+
+
+def test_statement_deadline_cancel_interrupts_other_threads(real_pg):
+    errors = []
+    with real_pg.statement_deadline(60) as deadline:
+        def _slow():
+            try:
+                with get_session() as sess:
+                    sess.execute(text("SELECT pg_sleep(10)"))
+            except Exception as exc:  # noqa: BLE001
+                errors.append(exc)
+
+        worker = threading.Thread(target=contextvars.copy_context().run, args=(_slow,))
+        worker.start()
+        time.sleep(0.5)
+        assert deadline.cancel() == 1
+        worker.join(timeout=5)
+    assert not worker.is_alive()
+    assert len(errors) == 1 and isinstance(errors[0], TimeoutError)
+
+
+def test_expired_deadline_refuses_new_statements(real_pg):
+    with real_pg.statement_deadline(60) as deadline:
+        deadline.cancel()
+        with pytest.raises(TimeoutError):
+            with get_session() as sess:
+                sess.execute(text("SELECT 1"))
+    # Outside the block sessions are unaffected.
+    with get_session() as sess:
+        assert sess.execute(text("SELECT 1")).scalar() == 1
+
+
+def test_pool_sizing_from_env_with_role_overrides(monkeypatch):
+    monkeypatch.delenv("DB_HOST", raising=False)
+    monkeypatch.setenv("DATABASE_URL", "postgresql://u:p@h:5432/d")
+    monkeypatch.setenv("BOTNIM_DB_POOL_SIZE", "7")
+    monkeypatch.setenv("BOTNIM_DB_MAX_OVERFLOW", "3")
+    monkeypatch.setenv("BOTNIM_DB_READ_POOL_SIZE", "12")
+    monkeypatch.setenv("BOTNIM_DB_READ_POOL_TIMEOUT", "4")
+    from botnim.db import session as s
+    s._engine = None
+    write, read = get_engine(), get_engine(s.READ)
+    assert write is not read
+    assert (write.pool.size(), write.pool._max_overflow, write.pool._timeout) == (7, 3, 30)
+    assert (read.pool.size(), read.pool._max_overflow, read.pool._timeout) == (12, 3, 4)
+    with pytest.raises(ValueError, match="unknown engine role"):
+        get_engine("admin")
+
+
+def test_read_engine_uses_reader_endpoint_and_follows_write_reset(monkeypatch):
+    monkeypatch.setenv("DB_HOST", "aurora.example.com")
+    monkeypatch.setenv("DB_READER_HOST", "aurora-ro.example.com")
+    for var, value in (("DB_NAME", "d"), ("DB_USER", "u"), ("DB_PASSWORD", "p")):
+        monkeypatch.setenv(var, value)
+    from botnim.db import session as s
+    s._engine = None
+    read = get_engine(s.READ)
+    assert read.url.host == "aurora-ro.example.com"
+    assert get_engine().url.host == "aurora.example.com"
+    assert get_engine(s.READ) is read
+    monkeypatch.delenv("DB_READER_HOST")
+    s._engine = None
+    rebuilt = get_engine(s.READ)
+    assert rebuilt is not read
+    assert rebuilt.url.host == "aurora.example.com"
+
+
+def test_pool_stats_count_checkouts_per_role(real_pg):
+    with get_session(real_pg.READ) as sess:
+        sess.execute(text("SELECT 1"))
+    with get_session(real_pg.READ) as sess:
+        sess.execute(text("SELECT 1"))
+    with get_session() as sess:
+        sess.execute(text("SELECT 1"))
+    stats = real_pg.pool_stats()
+    assert stats["read"]["checkouts"] == 2
+    assert stats["write"]["checkouts"] == 1
+    assert stats["read"]["checked_out"] == 0
+    assert stats["read"]["timeouts"] == 0
+    assert stats["read"]["wait_ms_max"] >= 0
+
+
+def test_pool_timeout_is_counted(real_pg, monkeypatch):
+    from sqlalchemy.exc import TimeoutError as PoolTimeout
+    monkeypatch.setenv("BOTNIM_DB_READ_POOL_SIZE", "1")
+    monkeypatch.setenv("BOTNIM_DB_READ_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("BOTNIM_DB_READ_POOL_TIMEOUT", "1")
+    with get_session(real_pg.READ) as held:
+        held.execute(text("SELECT 1"))
+        with pytest.raises(PoolTimeout):
+            with get_session(real_pg.READ) as sess:
+                sess.execute(text("SELECT 1"))
+    assert real_pg.pool_stats()["read"]["timeouts"] == 1
+
+
+def test_read_role_does_not_prepare_by_default(real_pg):
+    with get_session(real_pg.READ) as sess:
+        read_conn = sess.connection().connection.driver_connection
+        assert (read_conn.prepare_threshold, read_conn.prepared_max_statements) == (None, 256)
+    with get_session() as sess:
+        write_conn = sess.connection().connection.driver_connection
+        assert (write_conn.prepare_threshold, write_conn.prepared_max_statements) == (5, 100)
+
+
+def test_prepared_statement_settings_per_role(real_pg, monkeypatch):
+    monkeypatch.setenv("BOTNIM_DB_PREPARED_MAX_STATEMENTS", "64")
+    monkeypatch.setenv("BOTNIM_DB_READ_PREPARE_THRESHOLD", "1")
+    monkeypatch.setenv("BOTNIM_DB_WRITE_PREPARE_THRESHOLD", "none")
+    with get_session(real_pg.READ) as sess:
+        read_conn = sess.connection().connection.driver_connection
+        assert (read_conn.prepare_threshold, read_conn.prepared_max_statements) == (1, 64)
+    with get_session() as sess:
+        write_conn = sess.connection().connection.driver_connection
+        assert (write_conn.prepare_threshold, write_conn.prepared_max_statements) == (None, 64)
+
+
+def test_deadline_timeout_statement_does_not_churn_prepared_statements(real_pg, monkeypatch):
+    monkeypatch.setenv("BOTNIM_DB_READ_PREPARE_THRESHOLD", "1")
+    for seconds in (30, 31, 32):
+        with real_pg.statement_deadline(seconds):
+            with get_session(real_pg.READ) as sess:
+                sess.execute(text("SELECT 1"))
+    with get_session(real_pg.READ) as sess:
+        prepared = sess.execute(text(
+            "SELECT statement FROM pg_prepared_statements WHERE statement LIKE '%statement_timeout%'"
+        )).scalars().all()
+    assert len(prepared) == 1
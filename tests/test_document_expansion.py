@@ -27,13 +27,16 @@ def aurora_db_filter(database_url, monkeypatch):
 
 
 def _seed_chunk(database_url, cid, content, title, chunk_index, embedding="[" + ",".join(["0.1"] * 1536) + "]"):
+    from botnim.vector_store.vector_store_aurora import _document_key
     eng = create_engine(database_url)
     with eng.begin() as c:
         c.execute(text(
-            "INSERT INTO documents (id, context_id, content, content_hash, metadata, embedding) "
-            "VALUES (gen_random_uuid(), :cid, :content, :h, CAST(:m AS jsonb), CAST(:e AS vector))"),
+            "INSERT INTO documents "
+            "(id, context_id, content, content_hash, metadata, embedding, document_key, chunk_index) "
+            "VALUES (gen_random_uuid(), :cid, :content, :h, CAST(:m AS jsonb), CAST(:e AS vector), :dk, :ci)"),
             {"cid": cid, "content": content, "h": "%s#%d" % (title, chunk_index),
-             "m": '{"DocumentTitle": "%s", "chunk_index": %d}' % (title, chunk_index), "e": embedding})
+             "m": '{"DocumentTitle": "%s", "chunk_index": %d}' % (title, chunk_index), "e": embedding,
+             "dk": _document_key({"DocumentTitle": title}), "ci": chunk_index})
 
 
 def _ctx(database_url, name="dctx"):
@@ -152,3 +155,29 @@ def test_expand_respects_total_budget(aurora_db_filter, database_url):
     assert not out[1]["_source"]["metadata"].get("_expanded_chunks")
     assert not out[2]["_source"]["metadata"].get("_expanded_chunks")
     assert len(out) == 3                                  # budget-spent hits are passed through, not dropped
+
+
+def test_expand_reads_siblings_through_the_chunk_map_index(aurora_db_filter, database_url):
+    """Expansion is one ordered scan of documents_document_chunks per title —
+    no JSONB extraction, no sort over the siblings."""
+    from sqlalchemy import event
+    from botnim.vector_store.vector_store_aurora import _expand_to_documents
+    cid = _ctx(database_url)
+    for i in (2, 0, 1):
+        _seed_chunk(database_url, cid, "c%d" % i, "החלטה ה", i)
+    statements = []
+    eng = create_engine(database_url)
+    with eng.connect() as c:
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(c, "before_cursor_execute", _capture)
+        out = _expand_to_documents(c, cid, [_hit("החלטה ה", "c1")])
+        event.remove(c, "before_cursor_execute", _capture)
+        assert out[0]["_source"]["content"] == "c0\n\nc1\n\nc2"
+        statement, parameters = statements[0]
+        c.exec_driver_sql("SET enable_seqscan = off")
+        c.exec_driver_sql("SET enable_bitmapscan = off")
+        plan = "\n".join(r[0] for r in c.exec_driver_sql("EXPLAIN " + statement, parameters))
+    assert "documents_document_chunks" in plan
+    assert "metadata" not in plan
@@ -579,3 +579,114 @@ async def test_collect_zero_budget_serves_stale_without_rewarm(cache, tmp_path):
     assert concurrency.stale_served_count == 1
     assert concurrency.rewarmed_count == 0
     assert concurrency.rewarm_budget_remaining == 0
+
+
+# -----------------------------------------------------------------------------
+# get_many / put_many — batched lookups and writes for the sync pipeline
+# -----------------------------------------------------------------------------
+
+def test_get_many_matches_get_with_fallback(cache):
+    cache.put("h_exact", "v2", payload={"t": "exact"}, bot="unified", context="ctx", document_type=None)
+    cache.put("h_exact", "v1", payload={"t": "older"}, bot="unified", context="ctx", document_type=None)
+    cache.put("h_old", "v0", payload={"t": "v0"}, bot="unified", context="ctx", document_type=None)
+    cache.put("h_old", "v1", payload={"t": "v1"}, bot="unified", context="ctx", document_type=None)
+    hashes = ["h_exact", "h_old", "h_missing", "h_exact"]
+
+    hits = cache.get_many(hashes, "v2", page_size=2)
+
+    assert set(hits) == {"h_exact", "h_old"}
+    for h in hits:
+        assert hits[h] == cache.get_with_fallback(h, "v2")
+    assert hits["h_old"]["stale"] is True and hits["h_old"]["from_version"] == "v1"
+    assert cache.get_many([], "v2") == {}
+
+
+def test_put_many_upserts_in_pages(cache):
+    cache.put("h0", "v1", payload={"n": "old"}, bot="unified", context="ctx", document_type=None)
+    entries = [(f"h{i}", {"n": i}, "text/markdown") for i in range(5)] + [("h4", {"n": "last"}, None)]
+
+    written = cache.put_many(entries, "v1", bot="unified", context="ctx", page_size=2)
+
+    assert written == 5
+    assert _row_count() == 5
+    assert cache.get("h0", "v1") == {"n": 0}
+    assert cache.get("h4", "v1") == {"n": "last"}
+    with get_session() as sess:
+        bot, context, document_type = sess.execute(text(
+            "SELECT bot, context, document_type FROM extraction_cache WHERE content_hash = 'h1'"
+        )).one()
+    assert (bot, context, document_type) == ("unified", "ctx", "text/markdown")
+
+
+def _wipe_l1():
+    import shutil
+    (REPO_ROOT / "cache" / "metadata.sqlite").unlink(missing_ok=True)
+    shutil.rmtree(REPO_ROOT / "cache" / "metadata", ignore_errors=True)
+
+
+def _fake_completion_titled(title):
+    async def _fake_completion(client, system_message):
+        resp = MagicMock()
+        resp.choices = [MagicMock(message=MagicMock(
+            content=f'{{"DocumentMetadata": {{"DocumentTitle": "{title}"}}}}'
+        ))]
+        return resp
+    return _fake_completion
+
+
+@pytest.mark.asyncio
+async def test_collect_prefetches_l2_once_and_writes_misses_in_one_batch(cache, tmp_path, monkeypatch):
+    """Cached rows come from one get_many (no per-document lookup); fresh
+    extractions land in one put_many (no per-row put)."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")  # the client is built before the faked call
+    values = [f"batched-{i}" for i in range(6)]
+    (tmp_path / "src.csv").write_text("body\n" + "\n".join(values) + "\n", encoding="utf-8")
+    context_ = {"name": "ctx_batch", "slug": "ctx_batch", "type": "csv",
+                "source": "src.csv", "fetcher": None}
+    _wipe_l1()
+    for v in values[:3]:
+        cache.put(_content_hash(f"body:\n{v}"), EXTRACTION_VERSION, payload={"title": f"cached {v}"},
+                  bot="unified", context="ctx_batch", document_type="text/markdown")
+
+    calls = {"get_many": 0, "put_many": 0}
+    get_many, put_many = cache.get_many, cache.put_many
+
+    def _count(name, fn):
+        def wrapper(*args, **kwargs):
+            calls[name] += 1
+            return fn(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(cache, "get_many", _count("get_many", get_many))
+    monkeypatch.setattr(cache, "put_many", _count("put_many", put_many))
+    monkeypatch.setattr(cache, "get_with_fallback", MagicMock(side_effect=AssertionError("per-document lookup")))
+    monkeypatch.setattr(cache, "put", MagicMock(side_effect=AssertionError("per-row write")))
+
+    concurrency = SyncConcurrency()
+    with patch("botnim.dynamic_extraction._async_chat_completion_inner", _fake_completion_titled("fresh")):
+        streams = await collect_context_sources_async(
+            context_, tmp_path, concurrency, bot="unified", extraction_cache=cache,
+        )
+
+    assert [m["title"] for _, _, _, m in streams] == [f"cached {v}" for v in values[:3]] + ["fresh"] * 3
+    assert calls == {"get_many": 1, "put_many": 1}
+    assert concurrency.exact_hits_count == 3 and concurrency.llm_miss_count == 3
+    assert all(cache.get(_content_hash(f"body:\n{v}"), EXTRACTION_VERSION) for v in values[3:])
+
+
+@pytest.mark.asyncio
+async def test_collect_falls_back_to_per_document_lookup_when_prefetch_fails(cache, tmp_path, monkeypatch):
+    (tmp_path / "src.csv").write_text("body\nprefetch-fails\n", encoding="utf-8")
+    context_ = {"name": "ctx_pf", "slug": "ctx_pf", "type": "csv", "source": "src.csv", "fetcher": None}
+    _wipe_l1()
+    cache.put(_content_hash("body:\nprefetch-fails"), EXTRACTION_VERSION, payload={"title": "cached"},
+              bot="unified", context="ctx_pf", document_type="text/markdown")
+    monkeypatch.setattr(cache, "get_many", MagicMock(side_effect=RuntimeError("db down")))
+
+    with patch("botnim.dynamic_extraction._async_chat_completion_inner",
+               AsyncMock(side_effect=AssertionError("OpenAI must not be called"))):
+        streams = await collect_context_sources_async(
+            context_, tmp_path, SyncConcurrency(), bot="unified", extraction_cache=cache,
+        )
+
+    assert [m["title"] for _, _, _, m in streams] == ["cached"]
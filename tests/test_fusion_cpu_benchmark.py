@@ -0,0 +1,63 @@
+"""Array-based RRF and explain scoring vs the per-row loops they replaced.
+
+The loops live on in botnim.benchmark.fusion_cpu as the benchmark's
+baseline; both paths must return the same ranking, scores and rows.
+"""
+import numpy as np
+import pytest
+
+from botnim.benchmark.fusion_cpu import (
+    loop_explain, loop_rrf_fuse, make_candidates, make_vectors, speedups,
+)
+from botnim.vector_store.vector_score_explainer import explain_vector_scores, explain_vector_scores_many
+from botnim.vector_store.vector_store_aurora import _RRF_BM25_WEIGHT, _RRF_K, _rrf_fuse, _rrf_rank
+
+
+@pytest.mark.parametrize("n", [0, 1, 10, 100, 1000])
+@pytest.mark.parametrize("vector_weight", [1.0, 0.5])
+def test_rrf_rank_matches_the_loop(n, vector_weight):
+    vector_rows, bm25_rows = make_candidates(n, seed=n)
+    for num_results in (1, 7, 3 * n):
+        assert _rrf_rank(vector_rows, bm25_rows, num_results, _RRF_K, _RRF_BM25_WEIGHT, vector_weight) == \
+            loop_rrf_fuse(vector_rows, bm25_rows, num_results, _RRF_K, _RRF_BM25_WEIGHT, vector_weight)
+
+
+def test_rrf_rank_breaks_ties_by_vector_rank_then_bm25_rank():
+    rows = lambda *ids: [(i, f"c{i}", {}) for i in ids]
+    # Equal weights: a/x tie at rank 1, b/y at rank 2; one shared id sums both lists.
+    ranked = _rrf_rank(rows("a", "b", "s"), rows("x", "y", "s"), 10, 60, 1.0, 1.0)
+    assert [doc_id for doc_id, _, _ in ranked] == ["s", "a", "x", "b", "y"]
+    assert ranked[0][1] == 1.0 / 63 + 1.0 / 63
+
+
+def test_rrf_fuse_builds_hits_from_the_ranking():
+    vector_rows, bm25_rows = make_candidates(20)
+    hits = _rrf_fuse(vector_rows, bm25_rows, 5)["hits"]["hits"]
+    expected = loop_rrf_fuse(vector_rows, bm25_rows, 5, _RRF_K, _RRF_BM25_WEIGHT)
+    assert [(h["_id"], h["_score"], h["_source"]["content"]) for h in hits] == \
+        [(doc_id, score, row[1]) for doc_id, score, row in expected]
+
+
+def test_explain_many_matches_the_per_vector_loop():
+    query, docs = make_vectors(12, dimensions=64)
+    batched = explain_vector_scores_many(query, docs)
+    looped = loop_explain(query, docs)
+    assert [e["description"] for e in batched] == [e["description"] for e in looped]
+    np.testing.assert_allclose([e["value"] for e in batched], [e["value"] for e in looped], rtol=1e-12)
+    for b, l in zip(batched, looped):
+        assert [d["source"] for d in b["details"]] == [d["source"] for d in l["details"]]
+        np.testing.assert_allclose([d["similarity"] for d in b["details"]],
+                                   [d["similarity"] for d in l["details"]], rtol=1e-12)
+    assert explain_vector_scores(query, docs[3])["value"] == batched[3]["value"]
+
+
+def test_explain_many_rejects_a_document_without_vectors():
+    query, docs = make_vectors(2, dimensions=8)
+    with pytest.raises(ValueError):
+        explain_vector_scores_many(query, [docs[0], []])
+
+
+def test_speedups_divides_loop_by_numpy_p50():
+    results = {"10": {"rrf_loop": {"p50_us": 6.0}, "rrf_numpy": {"p50_us": 12.0},
+                      "explain_loop": {"p50_us": 30.0}, "explain_numpy": {"p50_us": 0.0}}}
+    assert speedups(results) == {"10": {"rrf": 0.5, "explain": None}}
@@ -9,7 +9,7 @@ from botnim.vector_store.vector_store_aurora import VectorStoreAurora
 
 
 @pytest.fixture(autouse=True)
-def _restore_real_botnim_query():
+def _restore_real_botnim_query(fresh_query_client_pool):
     """Ensure sys.modules['botnim.query'] is the real module for each test.
 
     tests/backend/test_metadata_filter_endpoint.py and
@@ -24,7 +24,8 @@ def _restore_real_botnim_query():
     QueryClient and trip over OPENAI_API_KEY at runtime.
 
     Restoring the real module before each test in this file makes
-    these tests order-independent.
+    these tests order-independent. The QueryClient pool is emptied too
+    (``fresh_query_client_pool``), so each test builds from its own patch.
     """
     saved = sys.modules.get("botnim.query")
     sys.modules["botnim.query"] = _real_botnim_query
@@ -98,14 +98,15 @@ def aurora_db_filter(database_url, monkeypatch):
 
 
 def _seed_law_doc(database_url, context_id, content, metadata, embedding):
+    from botnim.vector_store.vector_store_aurora import _doc_date
     eng = create_engine(database_url)
     with eng.connect() as conn:
         content_hash = hashlib.sha256(content.encode()).hexdigest()
         conn.execute(text(
-            "INSERT INTO documents (context_id, content, content_hash, metadata, embedding) "
-            "VALUES (:cid, :c, :h, CAST(:m AS jsonb), CAST(:e AS vector))"
+            "INSERT INTO documents (context_id, content, content_hash, metadata, embedding, doc_date) "
+            "VALUES (:cid, :c, :h, CAST(:m AS jsonb), CAST(:e AS vector), :dd)"
         ), {"cid": context_id, "c": content, "h": content_hash,
-            "m": json.dumps(metadata), "e": str(embedding)})
+            "m": json.dumps(metadata), "e": str(embedding), "dd": _doc_date(metadata)})
         conn.commit()
 
 
@@ -753,3 +754,56 @@ def test_filter_prefixless_honored_when_matches(aurora_db_filter, database_url,
     assert hits
     assert {h["_source"]["metadata"]["law_name"] for h in hits} == {"חוק מינוי מזכיר הכנסת"}
     assert all("_query_detected_law" not in h["_source"]["metadata"] for h in hits)
+
+
+@pytest.mark.parametrize("a,b", [
+    ("חוק חובת המכרזים", "חוק המכרזים"),
+    ("חוק-יסוד: הממשלה", "חוק יסוד הממשלה"),
+    ("תקנון הכנסת", "מזכיר הכנסת בחירה מינוי תקנון הכנסת"),
+    ("חוק האזנת סתר, התשל\"ט-1979", "האזנת סתר"),
+    ("Basic Law: The Knesset", "basic law knesset"),
+    ("חוק חובת המכרזים", "כביש חוצה ישראל זזזז בטטה"),
+])
+def test_python_trigram_similarity_matches_pg_trgm(a, b, database_url):
+    from botnim.vector_store.vector_store_aurora import _trigrams, _trgm_similarity, _float4_text
+    eng = create_engine(database_url)
+    with eng.begin() as c:
+        c.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        expected = c.execute(text("SELECT similarity(:a, :b)"), {"a": a, "b": b}).scalar()
+    ga, gb = _trigrams(a), _trigrams(b)
+    assert _float4_text(_trgm_similarity(len(ga & gb), len(ga), len(gb))) == float(expected)
+
+
+def test_law_catalog_served_in_process_and_reloaded_on_change(aurora_db_filter, database_url):
+    from botnim.vector_store.vector_store_aurora import _LawNameCatalog, _best_law_match
+    import botnim.vector_store.vector_store_aurora as vsa
+    cid = _seed_two_laws_and_refresh(database_url)
+    catalog = _LawNameCatalog(recheck_seconds=0)
+    eng = create_engine(database_url)
+    statements = []
+    from sqlalchemy import event
+    event.listen(eng, "before_cursor_execute", lambda *a: statements.append(a[2]))
+    with eng.connect() as c:
+        assert len(catalog.index(c, cid)) == 2
+        # Unchanged catalog: the recheck is one fingerprint query, no reload.
+        statements.clear()
+        catalog.index(c, cid)
+        assert len(statements) == 1 and catalog.stats()["loads"] == 1
+        c.execute(text(
+            "INSERT INTO documents (id, context_id, content, content_hash, metadata, embedding) "
+            "VALUES (gen_random_uuid(), :cid, 'x', 'newh', CAST(:m AS jsonb), CAST(:e AS vector))"),
+            {"cid": cid, "m": '{"law_name": "חוק הגנת הפרטיות"}', "e": "[" + ",".join(["0.1"] * 1536) + "]"})
+        c.commit()
+    _refresh_law_catalog(database_url)
+    with eng.connect() as c:
+        assert catalog.index(c, cid).best("חוק הגנת פרטיות", 0.45)[0] == "חוק הגנת הפרטיות"
+        assert catalog.stats()["loads"] == 2
+
+    # With the module cache warm, detection costs no catalog queries at all.
+    vsa.invalidate_law_catalog()
+    with eng.connect() as c:
+        _best_law_match(c, cid, "חוק המכרזים")
+        statements.clear()
+        assert vsa._detect_law_in_query(c, cid, "מהו חוק המכרזים?") == "חוק חובת המכרזים"
+        assert _best_law_match(c, cid, "חוק חובת המכרזים") == ("חוק חובת המכרזים", 1.0)
+        assert statements == []
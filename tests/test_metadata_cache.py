@@ -0,0 +1,110 @@
+"""MetadataCache: the WAL-mode local L1 for extraction metadata."""
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+
+from kvfile.kvfile_sqlite import CachedKVFileSQLite as KVFile
+
+from botnim.metadata_cache import MetadataCache
+
+
+def _rows(path) -> int:
+    with sqlite3.connect(path) as db:
+        return db.execute("SELECT count(*) FROM metadata_cache").fetchone()[0]
+
+
+def test_writes_are_buffered_until_flush_every(tmp_path):
+    path = tmp_path / "metadata.sqlite"
+    cache = MetadataCache(path, flush_every=3)
+    cache.set("a", {"content": "A", "metadata": {"title": "א"}})
+    cache.set("b", {"content": "B", "metadata": {}})
+    assert _rows(path) == 0
+    # Unflushed entries are still served.
+    assert cache.get("a") == {"content": "A", "metadata": {"title": "א"}}
+    cache.set("c", {"content": "C", "metadata": {}})
+    assert _rows(path) == 3 and cache.flushes == 1
+    cache.set("d", "v")
+    cache.close()
+    assert _rows(path) == 4
+
+
+def test_uses_wal_and_serves_other_instances(tmp_path):
+    path = tmp_path / "metadata.sqlite"
+    writer = MetadataCache(path, flush_every=1)
+    reader = MetadataCache(path)
+    with sqlite3.connect(path) as db:
+        assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    writer.set("k", {"content": "x", "metadata": {"n": 1}})
+    assert reader.get("k") == {"content": "x", "metadata": {"n": 1}}
+    assert reader.get("missing", default="dflt") == "dflt"
+    writer.close()
+    reader.close()
+
+
+def test_concurrent_readers_and_writers(tmp_path):
+    path = tmp_path / "metadata.sqlite"
+    caches = [MetadataCache(path, flush_every=7) for _ in range(3)]
+    errors = []
+
+    def _work(i, cache):
+        try:
+            for n in range(200):
+                cache.set(f"{i}-{n}", n)
+                assert cache.get(f"{i}-{n}") == n
+                cache.get(f"{(i + 1) % 3}-{n}")
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_work, args=(i, c)) for i, c in enumerate(caches)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for cache in caches:
+        cache.close()
+    assert errors == []
+    assert _rows(path) == 600
+
+
+def test_stats_count_hits_and_misses(tmp_path):
+    cache = MetadataCache(tmp_path / "metadata.sqlite", flush_every=2)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+    cache.peek("a")
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (2, 1, 0.6667)
+    assert (stats["writes"], stats["pending"], stats["entries"]) == (1, 1, 0)
+    cache.flush()
+    assert cache.stats()["entries"] == 1 and cache.stats()["bytes"] > 0
+    cache.close()
+
+
+def test_compact_drops_unused_entries_and_the_legacy_table(tmp_path):
+    path = tmp_path / "metadata.sqlite"
+    legacy = KVFile(location=str(tmp_path / "metadata"))
+    legacy.set("old", {"content": "old", "metadata": {}})
+    legacy.close()
+
+    cache = MetadataCache(path)
+    cache.set("stale", 1)
+    cache.set("fresh", 2)
+    cache.set("hit", 3)
+    cache.flush()
+    long_ago = time.time() - 40 * 86400
+    cache._writer.execute("UPDATE metadata_cache SET used_at = ?", (long_ago,))
+    cache.set("fresh", 2)
+    assert cache.get("hit") == 3
+
+    result = cache.compact(max_age_days=30)
+
+    assert result["removed"] == 1 and result["legacy_table_dropped"] is True
+    assert cache.get("stale") is None and cache.get("fresh") == 2 and cache.get("hit") == 3
+    with sqlite3.connect(path) as db:
+        tables = {name for name, in db.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert tables == {"metadata_cache"}
+    assert cache.compact()["removed"] == 0
+    cache.close()
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 
+@pytest.mark.usefixtures("fresh_query_client_pool")
 class TestRunQueryMetadataFilter:
     def test_metadata_filter_passed_to_search(self, monkeypatch):
         """run_query() must forward metadata_filter to QueryClient.search()."""
@@ -617,3 +617,105 @@ def test_0010_downgrade_raises_with_clear_message(database_url):
     assert "downgrade is not supported" in (proc.stderr + proc.stdout), (
         f"downgrade must explain why; stdout={proc.stdout!r} stderr={proc.stderr!r}"
     )
+
+
+def test_0021_backfills_doc_date_like_ingest(database_url):
+    """The SQL backfill must agree with _doc_date, which ingest uses for new rows."""
+    import json
+    from botnim.vector_store.vector_store_aurora import _doc_date
+
+    _alembic(["upgrade", "0020_query_embedding_cache"], database_url)
+    metadatas = [
+        {"תאריך": "2025-04-03T10:00:00"},
+        {"תאריך": "", "PublicationDate": "2020-01-01"},
+        {"extracted_data": {"תאריך_מכתב": "2019-12-31"}},
+        {"תאריך_מכתב": "2024-02-29", "extracted_data": {"תאריך": "2000-01-01"}},
+        {"תאריך": "3390-06-91", "PublicationDate": "2020-01-01"},
+        {"תאריך": "2025-02-30"},
+        {"תאריך": "תשע\"ח"},
+        {"publish_date": "12.03.2025"},
+        {"publish_date": "30.02.2025"},
+        {"publish_date": "2026-10-26"},
+        {"law_name": "no date"},
+    ]
+    eng = create_engine(database_url)
+    with eng.begin() as conn:
+        cid = conn.execute(text(
+            "INSERT INTO contexts (bot, name) VALUES ('unified', 'x') RETURNING id")).scalar()
+        for i, metadata in enumerate(metadatas):
+            conn.execute(text(
+                "INSERT INTO documents (context_id, content, content_hash, metadata) "
+                "VALUES (:cid, :c, :c, CAST(:m AS jsonb))"
+            ), {"cid": cid, "c": f"doc{i}", "m": json.dumps(metadata)})
+    _alembic(["upgrade", "0021_documents_doc_date"], database_url)
+    with eng.connect() as conn:
+        backfilled = dict(conn.execute(text("SELECT content, doc_date FROM documents")).fetchall())
+        index = conn.execute(text(
+            "SELECT indexdef FROM pg_indexes WHERE indexname='documents_context_doc_date'")).scalar()
+    assert backfilled == {f"doc{i}": _doc_date(m) for i, m in enumerate(metadatas)}
+    assert "(context_id, doc_date DESC, id DESC)" in index
+    assert "chunk_index" in index
+
+    _alembic(["downgrade", "0020_query_embedding_cache"], database_url)
+    with eng.connect() as conn:
+        cols = conn.execute(text(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_name='documents' AND column_name='doc_date'")).fetchall()
+    assert cols == []
+
+
+def test_0022_backfills_the_chunk_map_like_ingest(database_url):
+    """document_key / chunk_index backfilled in SQL must match what ingest writes."""
+    import json
+    from botnim.vector_store.vector_store_aurora import _chunk_index, _document_key
+
+    _alembic(["upgrade", "0021_documents_doc_date"], database_url)
+    metadatas = [
+        {"DocumentTitle": "החלטה 12 - ועדת האתיקה", "chunk_index": 3},
+        {"DocumentTitle": "החלטה 12 - ועדת האתיקה"},
+        {"DocumentTitle": "", "chunk_index": "2"},
+        {"chunk_index": "x"},
+        {"filename": "plain.md"},
+    ]
+    eng = create_engine(database_url)
+    with eng.begin() as conn:
+        cid = conn.execute(text(
+            "INSERT INTO contexts (bot, name) VALUES ('unified', 'x') RETURNING id")).scalar()
+        for i, metadata in enumerate(metadatas):
+            conn.execute(text(
+                "INSERT INTO documents (context_id, content, content_hash, metadata) "
+                "VALUES (:cid, :c, :c, CAST(:m AS jsonb))"
+            ), {"cid": cid, "c": f"doc{i}", "m": json.dumps(metadata)})
+    _alembic(["upgrade", "0022_documents_chunk_map"], database_url)
+    with eng.connect() as conn:
+        backfilled = {r[0]: (r[1], r[2]) for r in conn.execute(text(
+            "SELECT content, document_key, chunk_index FROM documents"))}
+        index = conn.execute(text(
+            "SELECT indexdef FROM pg_indexes WHERE indexname='documents_document_chunks'")).scalar()
+    assert backfilled == {f"doc{i}": (_document_key(m), _chunk_index(m)) for i, m in enumerate(metadatas)}
+    assert "(context_id, document_key, chunk_index, id)" in index
+
+    _alembic(["downgrade", "0021_documents_doc_date"], database_url)
+    with eng.connect() as conn:
+        cols = conn.execute(text(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_name='documents' AND column_name IN ('document_key', 'chunk_index')")).fetchall()
+    assert cols == []
+
+
+def test_0023_moves_the_doc_date_index_onto_the_chunk_index_column(database_url):
+    _alembic(["upgrade", "0023_doc_date_index_chunk_column"], database_url)
+    eng = create_engine(database_url)
+    query = text("SELECT indexname, indexdef FROM pg_indexes WHERE indexname LIKE 'documents_context_doc_date%'")
+    with eng.connect() as conn:
+        rows = conn.execute(query).fetchall()
+    assert [r[0] for r in rows] == ["documents_context_doc_date"]
+    assert "(context_id, doc_date DESC, id DESC)" in rows[0][1]
+    assert "(chunk_index = 0)" in rows[0][1]
+    assert "metadata" not in rows[0][1]
+
+    _alembic(["downgrade", "0022_documents_chunk_map"], database_url)
+    with eng.connect() as conn:
+        rows = conn.execute(query).fetchall()
+    assert [r[0] for r in rows] == ["documents_context_doc_date"]
+    assert "metadata ->> 'chunk_index'" in rows[0][1]
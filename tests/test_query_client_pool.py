@@ -0,0 +1,124 @@
+"""Tests for the process-wide QueryClient pool used by /retrieve."""
+import os
+import threading
+
+import pytest
+
+import botnim.query as q
+
+
+class _FakeClient:
+    built = 0
+
+    def __init__(self, store_id):
+        type(self).built += 1
+        self.store_id = store_id
+
+
+@pytest.fixture
+def specs(tmp_path, monkeypatch):
+    (tmp_path / "unified").mkdir()
+    cfg = tmp_path / "unified" / "config.yaml"
+    cfg.write_text("slug: unified\ncontext: []\n")
+    monkeypatch.setattr(q, "SPECS", tmp_path)
+    monkeypatch.setattr(q, "QueryClient", _FakeClient)
+    monkeypatch.setenv("ENVIRONMENT", "staging")
+    _FakeClient.built = 0
+    return cfg
+
+
+def test_second_lookup_is_a_hit(specs):
+    pool = q._QueryClientPool()
+    a = pool.get("unified__israeli_laws")
+    b = pool.get("unified__israeli_laws")
+    assert a is b
+    assert _FakeClient.built == 1
+    stats = pool.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_contexts_and_environments_are_pooled_separately(specs, monkeypatch):
+    pool = q._QueryClientPool()
+    a = pool.get("unified__israeli_laws")
+    b = pool.get("unified__government_decisions")
+    monkeypatch.setenv("ENVIRONMENT", "production")
+    c = pool.get("unified__israeli_laws")
+    assert len({id(a), id(b), id(c)}) == 3
+    assert pool.stats()["size"] == 3
+
+
+def test_legacy_dev_suffix_shares_the_entry(specs):
+    pool = q._QueryClientPool()
+    assert pool.get("unified__israeli_laws") is pool.get("unified__israeli_laws__dev")
+
+
+def test_config_mtime_change_rebuilds(specs):
+    pool = q._QueryClientPool()
+    a = pool.get("unified__israeli_laws")
+    st = specs.stat()
+    os.utime(specs, (st.st_atime, st.st_mtime + 10))
+    b = pool.get("unified__israeli_laws")
+    assert a is not b
+    stats = pool.stats()
+    assert stats["reloads"] == 1
+    assert stats["misses"] == 2
+
+
+def test_slow_build_does_not_block_other_keys(specs, monkeypatch):
+    release = threading.Event()
+
+    class _Slow(_FakeClient):
+        def __init__(self, store_id):
+            if store_id.endswith("israeli_laws"):
+                release.wait(5)
+            super().__init__(store_id)
+
+    monkeypatch.setattr(q, "QueryClient", _Slow)
+    pool = q._QueryClientPool()
+    slow = threading.Thread(target=pool.get, args=("unified__israeli_laws",))
+    slow.start()
+    try:
+        fast = threading.Thread(target=pool.get, args=("unified__government_decisions",))
+        fast.start()
+        fast.join(2)
+        assert not fast.is_alive()
+        assert pool.stats()["size"] == 1
+    finally:
+        release.set()
+        slow.join()
+    assert pool.stats()["size"] == 2
+
+
+def test_concurrent_cold_lookups_build_once(specs):
+    pool = q._QueryClientPool()
+    got = []
+    threads = [
+        threading.Thread(target=lambda: got.append(pool.get("unified__israeli_laws")))
+        for _ in range(16)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert _FakeClient.built == 1
+    assert len({id(c) for c in got}) == 1
+    assert pool.stats()["hits"] == 15
+
+
+def test_run_query_uses_the_pool(specs, monkeypatch):
+    calls = []
+
+    def fake_get(store_id):
+        calls.append(store_id)
+
+        class _C:
+            def search(self, **kwargs):
+                return []
+        return _C()
+
+    monkeypatch.setattr(q, "get_query_client", fake_get)
+    q.run_query(store_id="unified__israeli_laws", query_text="x")
+    assert calls == ["unified__israeli_laws"]
@@ -0,0 +1,254 @@
+"""Tests for the retrieve-path query-embedding cache."""
+from __future__ import annotations
+
+import os
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from botnim.query_embedding_cache import QueryEmbeddingCache
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DIM = 1536
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Embedder:
+    def __init__(self, delay: float = 0.0):
+        self.calls = []
+        self.delay = delay
+
+    def __call__(self, text):
+        self.calls.append(text)
+        if self.delay:
+            time.sleep(self.delay)
+        return [float(len(text))] * DIM
+
+
+def _cache(**kwargs) -> QueryEmbeddingCache:
+    kwargs.setdefault("max_bytes", 10 * DIM * 4)
+    kwargs.setdefault("ttl_seconds", 60)
+    kwargs.setdefault("shared", False)
+    return QueryEmbeddingCache(**kwargs)
+
+
+def test_repeat_query_is_embedded_once():
+    cache, embed = _cache(), _Embedder()
+    a = cache.get_or_embed("מה אומר חוק הבחירות", embed)
+    b = cache.get_or_embed("מה אומר חוק הבחירות", embed)
+    assert a == b
+    assert len(a) == DIM
+    assert len(embed.calls) == 1
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+    assert stats["bytes"] == DIM * 4
+
+
+def test_distinct_models_do_not_share_entries():
+    cache, embed = _cache(), _Embedder()
+    cache.get_or_embed("q", embed, model="m1")
+    cache.get_or_embed("q", embed, model="m2")
+    assert len(embed.calls) == 2
+
+
+def test_lru_evicts_by_bytes():
+    cache, embed = _cache(max_bytes=2 * DIM * 4), _Embedder()
+    cache.get_or_embed("a", embed)
+    cache.get_or_embed("bb", embed)
+    cache.get_or_embed("a", embed)        # touch "a" so "bb" is the LRU entry
+    cache.get_or_embed("ccc", embed)
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= 2 * DIM * 4
+    cache.get_or_embed("a", embed)
+    assert embed.calls == ["a", "bb", "ccc"]
+    cache.get_or_embed("bb", embed)
+    assert embed.calls == ["a", "bb", "ccc", "bb"]
+
+
+def test_ttl_expires_entries():
+    clock, embed = _Clock(), _Embedder()
+    cache = _cache(ttl_seconds=60, clock=clock)
+    cache.get_or_embed("q", embed)
+    clock.now += 59
+    cache.get_or_embed("q", embed)
+    assert len(embed.calls) == 1
+    clock.now += 2
+    cache.get_or_embed("q", embed)
+    assert len(embed.calls) == 2
+    assert cache.stats()["expirations"] == 1
+
+
+def test_concurrent_identical_queries_single_flight():
+    cache, embed = _cache(), _Embedder(delay=0.05)
+    got = []
+    threads = [
+        threading.Thread(target=lambda: got.append(cache.get_or_embed("q", embed)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(embed.calls) == 1
+    assert len(got) == 8
+    assert cache.stats()["hits"] == 7
+
+
+def test_failed_embed_is_not_cached_and_followers_retry():
+    cache = _cache()
+    attempts = []
+
+    def flaky(text):
+        attempts.append(text)
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+        return [0.0] * DIM
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_embed("q", flaky)
+    assert cache.get_or_embed("q", flaky) == [0.0] * DIM
+    assert len(attempts) == 2
+
+
+def test_follower_embeds_on_its_own_when_the_leader_hangs(monkeypatch):
+    import botnim.query_embedding_cache as qec
+
+    monkeypatch.setattr(qec, "_SINGLE_FLIGHT_WAIT_SECONDS", 0.1)
+    cache = _cache()
+    release = threading.Event()
+    started = threading.Event()
+
+    def hung(text):
+        started.set()
+        release.wait(5)
+        return [1.0] * DIM
+
+    leader = threading.Thread(target=cache.get_or_embed, args=("q", hung))
+    leader.start()
+    try:
+        started.wait(5)
+        t0 = time.monotonic()
+        assert cache.get_or_embed("q", lambda text: [0.0] * DIM) == [0.0] * DIM
+        assert time.monotonic() - t0 < 1.0
+    finally:
+        release.set()
+        leader.join()
+    # The follower never took over the leader's in-flight slot.
+    assert cache._inflight == {}
+
+
+def test_follower_wait_is_bounded_by_the_request_deadline():
+    from botnim.db.session import statement_deadline
+
+    cache = _cache()
+    release = threading.Event()
+    started = threading.Event()
+
+    def hung(text):
+        started.set()
+        release.wait(5)
+        return [1.0] * DIM
+
+    follower_embed = _Embedder()
+    leader = threading.Thread(target=cache.get_or_embed, args=("q", hung))
+    leader.start()
+    try:
+        started.wait(5)
+        t0 = time.monotonic()
+        with pytest.raises(TimeoutError, match="in-flight query embedding"):
+            with statement_deadline(0.2):
+                cache.get_or_embed("q", follower_embed)
+        assert time.monotonic() - t0 < 1.0
+    finally:
+        release.set()
+        leader.join()
+    # Past its deadline the follower gave up rather than embedding itself.
+    assert follower_embed.calls == []
+
+
+def test_saved_ms_estimate_uses_observed_miss_latency():
+    cache, embed = _cache(), _Embedder(delay=0.02)
+    cache.get_or_embed("q", embed)
+    cache.get_or_embed("q", embed)
+    cache.get_or_embed("q", embed)
+    stats = cache.stats()
+    assert stats["embed_ms_avg"] >= 15
+    assert stats["saved_ms_estimate"] >= 2 * 15
+
+
+def _alembic_upgrade(database_url: str) -> None:
+    env = os.environ.copy()
+    env["DATABASE_URL"] = database_url
+    subprocess.run(
+        ["alembic", "--config", "alembic.ini", "upgrade", "head"],
+        cwd=REPO_ROOT, env=env, check=True, capture_output=True,
+    )
+
+
+@pytest.fixture
+def shared_db(database_url, monkeypatch):
+    _alembic_upgrade(database_url)
+    monkeypatch.setenv("DATABASE_URL", database_url)
+    from botnim.db import session as s
+    s._engine = None
+    return database_url
+
+
+def test_shared_tier_serves_other_processes(shared_db):
+    embed = _Embedder()
+    first = _cache(shared=True)
+    vec = first.get_or_embed("q", embed)
+    # The upsert runs on the cache's writer thread; wait for it.
+    first._shared_writer.submit(lambda: None).result(timeout=5)
+    # A fresh instance stands in for another API task with a cold L1.
+    second = _cache(shared=True)
+    assert second.get_or_embed("q", embed) == vec
+    assert len(embed.calls) == 1
+    assert second.stats()["shared_hits"] == 1
+    # ...and the shared hit was promoted into L1.
+    second.get_or_embed("q", embed)
+    assert second.stats()["hits"] == 1
+
+
+def test_shared_write_is_off_the_request_path(monkeypatch):
+    cache, embed = _cache(shared=True), _Embedder()
+    monkeypatch.setattr(cache, "_get_shared", lambda key: None)
+    release = threading.Event()
+    written = []
+
+    def slow_put(key, vec):
+        release.wait(5)
+        written.append(key)
+
+    monkeypatch.setattr(cache, "_put_shared", slow_put)
+    t0 = time.monotonic()
+    assert len(cache.get_or_embed("q", embed)) == DIM
+    assert time.monotonic() - t0 < 1.0
+    assert written == []
+    release.set()
+    cache._shared_writer.submit(lambda: None).result(timeout=5)
+    assert len(written) == 1
+
+
+def test_shared_tier_failure_falls_through(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "postgresql+psycopg://nobody@127.0.0.1:1/none")
+    from botnim.db import session as s
+    monkeypatch.setattr(s, "_engine", None)
+    cache, embed = _cache(shared=True), _Embedder()
+    assert len(cache.get_or_embed("q", embed)) == DIM
+    assert len(embed.calls) == 1
@@ -0,0 +1,232 @@
+"""Tests for the retrieve-path result cache."""
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+import botnim.query as q
+from botnim.retrieve_cache import RetrieveCache
+from botnim.vector_store.search_modes import DEFAULT_SEARCH_MODE, SEARCH_MODES
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Versions:
+    """Stands in for the context_snapshots lookup."""
+
+    def __init__(self, version="v1"):
+        self.version = version
+        self.reads = 0
+
+    def __call__(self, bot, context):
+        self.reads += 1
+        if isinstance(self.version, Exception):
+            raise self.version
+        return self.version
+
+
+def _cache(versions=None, **kwargs) -> RetrieveCache:
+    kwargs.setdefault("max_entries", 10)
+    kwargs.setdefault("ttl_seconds", 60)
+    kwargs.setdefault("version_recheck_seconds", 0)
+    cache = RetrieveCache(**kwargs)
+    cache._read_version = versions or _Versions()
+    return cache
+
+
+class _Runner:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return f"results #{self.calls}"
+
+
+def _params(**overrides):
+    params = {"query_text": "מה אומר חוק הבחירות", "num_results": 5, "format": "yaml",
+              "search_mode": DEFAULT_SEARCH_MODE, "metadata_filter": None}
+    params.update(overrides)
+    return params
+
+
+def test_repeat_request_is_served_from_cache():
+    cache, run = _cache(), _Runner()
+    assert cache.get_or_run("unified", "israeli_laws", _params(), run) == "results #1"
+    assert cache.get_or_run("unified", "israeli_laws", _params(), run) == "results #1"
+    assert run.calls == 1
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_any_request_field_changes_the_key():
+    cache, run = _cache(), _Runner()
+    cache.get_or_run("unified", "israeli_laws", _params(), run)
+    cache.get_or_run("unified", "israeli_laws", _params(num_results=6), run)
+    cache.get_or_run("unified", "israeli_laws", _params(format="text"), run)
+    cache.get_or_run("unified", "israeli_laws", _params(search_mode=SEARCH_MODES["SECTION_NUMBER"]), run)
+    cache.get_or_run("unified", "israeli_laws", _params(metadata_filter={"law_name": "x"}), run)
+    cache.get_or_run("unified", "legal_advisor_opinions", _params(), run)
+    assert run.calls == 6
+
+
+def test_corpus_version_bump_misses():
+    versions = _Versions("2026-01-01")
+    cache, run = _cache(versions), _Runner()
+    cache.get_or_run("unified", "israeli_laws", _params(), run)
+    versions.version = "2026-01-02"
+    assert cache.get_or_run("unified", "israeli_laws", _params(), run) == "results #2"
+    assert run.calls == 2
+
+
+def test_version_is_rechecked_on_interval_and_after_forget():
+    clock, versions = _Clock(), _Versions()
+    cache, run = _cache(versions, version_recheck_seconds=5, clock=clock), _Runner()
+    cache.get_or_run("unified", "israeli_laws", _params(), run)
+    cache.get_or_run("unified", "israeli_laws", _params(), run)
+    assert versions.reads == 1
+    clock.now += 6
+    cache.get_or_run("unified", "israeli_laws", _params(), run)
+    assert versions.reads == 2
+    cache.forget_versions("unified")
+    cache.get_or_run("unified", "israeli_laws", _params(), run)
+    assert versions.reads == 3
+    assert run.calls == 1
+
+
+def test_bypass_and_unreadable_version_skip_the_cache():
+    versions = _Versions()
+    cache, run = _cache(versions), _Runner()
+    cache.get_or_run("unified", "israeli_laws", _params(), run, bypass=True)
+    cache.get_or_run("unified", "israeli_laws", _params(), run, bypass=True)
+    assert versions.reads == 0
+    versions.version = RuntimeError("no db")
+    cache.get_or_run("unified", "israeli_laws", _params(), run)
+    assert run.calls == 3
+    assert cache.stats()["bypasses"] == 3
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_evicts_and_ttl_expires():
+    clock = _Clock()
+    cache, run = _cache(max_entries=2, clock=clock), _Runner()
+    for query in ("a", "b", "a", "c"):
+        cache.get_or_run("unified", "ctx", _params(query_text=query), run)
+    assert cache.stats()["evictions"] == 1
+    cache.get_or_run("unified", "ctx", _params(query_text="a"), run)
+    assert run.calls == 3
+    clock.now += 61
+    cache.get_or_run("unified", "ctx", _params(query_text="a"), run)
+    assert run.calls == 4
+    assert cache.stats()["expirations"] == 1
+
+
+def test_dict_results_are_not_shared_with_callers():
+    cache = _cache()
+    first = cache.get_or_run("unified", "ctx", _params(format="dict"), lambda: [{"id": "1"}])
+    first[0]["id"] = "mutated"
+    again = cache.get_or_run("unified", "ctx", _params(format="dict"), lambda: [{"id": "2"}])
+    assert again == [{"id": "1"}]
+
+
+def test_failed_run_is_not_cached():
+    cache = _cache()
+
+    def boom():
+        raise TimeoutError("deadline")
+
+    with pytest.raises(TimeoutError):
+        cache.get_or_run("unified", "ctx", _params(), boom)
+    assert cache.get_or_run("unified", "ctx", _params(), lambda: "ok") == "ok"
+
+
+def test_run_query_caches_and_explain_bypasses(monkeypatch):
+    cache = _cache()
+    monkeypatch.setattr(q, "get_retrieve_cache", lambda: cache)
+    searches = []
+
+    class _Client:
+        def search(self, **kwargs):
+            searches.append(kwargs)
+            return []
+
+    monkeypatch.setattr(q, "get_query_client", lambda store_id: _Client())
+    q.run_query(store_id="unified__israeli_laws", query_text="x", format="text")
+    q.run_query(store_id="unified__israeli_laws", query_text="x", format="text")
+    assert len(searches) == 1
+    q.run_query(store_id="unified__israeli_laws", query_text="x", format="text", explain=True)
+    assert len(searches) == 2
+
+
+def _alembic_upgrade(database_url: str) -> None:
+    env = os.environ.copy()
+    env["DATABASE_URL"] = database_url
+    subprocess.run(
+        ["alembic", "--config", "alembic.ini", "upgrade", "head"],
+        cwd=REPO_ROOT, env=env, check=True, capture_output=True,
+    )
+
+
+def test_corpus_version_follows_context_snapshots(database_url, monkeypatch):
+    _alembic_upgrade(database_url)
+    monkeypatch.setenv("DATABASE_URL", database_url)
+    from botnim.db import session as s
+    monkeypatch.setattr(s, "_engine", None)
+    cache = RetrieveCache(version_recheck_seconds=0)
+    empty = cache.corpus_version("unified", "israeli_laws")
+    assert empty == "none/none"
+    with s.get_session() as sess:
+        sess.execute(text(
+            "INSERT INTO context_snapshots (bot, context, source_id, doc_count) "
+            "VALUES ('unified', 'israeli_laws', '*', 3)"))
+    first = cache.corpus_version("unified", "israeli_laws")
+    assert first != empty
+    # Per-source rows alone don't move the version; the '*' aggregate does.
+    with s.get_session() as sess:
+        sess.execute(text(
+            "INSERT INTO context_snapshots (bot, context, source_id, doc_count) "
+            "VALUES ('unified', 'israeli_laws', 'laws-csv', 3)"))
+    assert cache.corpus_version("unified", "israeli_laws") == first
+    assert cache.corpus_version("unified", "other") == empty
+
+
+def test_corpus_version_moves_with_each_committed_document_write(database_url, monkeypatch):
+    """A sync commits window by window; each commit must move the version,
+    not just the snapshot written when the whole sync ends."""
+    from botnim.vector_store.vector_store_aurora import _copy_documents
+
+    _alembic_upgrade(database_url)
+    monkeypatch.setenv("DATABASE_URL", database_url)
+    from botnim.db import session as s
+    monkeypatch.setattr(s, "_engine", None)
+    with s.get_session() as sess:
+        cid = sess.execute(text(
+            "INSERT INTO contexts (bot, name) VALUES ('unified', 'israeli_laws') RETURNING id")).scalar()
+    cache = RetrieveCache(version_recheck_seconds=0)
+    before = cache.corpus_version("unified", "israeli_laws")
+
+    row = (cid, "סעיף 1", "h1", {"filename": "a.md"}, [0.0] * 1536, None)
+    with s.get_session() as sess:
+        assert _copy_documents(sess, [row]) == 1
+    after_insert = cache.corpus_version("unified", "israeli_laws")
+    assert after_insert != before
+
+    # Re-loading rows that already exist changes nothing, so neither does the version.
+    with s.get_session() as sess:
+        assert _copy_documents(sess, [row]) == 0
+    assert cache.corpus_version("unified", "israeli_laws") == after_insert
@@ -0,0 +1,36 @@
+"""Tests for the retrieve latency benchmark's pure logic.
+
+The timing loop needs a synced Aurora and real embeddings; here we test
+only the summary and comparison primitives.
+"""
+from botnim.benchmark.retrieve_latency import compare, load_queries, percentile, summarize
+
+
+def test_percentile_nearest_rank():
+    samples = list(range(1, 101))
+    assert percentile(samples, 50) == 50
+    assert percentile(samples, 95) == 95
+    assert percentile([7.0], 95) == 7.0
+    assert percentile([], 50) is None
+
+
+def test_summarize():
+    assert summarize([4.0, 1.0, 3.0, 2.0]) == {"n": 4, "p50_ms": 2.0, "p95_ms": 4.0, "mean_ms": 2.5}
+    assert summarize([])["n"] == 0
+
+
+def test_compare_reports_per_context_deltas():
+    results = {
+        "unprepared": {"israeli_laws": {"p50_ms": 40.0, "p95_ms": 90.0}, "other": {"p50_ms": 1.0, "p95_ms": 1.0}},
+        "prepared": {"israeli_laws": {"p50_ms": 31.5, "p95_ms": 70.0}},
+    }
+    assert compare(results, "unprepared", "prepared") == {
+        "israeli_laws": {"p50_delta_ms": -8.5, "p95_delta_ms": -20.0},
+    }
+
+
+def test_load_queries_dedupes_the_evaluation_set():
+    queries = load_queries()
+    assert queries
+    assert len(queries) == len(set(queries))
+    assert load_queries(2) == queries[:2]
@@ -0,0 +1,82 @@
+"""Unit tests for botnim.query.run_query_many (multi-context fan-out)."""
+from unittest.mock import MagicMock
+
+import pytest
+
+import botnim.query as q
+from botnim.vector_store.search_modes import DEFAULT_SEARCH_MODE, SEARCH_MODES
+from botnim.vector_store.vector_store_aurora import VectorStoreAurora
+
+
+def _hit(doc_id):
+    return {"_id": doc_id, "_score": 1.0, "_source": {"content": f"content {doc_id}", "metadata": {}}}
+
+
+@pytest.fixture
+def fanout(monkeypatch):
+    store = MagicMock(spec=VectorStoreAurora)
+    store.openai_client = object()
+
+    def fake_search_many(query_text, embedding, requests, timeout=None):
+        return [
+            {"context_name": r["context_name"], "status": "ok",
+             "result": {"hits": {"hits": [_hit(r["context_name"])]}}}
+            if r["context_name"] != "slow" else
+            {"context_name": "slow", "status": "timeout", "detail": "deadline exceeded after 0.1s"}
+            for r in requests
+        ]
+
+    store.search_many.side_effect = fake_search_many
+
+    def fake_get(store_id):
+        client = q.QueryClient.__new__(q.QueryClient)
+        client.bot_name, client.context_name, client.environment = q.parse_store_id(store_id)
+        client.context_config = {"default_num_results": 4}
+        client.vector_store = store
+        return client
+
+    embeds = []
+    monkeypatch.setattr(q, "get_query_client", fake_get)
+    monkeypatch.setattr(q, "embed_query", lambda client, text, model=None: embeds.append(text) or [0.0] * 1536)
+    return store, embeds
+
+
+def test_embeds_once_and_searches_all_contexts(fanout):
+    store, embeds = fanout
+    blocks = q.run_query_many(
+        bot="unified", query_text="חוק הבחירות", format="dict",
+        contexts=[
+            {"context": "israeli_laws", "search_mode": SEARCH_MODES["SECTION_NUMBER"], "num_results": 2},
+            {"context": "legal_advisor_opinions", "metadata_filter": {"year": "2024"}},
+        ],
+        deadline_seconds=5,
+    )
+    assert embeds == ["חוק הבחירות"]
+    store.search_many.assert_called_once()
+    _, _, requests = store.search_many.call_args.args
+    assert [r["context_name"] for r in requests] == ["israeli_laws", "legal_advisor_opinions"]
+    assert requests[0]["num_results"] == 2
+    assert requests[1]["search_mode"] is DEFAULT_SEARCH_MODE
+    assert requests[1]["metadata_filter"] == {"year": "2024"}
+    assert 0 < store.search_many.call_args.kwargs["timeout"] <= 5
+    assert [b["context"] for b in blocks] == ["israeli_laws", "legal_advisor_opinions"]
+    assert blocks[0]["search_mode"] == "SECTION_NUMBER"
+    assert all(b["status"] == "ok" for b in blocks)
+    assert blocks[0]["results"][0]["id"] == "israeli_laws"
+
+
+def test_timed_out_context_is_reported_next_to_finished_ones(fanout):
+    blocks = q.run_query_many(
+        bot="unified", query_text="x", format="yaml",
+        contexts=[{"context": "fast"}, {"context": "slow"}],
+    )
+    assert blocks[0]["status"] == "ok"
+    assert isinstance(blocks[0]["results"], str)
+    assert blocks[1] == {"context": "slow", "search_mode": DEFAULT_SEARCH_MODE.name,
+                         "status": "timeout", "detail": "deadline exceeded after 0.1s"}
+
+
+def test_no_contexts_returns_empty(fanout):
+    store, embeds = fanout
+    assert q.run_query_many(bot="unified", query_text="x", contexts=[]) == []
+    assert embeds == []
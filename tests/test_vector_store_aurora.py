@@ -387,16 +387,17 @@ def test_upload_files_empty_run_does_not_wipe_context(aurora_db, monkeypatch):
 def _seed_documents(database_url, context_id, docs):
     """docs: [(content, embedding, metadata)]"""
     from sqlalchemy import create_engine
+    from botnim.vector_store.vector_store_aurora import _doc_date
     eng = create_engine(database_url)
     with eng.connect() as conn:
         for content, embedding, metadata in docs:
             content_hash = hashlib.sha256(content.encode()).hexdigest()
             conn.execute(text(
-                "INSERT INTO documents (context_id, content, content_hash, metadata, embedding) "
-                "VALUES (:cid, :c, :h, CAST(:m AS jsonb), CAST(:e AS vector))"
+                "INSERT INTO documents (context_id, content, content_hash, metadata, embedding, doc_date) "
+                "VALUES (:cid, :c, :h, CAST(:m AS jsonb), CAST(:e AS vector), :dd)"
             ), {
                 "cid": context_id, "c": content, "h": content_hash,
-                "m": json.dumps(metadata), "e": str(embedding),
+                "m": json.dumps(metadata), "e": str(embedding), "dd": _doc_date(metadata),
             })
         conn.commit()
 
@@ -477,6 +478,208 @@ def test_search_combines_vector_and_text_via_rrf(aurora_db, database_url, monkey
     assert set(titles) == {"text-strong", "vector-strong"}
 
 
+@pytest.mark.parametrize("lexical_strategy", ["tsquery", "trigram"])
+def test_sql_fusion_matches_python_fusion(aurora_db, database_url, monkeypatch, lexical_strategy):
+    """`fusion_strategy: sql` returns the same hits, order and RRF scores as the
+    two-branch + _rrf_fuse path, in a single statement."""
+    from botnim.vector_store import vector_store_aurora as vsa
+    from botnim.vector_store.search_modes import DEFAULT_SEARCH_MODE
+
+    monkeypatch.setattr(vsa, "_get_embedding_client", lambda env: _FakeEmbeddingClient())
+    ctx = {"slug": "x", "use_lexical_search": True, "lexical_strategy": lexical_strategy}
+    store = vsa.VectorStoreAurora(config={"slug": "unified", "name": "Unified", "context": [ctx]},
+                                  config_dir=".", environment="staging")
+    cid = store.get_or_create_vector_store({"slug": "x"}, "x", False)
+    # Distinct cosine per doc; lexical overlap with the query varies independently.
+    words = ["commissioner", "medical", "budget", "committee", "complaints", "report"]
+    _seed_documents(database_url, cid, [
+        (" ".join(words[j] for j in range(6) if (i >> j) & 1 or j == i % 6) + f" doc{i}",
+         [1.0] * (1536 - 40 * i) + [-1.0] * (40 * i),
+         {"title": f"d{i}", "kind": "even" if i % 2 == 0 else "odd"})
+        for i in range(14)
+    ])
+
+    branch_runs = []
+    run_branches = vsa._run_branches
+    monkeypatch.setattr(vsa, "_run_branches", lambda *a: branch_runs.append(a) or run_branches(*a))
+
+    def _search(fusion, metadata_filter=None):
+        ctx["fusion_strategy"] = fusion
+        branch_runs.clear()
+        hits = store.search(context_name="x", query_text="medical complaints commissioner",
+                            search_mode=DEFAULT_SEARCH_MODE, embedding=[1.0] * 1536,
+                            num_results=4, metadata_filter=metadata_filter)["hits"]["hits"]
+        assert bool(branch_runs) == (fusion == "python")
+        return hits
+
+    for metadata_filter in (None, {"kind": "odd"}):
+        python_hits = _search("python", metadata_filter)
+        sql_hits = _search("sql", metadata_filter)
+        assert len(python_hits) == 4
+        assert [(h["_id"], h["_source"]) for h in sql_hits] == [(h["_id"], h["_source"]) for h in python_hits]
+        assert [h["_score"] for h in sql_hits] == pytest.approx([h["_score"] for h in python_hits], abs=1e-12)
+
+
+def test_vector_knn_is_prepared_with_a_partial_index_generic_plan(aurora_db, database_url, monkeypatch):
+    """The KNN statement is prepared on the read connection after repeat
+    searches, and its generic plan can still use a per-context partial HNSW
+    index because the context id and the LIMIT are part of the statement
+    text (a generic `LIMIT $n` is costed as 10% of the rows: seq scan + sort)."""
+    from botnim.db.session import READ, get_session
+    from botnim.vector_store import vector_store_aurora as vsa
+    from botnim.vector_store.search_modes import DEFAULT_SEARCH_MODE
+
+    monkeypatch.setattr(vsa, "_get_embedding_client", lambda env: _FakeEmbeddingClient())
+    # Preparation is off by default on the read role; this covers turning it on.
+    monkeypatch.setenv("BOTNIM_DB_READ_PREPARE_THRESHOLD", "1")
+    store = vsa.VectorStoreAurora(config={"slug": "unified", "name": "Unified"},
+                                  config_dir=".", environment="staging")
+    cid = store.get_or_create_vector_store({"slug": "x"}, "x", False)
+    _seed_documents(database_url, cid, [(f"doc {i}", [1.0 - i / 10] * 1536, {"title": f"d{i}"})
+                                        for i in range(5)])
+    with get_session() as sess:
+        sess.execute(text(
+            f"CREATE INDEX documents_embedding_hnsw_x ON documents USING hnsw "
+            f"(embedding vector_cosine_ops) WHERE context_id = {vsa._context_id_sql(cid)}"))
+
+    for _ in range(3):
+        store.search(context_name="x", query_text="doc", search_mode=DEFAULT_SEARCH_MODE,
+                     embedding=[1.0] * 1536, num_results=2)
+    with get_session(READ) as sess:
+        knn = sess.execute(text(
+            "SELECT name, statement FROM pg_prepared_statements "
+            "WHERE statement LIKE '%ORDER BY embedding <=>%'"
+        )).fetchall()
+        assert len(knn) == 1
+        assert f"context_id = '{cid}'::uuid" in knn[0].statement
+        sess.execute(text("SET LOCAL plan_cache_mode = force_generic_plan"))
+        sess.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = "\n".join(sess.execute(text(
+            f"EXPLAIN EXECUTE \"{knn[0].name}\"('{[1.0] * 1536}'::vector)")).scalars())
+    assert "documents_embedding_hnsw_x" in plan
+
+
+def test_trigram_unindexed_scan_flags_costly_scans_that_skip_the_trigram_index():
+    from botnim.vector_store import vector_store_aurora as vsa
+
+    big = vsa._TRIGRAM_GUARD_MAX_SCAN_COST + 1
+
+    def limit_over(scan):
+        return {"Node Type": "Limit", "Total Cost": scan["Total Cost"], "Plans": [scan]}
+
+    seq = {"Node Type": "Seq Scan", "Relation Name": "documents", "Total Cost": big}
+    ctx_index = {"Node Type": "Index Scan", "Relation Name": "documents",
+                 "Index Name": "documents_context_id", "Total Cost": big}
+    bitmap = {"Node Type": "Bitmap Heap Scan", "Relation Name": "documents", "Total Cost": big,
+              "Plans": [{"Node Type": "Bitmap Index Scan", "Index Name": "documents_content_trgm",
+                         "Total Cost": big - 1}]}
+    assert vsa._trigram_unindexed_scan(limit_over(seq)) is seq
+    assert vsa._trigram_unindexed_scan(limit_over(ctx_index)) is ctx_index
+    assert vsa._trigram_unindexed_scan(limit_over(bitmap)) is None
+    assert vsa._trigram_unindexed_scan(limit_over(dict(seq, **{"Total Cost": 10.0}))) is None
+
+
+def test_trigram_statement_is_index_driven(aurora_db, database_url, monkeypatch):
+    """On a context large enough for the choice to matter, `content %> :q`
+    is answered from documents_content_trgm — the guard passes even with
+    its cost bound at zero — and the candidates are re-scored exactly."""
+    from botnim.db.session import READ, get_session
+    from botnim.vector_store import vector_store_aurora as vsa
+
+    store = vsa.VectorStoreAurora(config={"slug": "unified", "name": "Unified"},
+                                  config_dir=".", environment="staging")
+    cid = store.get_or_create_vector_store({"slug": "x"}, "x", False)
+    _seed_documents(database_url, cid, [(f"medical complaints commissioner report {i}", [1.0] * 1536, {})
+                                        for i in range(5)])
+    with get_session() as sess:
+        sess.execute(text(
+            "INSERT INTO documents (context_id, content, content_hash, metadata) "
+            "SELECT :cid, repeat('budget ledger ', 40) || n, md5(n::text), '{}' "
+            "FROM generate_series(1, 5000) AS n"), {"cid": cid})
+    # The index predates the rows: flush GIN's pending list so the planner
+    # costs the index itself, as it would after autovacuum.
+    with get_session() as sess:
+        sess.execute(text("SELECT gin_clean_pending_list('documents_content_trgm')"))
+        sess.execute(text("ANALYZE documents"))
+
+    monkeypatch.setattr(vsa, "_TRIGRAM_GUARD_MAX_SCAN_COST", 0.0)
+    with get_session(READ) as sess:
+        vsa._set_trigram_locals(sess)
+        assert vsa._trigram_plan_guard(sess, cid, "medical complaints", "", {}, 10) is None
+        rows = sess.execute(text(vsa._trigram_lexical_sql(cid, "", 10)), {"q": "medical complaints"}).fetchall()
+    assert len(rows) == 5
+    assert all(r.score == 1.0 for r in rows)
+
+
+def test_trigram_search_falls_back_to_tsquery_when_the_plan_scans(aurora_db, database_url, monkeypatch, caplog):
+    from botnim.vector_store import vector_store_aurora as vsa
+    from botnim.vector_store.search_modes import DEFAULT_SEARCH_MODE
+
+    monkeypatch.setattr(vsa, "_get_embedding_client", lambda env: _FakeEmbeddingClient())
+    ctx = {"slug": "x", "use_lexical_search": True, "lexical_strategy": "trigram"}
+    store = vsa.VectorStoreAurora(config={"slug": "unified", "name": "Unified", "context": [ctx]},
+                                  config_dir=".", environment="staging")
+    cid = store.get_or_create_vector_store({"slug": "x"}, "x", False)
+    _seed_documents(database_url, cid, [
+        ("the medical complaints commissioner", [0.5] * 1536, {"title": "lexical"}),
+        ("unrelated content about budgets", [1.0] * 1536, {"title": "vector"}),
+    ])
+
+    def _search():
+        return store.search(context_name="x", query_text="medical complaints commissioner",
+                            search_mode=DEFAULT_SEARCH_MODE, embedding=[1.0] * 1536, num_results=2)
+
+    trigram = _search()
+    assert "using tsquery" not in caplog.text
+    monkeypatch.setattr(vsa, "_TRIGRAM_GUARD_MAX_SCAN_COST", -1.0)
+    fallback = _search()
+    assert "using tsquery" in caplog.text
+    ctx["lexical_strategy"] = "tsquery"
+    assert fallback == _search()
+    assert [h["_source"]["metadata"]["title"] for h in trigram["hits"]["hits"]] == ["lexical", "vector"]
+    # The single-statement fusion falls back the same way.
+    ctx["fusion_strategy"] = "sql"
+    sql_tsquery = _search()
+    ctx["lexical_strategy"] = "trigram"
+    assert _search() == sql_tsquery
+
+
+def test_trigram_plan_guard_runs_inside_the_lexical_branch(aurora_db, database_url, monkeypatch):
+    """The guard's EXPLAIN is part of the lexical branch, overlapping the
+    vector branch, not a round-trip ahead of both."""
+    from botnim.vector_store import vector_store_aurora as vsa
+    from botnim.vector_store.search_modes import DEFAULT_SEARCH_MODE
+
+    monkeypatch.setattr(vsa, "_get_embedding_client", lambda env: _FakeEmbeddingClient())
+    ctx = {"slug": "x", "use_lexical_search": True, "lexical_strategy": "trigram"}
+    store = vsa.VectorStoreAurora(config={"slug": "unified", "name": "Unified", "context": [ctx]},
+                                  config_dir=".", environment="staging")
+    cid = store.get_or_create_vector_store({"slug": "x"}, "x", False)
+    _seed_documents(database_url, cid, [("the medical complaints commissioner", [0.5] * 1536, {})])
+
+    in_branches = []
+    guard_calls = []
+    real_run_branches, real_guard = vsa._run_branches, vsa._trigram_plan_guard
+
+    def run_branches(vector_fn, lexical_fn):
+        in_branches.append(True)
+        try:
+            return real_run_branches(vector_fn, lexical_fn)
+        finally:
+            in_branches.pop()
+
+    def guard(*args):
+        guard_calls.append(bool(in_branches))
+        return real_guard(*args)
+
+    monkeypatch.setattr(vsa, "_run_branches", run_branches)
+    monkeypatch.setattr(vsa, "_trigram_plan_guard", guard)
+    result = store.search(context_name="x", query_text="medical complaints commissioner",
+                          search_mode=DEFAULT_SEARCH_MODE, embedding=[1.0] * 1536, num_results=2)
+    assert guard_calls == [True]
+    assert len(result["hits"]["hits"]) == 1
+
+
 def test_search_skips_vector_branch_when_use_vector_search_false(
     aurora_db, database_url, monkeypatch
 ):
@@ -638,6 +841,251 @@ def test_upload_files_skips_files_that_fail_to_embed(aurora_db, monkeypatch):
     assert callback_calls == [2]
 
 
+class _BatchEmbeddingClient(_FakeEmbeddingClient):
+    """Fake with the batch surface; records each embed_many batch."""
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def embed_many(self, texts):
+        self.batches.append(list(texts))
+        if any("BOOM" in t for t in texts):
+            raise RuntimeError("simulated embedding failure")
+        return [self.embed(t) for t in texts]
+
+
+def test_upload_files_embeds_missing_chunks_in_batches(aurora_db, monkeypatch):
+    from botnim.vector_store import vector_store_aurora as vsa
+    from botnim.db.session import get_engine
+
+    fake = _BatchEmbeddingClient()
+    monkeypatch.setattr(vsa, "_get_embedding_client", lambda env: fake)
+    monkeypatch.setattr(vsa, "_EMBED_BATCH_MAX_INPUTS", 2)
+
+    store = vsa.VectorStoreAurora(config={"slug": "unified", "name": "Unified"},
+                                  config_dir=".", environment="staging")
+    cid = store.get_or_create_vector_store({"slug": "x"}, "x", False)
+    store.upload_files({"slug": "x"}, "x", cid,
+                       _make_file_streams([("a.md", "alpha", {})]), lambda n: None)
+    fake.batches.clear()
+
+    streams = _make_file_streams([
+        ("a.md", "alpha", {}),            # already stored → not embedded again
+        ("b.md", "bravo", {}),
+        ("c.md", "charlie", {}),
+        ("d.md", "delta", {}),
+        ("e.md", "bravo", {}),            # same content as b.md → one embed
+    ])
+    callback_calls = []
+    store.upload_files({"slug": "x"}, "x", cid, streams, callback_calls.append)
+
+    assert sorted(t for b in fake.batches for t in b) == ["bravo", "charlie", "delta"]
+    assert [len(b) for b in fake.batches] == [2, 1]
+    assert callback_calls == [5]
+    with get_engine().connect() as conn:
+        n = conn.execute(text("SELECT count(*) FROM documents WHERE context_id=:cid"),
+                         {"cid": cid}).scalar()
+    assert n == 4
+
+
+def test_upload_files_warm_sync_loads_hashes_once(aurora_db, monkeypatch):
+    """An unchanged re-upload pages the context's hashes in, then issues no
+    per-chunk existence SELECTs and no embeds."""
+    from sqlalchemy import event
+    from botnim.vector_store import vector_store_aurora as vsa
+    from botnim.db.session import get_engine
+
+    fake = _FakeEmbeddingClient()
+    monkeypatch.setattr(vsa, "_get_embedding_client", lambda env: fake)
+    monkeypatch.setattr(vsa, "_CONTENT_HASH_PAGE_SIZE", 2)
+
+    store = vsa.VectorStoreAurora(config={"slug": "unified", "name": "Unified"},
+                                  config_dir=".", environment="staging")
+    cid = store.get_or_create_vector_store({"slug": "x"}, "x", False)
+    items = [(f"{i}.md", f"content {i}", {}) for i in range(5)]
+    store.upload_files({"slug": "x"}, "x", cid, _make_file_streams(items), lambda n: None)
+    assert fake.call_count == 5
+
+    statements = []
+    listener = lambda conn, cursor, stmt, *a: statements.append(stmt)
+    event.listen(get_engine(), "before_cursor_execute", listener)
+    try:
+        store.upload_files({"slug": "x"}, "x", cid, _make_file_streams(items), lambda n: None)
+    finally:
+        event.remove(get_engine(), "before_cursor_execute", listener)
+
+    assert fake.call_count == 5
+    probes = [s for s in statements if s.startswith("SELECT content_hash, metadata->>'filename' FROM documents")]
+    assert len(probes) == 3  # pages of 2, 2, 1
+    assert not any("INSERT INTO documents" in s for s in statements)
+
+
+def test_upload_files_holds_no_transaction_across_stream_pulls(aurora_db, monkeypatch):
+    """Streamed file_streams run extraction as they're pulled: no write
+    connection stays checked out meanwhile, and windows already flushed
+    are committed even if the stream fails later."""
+    from botnim.vector_store import vector_store_aurora as vsa
+    from botnim.db.session import get_engine
+
+    fake = _FakeEmbeddingClient()
+    monkeypatch.setattr(vsa, "_get_embedding_client", lambda env: fake)
+    monkeypatch.setattr(vsa, "_UPLOAD_WINDOW_CHUNKS", 2)
+    monkeypatch.setenv("SYNC_CHUNK_WORKERS", "0")  # no read-ahead: one pull per file
+
+    store = vsa.VectorStoreAurora(config={"slug": "unified", "name": "Unified"},
+                                  config_dir=".", environment="staging")
+    cid = store.get_or_create_vector_store({"slug": "x"}, "x", False)
+    checked_out = []
+
+    def streams():
+        for i in range(5):
+            checked_out.append(get_engine().pool.checkedout())
+            yield from _make_file_streams([(f"{i}.md", f"content {i}", {})])
+        raise RuntimeError("extraction failed")
+
+    with pytest.raises(RuntimeError):
+        store.upload_files({"slug": "x"}, "x", cid, streams(), lambda n: None)
+
+    assert checked_out == [0] * 5
+    with get_engine().connect() as conn:
+        n = conn.execute(text("SELECT count(*) FROM documents WHERE context_id=:cid"),
+                         {"cid": cid}).scalar()
+    assert n == 4  # two full windows; the fifth file was never flushed
+
+
+def test_upload_files_swaps_a_files_chunks_in_one_commit(aurora_db, monkeypatch):
+    """A modified file's new chunks and the delete of its old ones commit
+    together, per window: mid-run, readers never see both versions, and
+    files flushed before a failure stay updated."""
+    from botnim.vector_store import vector_store_aurora as vsa
+    from botnim.db.session import get_engine
+
+    monkeypatch.setattr(vsa, "_get_embedding_client", lambda env: _FakeEmbeddingClient())
+    monkeypatch.setattr(vsa, "_UPLOAD_WINDOW_CHUNKS", 1)
+    monkeypatch.setenv("SYNC_CHUNK_WORKERS", "0")
+    store = vsa.VectorStoreAurora(config={"slug": "unified", "name": "Unified"},
+                                  config_dir=".", environment="staging")
+    cid = store.get_or_create_vector_store({"slug": "x"}, "x", False)
+
+    def contents():
+        with get_engine().connect() as conn:
+            return {r[0] for r in conn.execute(text(
+                "SELECT content FROM documents WHERE context_id=:c"), {"c": cid}).fetchall()}
+
+    store.upload_files({"slug": "x"}, "x", cid, _make_file_streams(
+        [("a.md", "alpha", {}), ("b.md", "beta", {}), ("c.md", "gamma", {})]), lambda n: None)
+
+    seen_mid_run = []
+
+    def streams():
+        yield from _make_file_streams([("a.md", "alpha-v2", {})])
+        seen_mid_run.append(contents())
+        yield from _make_file_streams([("b.md", "beta-v2", {})])
+        raise RuntimeError("extraction failed")
+
+    with pytest.raises(RuntimeError):
+        store.upload_files({"slug": "x"}, "x", cid, streams(), lambda n: None)
+    assert seen_mid_run == [{"alpha-v2", "beta", "gamma"}]
+    assert contents() == {"alpha-v2", "beta-v2", "gamma"}
+
+
+def test_upload_files_keeps_a_chunk_that_moves_between_files(aurora_db, monkeypatch):
+    """A chunk dropped by one file and produced by a later one survives the
+    per-window reconcile (re-inserted under the later file)."""
+    from botnim.vector_store import vector_store_aurora as vsa
+    from botnim.db.session import get_engine
+
+    monkeypatch.setattr(vsa, "_get_embedding_client", lambda env: _FakeEmbeddingClient())
+    monkeypatch.setattr(vsa, "_UPLOAD_WINDOW_CHUNKS", 1)
+    store = vsa.VectorStoreAurora(config={"slug": "unified", "name": "Unified"},
+                                  config_dir=".", environment="staging")
+    cid = store.get_or_create_vector_store({"slug": "x"}, "x", False)
+    store.upload_files({"slug": "x"}, "x", cid, _make_file_streams(
+        [("a.md", "shared", {}), ("b.md", "beta", {})]), lambda n: None)
+    store.upload_files({"slug": "x"}, "x", cid, _make_file_streams(
+        [("a.md", "alpha", {}), ("b.md", "shared", {})]), lambda n: None)
+    with get_engine().connect() as conn:
+        rows = sorted(conn.execute(text(
+            "SELECT content, metadata->>'filename' FROM documents WHERE context_id=:c"), {"c": cid}).fetchall())
+    assert [tuple(r) for r in rows] == [("alpha", "a.md"), ("shared", "b.md")]
+
+
+def test_copy_documents_merges_and_skips_existing_rows(aurora_db):
+    from botnim.vector_store.vector_store_aurora import VectorStoreAurora, _copy_documents
+    from botnim.db.session import get_engine, get_session
+
+    store = VectorStoreAurora(config={"slug": "unified", "name": "Unified"},
+                              config_dir=".", environment="staging")
+    cid = store.get_or_create_vector_store({"slug": "x"}, "x", False)
+    vec = [0.5] * 1536
+
+    def row(h, sid=None):
+        return (cid, f"content {h}", h, {"filename": f"{h}.md", "title": "חוק"}, vec, sid)
+
+    with get_session() as sess:
+        assert _copy_documents(sess, [row("h1"), row("h2", "src")]) == 2
+        # Second call in the same transaction: h2 already exists, h2 twice is deduped.
+        assert _copy_documents(sess, iter([row("h2"), row("h3"), row("h3")])) == 1
+
+    with get_engine().connect() as conn:
+        rows = conn.execute(text(
+            "SELECT content_hash, metadata->>'title', source_id, embedding::text "
+            "FROM documents WHERE context_id=:cid ORDER BY content_hash"
+        ), {"cid": cid}).fetchall()
+    assert [r[0] for r in rows] == ["h1", "h2", "h3"]
+    assert rows[0][1] == "חוק"
+    assert rows[1][2] == "src"
+    assert rows[0][3] == "[" + ",".join(["0.5"] * 1536) + "]"
+
+
+def test_vector_param_is_binary_on_engine_connections(aurora_db, database_url):
+    from pgvector.psycopg import Vector
+    from sqlalchemy import create_engine
+    from botnim.vector_store.vector_store_aurora import _vector_param
+    from botnim.db.session import get_session
+
+    with get_session() as sess:
+        param = _vector_param(sess, [0.25] * 1536)
+        assert isinstance(param, Vector)
+        # Round-trips through the server without a text literal.
+        assert sess.execute(text("SELECT vector_dims(CAST(:e AS vector))"), {"e": param}).scalar() == 1536
+
+    # A bare engine without the adapters falls back to the text literal.
+    bare = create_engine(database_url)
+    with bare.connect() as conn:
+        assert _vector_param(conn, [0.25, 0.5]) == "[0.25, 0.5]"
+    bare.dispose()
+
+
+def test_upload_files_isolates_failing_chunk_in_batch(aurora_db, monkeypatch):
+    from botnim.vector_store import vector_store_aurora as vsa
+    from botnim.db.session import get_engine
+
+    fake = _BatchEmbeddingClient()
+    monkeypatch.setattr(vsa, "_get_embedding_client", lambda env: fake)
+
+    store = vsa.VectorStoreAurora(config={"slug": "unified", "name": "Unified"},
+                                  config_dir=".", environment="staging")
+    cid = store.get_or_create_vector_store({"slug": "x"}, "x", False)
+    streams = _make_file_streams([
+        ("good1.md", "fine content", {}),
+        ("bad.md", "BOOM content", {}),
+        ("good2.md", "also fine", {}),
+    ])
+    callback_calls = []
+    store.upload_files({"slug": "x"}, "x", cid, streams, callback_calls.append)
+
+    # The whole batch failed once, then each chunk was retried on its own.
+    assert len(fake.batches[0]) == 3
+    assert all(len(b) == 1 for b in fake.batches[1:])
+    with get_engine().connect() as conn:
+        names = sorted(r[0] for r in conn.execute(text(
+            "SELECT metadata->>'filename' FROM documents WHERE context_id=:cid"
+        ), {"cid": cid}))
+    assert names == ["good1.md", "good2.md"]
+    assert callback_calls == [2]
+
+
 # ---- chunking (oversize content handling) ----
 
 def test_chunk_for_embedding_short_content_returns_single():
@@ -909,3 +1357,421 @@ def test_recency_search_filters_invalid_dates(aurora_db, database_url, monkeypat
     assert returned_dates[0] == "2026-04-25", (
         f"results[0] must be the newest valid date; got {returned_dates[0]!r}"
     )
+
+
+
+def test_doc_date_takes_the_first_present_key_and_rejects_invalid_dates():
+    from datetime import date
+    from botnim.vector_store.vector_store_aurora import _doc_date
+
+    assert _doc_date({"תאריך": "2025-04-03T10:00:00", "PublicationDate": "2020-01-01"}) == date(2025, 4, 3)
+    assert _doc_date({"תאריך": "", "PublicationDate": "2020-01-01"}) == date(2020, 1, 1)
+    assert _doc_date({"extracted_data": {"תאריך_מכתב": "2019-12-31"}}) == date(2019, 12, 31)
+    # The first non-empty key decides, even when it's garbage.
+    assert _doc_date({"תאריך": "3390-06-91", "PublicationDate": "2020-01-01"}) is None
+    assert _doc_date({"תאריך": "2025-02-30"}) is None
+    assert _doc_date({"publish_date": "12.03.2025"}) == date(2025, 3, 12)
+    assert _doc_date({"publish_date": "30.02.2025"}) is None
+    assert _doc_date({"תאריך": "25-04-2025"}) is None
+    assert _doc_date({"extracted_data": "not a dict"}) is None
+    assert _doc_date(None) is None
+
+
+def test_recency_search_walks_the_doc_date_index(aurora_db, monkeypatch):
+    """upload_files fills doc_date, and the RECENCY_BROWSE statement is an
+    ordered walk of documents_context_doc_date — no sort over the context —
+    returning one row per document (its first chunk)."""
+    from sqlalchemy import event
+    from botnim.db.session import READ, get_engine, get_session
+    from botnim.vector_store.vector_store_aurora import VectorStoreAurora
+    from botnim.vector_store.search_modes import RECENCY_BROWSE_CONFIG
+
+    monkeypatch.setattr("botnim.vector_store.vector_store_aurora._get_embedding_client",
+                        lambda env: _FakeEmbeddingClient())
+    store = VectorStoreAurora(config={"slug": "unified", "name": "Unified"},
+                              config_dir=".", environment="staging")
+    ctx = {"slug": "x", "chunk_max_tokens": 64, "chunk_overlap_tokens": 0}
+    cid = store.get_or_create_vector_store(ctx, "x", False)
+    long_body = " ".join(f"word{i}" for i in range(400))
+    store.upload_files(ctx, "x", cid, _make_file_streams([
+        ("old.md", "old decision", {"תאריך": "2024-01-01"}),
+        ("new.md", long_body, {"PublicationDate": "2026-02-01"}),
+        ("undated.md", "no date", {}),
+    ]), lambda n: None)
+    with get_engine().connect() as conn:
+        dates = conn.execute(text(
+            "SELECT metadata->>'filename', count(*), min(doc_date)::text, max(doc_date)::text "
+            "FROM documents WHERE context_id=:cid GROUP BY 1 ORDER BY 1"), {"cid": cid}).fetchall()
+    assert [(r[0], r[2], r[3]) for r in dates] == [
+        ("new.md", "2026-02-01", "2026-02-01"), ("old.md", "2024-01-01", "2024-01-01"),
+        ("undated.md", None, None)]
+    assert dates[0][1] > 1  # chunked
+
+    statements = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if "doc_date" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(get_engine(READ), "before_cursor_execute", _capture)
+    try:
+        hits = store.search(context_name="x", query_text="x", search_mode=RECENCY_BROWSE_CONFIG,
+                            embedding=[0.0] * 1536, num_results=5)["hits"]["hits"]
+    finally:
+        event.remove(get_engine(READ), "before_cursor_execute", _capture)
+    assert [h["_source"]["metadata"]["filename"] for h in hits] == ["new.md", "old.md"]
+
+    statement, parameters = statements[0]
+    with get_session(READ) as sess:
+        sess.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = "\n".join(r[0] for r in sess.connection().exec_driver_sql("EXPLAIN " + statement, parameters))
+    assert "documents_context_doc_date" in plan
+    assert "Sort" not in plan
+
+
+
+def test_upload_files_fills_the_document_chunk_map(aurora_db, monkeypatch):
+    from botnim.db.session import get_engine
+    from botnim.vector_store.vector_store_aurora import VectorStoreAurora, _document_key
+
+    monkeypatch.setattr("botnim.vector_store.vector_store_aurora._get_embedding_client",
+                        lambda env: _FakeEmbeddingClient())
+    store = VectorStoreAurora(config={"slug": "unified", "name": "Unified"},
+                              config_dir=".", environment="staging")
+    ctx = {"slug": "x", "chunk_max_tokens": 64, "chunk_overlap_tokens": 0}
+    cid = store.get_or_create_vector_store(ctx, "x", False)
+    store.upload_files(ctx, "x", cid, _make_file_streams([
+        ("long.md", " ".join(f"word{i}" for i in range(400)), {"DocumentTitle": "החלטה 7"}),
+        ("short.md", "short", {}),
+    ]), lambda n: None)
+    with get_engine().connect() as conn:
+        rows = conn.execute(text(
+            "SELECT metadata->>'filename', document_key, array_agg(chunk_index ORDER BY chunk_index) "
+            "FROM documents WHERE context_id=:cid GROUP BY 1, 2 ORDER BY 1"), {"cid": cid}).fetchall()
+    (long_name, long_key, long_chunks), short = rows
+    assert (long_name, long_key) == ("long.md", _document_key({"DocumentTitle": "החלטה 7"}))
+    assert long_chunks == list(range(len(long_chunks))) and len(long_chunks) > 1
+    assert tuple(short) == ("short.md", None, [0])
+
+
+
+def test_iter_chunked_files_in_the_pool_matches_inline_chunking():
+    from botnim.vector_store.vector_store_aurora import (
+        _UploadStageStats, _chunk_and_hash, _iter_chunked_files,
+    )
+
+    def streams():
+        return _make_file_streams([
+            (f"doc{i}.md", "## a\n" + " ".join(f"w{i}x{j}" for j in range(40 * i)), {"i": i})
+            for i in range(12)
+        ] + [("skip.csv", "x", {})]) + [("bad.md", io.BytesIO(b"\xff\xfe"), "md", {})]
+
+    inline_stats, pool_stats = _UploadStageStats(), _UploadStageStats()
+    inline = list(_iter_chunked_files(streams(), 64, 8, 0, inline_stats))
+    pooled = list(_iter_chunked_files(streams(), 64, 8, 2, pool_stats))
+
+    assert [f for f, _, _ in pooled] == [f"doc{i}.md" for i in range(12)] + ["bad.md"]
+    assert isinstance(pooled[-1][2], UnicodeDecodeError)
+    assert pooled[:-1] == inline[:-1]
+    assert pooled[3][2] == _chunk_and_hash("## a\n" + " ".join(f"w3x{j}" for j in range(120)), 64, 8)[0]
+    assert len(pooled[11][2]) > 1
+    for stats in (inline_stats, pool_stats):
+        assert (stats.files_chunked, stats.chunks) == (12, sum(len(c) for _, _, c in inline[:-1]))
+
+
+
+def test_iter_chunked_files_falls_back_inline_when_the_pool_breaks(monkeypatch):
+    from concurrent.futures import Future
+    from concurrent.futures.process import BrokenProcessPool
+    from botnim.vector_store import vector_store_aurora as vsa
+
+    class _BrokenPool:
+        shut_down = False
+
+        def submit(self, *args):
+            future = Future()
+            future.set_exception(BrokenProcessPool("worker killed"))
+            return future
+
+        def shutdown(self, **kwargs):
+            self.shut_down = True
+
+    broken = _BrokenPool()
+    monkeypatch.setattr(vsa, "_chunk_pool", broken)
+    stats = vsa._UploadStageStats()
+    out = list(vsa._iter_chunked_files(
+        _make_file_streams([(f"f{i}.md", f"text {i}", {}) for i in range(3)]), 64, 8, 2, stats,
+    ))
+    assert [chunks for _, _, chunks in out] == [[(f"text {i}", hashlib.sha256(f"text {i}".encode()).hexdigest())] for i in range(3)]
+    assert broken.shut_down and vsa._chunk_pool is None
+
+
+def test_upload_files_logs_stage_throughput(aurora_db, monkeypatch, caplog):
+    from botnim.vector_store.vector_store_aurora import VectorStoreAurora
+
+    monkeypatch.setenv("SYNC_CHUNK_WORKERS", "2")
+    monkeypatch.setattr("botnim.vector_store.vector_store_aurora._get_embedding_client",
+                        lambda env: _FakeEmbeddingClient())
+    store = VectorStoreAurora(config={"slug": "unified", "name": "Unified"},
+                              config_dir=".", environment="staging")
+    cid = store.get_or_create_vector_store({"slug": "x"}, "x", False)
+    caplog.set_level("INFO", logger="botnim.vector_store.vector_store_aurora")
+    store.upload_files({"slug": "x"}, "x", cid, _make_file_streams([
+        (f"f{i}.md", f"content {i}", {}) for i in range(5)
+    ]), lambda n: None)
+    line = next(r.getMessage() for r in caplog.records if r.getMessage().startswith("SYNC_STAGES:"))
+    assert "chunk_workers=2 files_chunked=5 chunks=5 " in line
+    assert "embedded=5 " in line and "inserted=5 " in line
+
+
+def test_search_many_returns_one_block_per_context_in_order(aurora_db, database_url, monkeypatch):
+    from botnim.vector_store.vector_store_aurora import VectorStoreAurora
+    from botnim.vector_store.search_modes import DEFAULT_SEARCH_MODE
+
+    monkeypatch.setattr(
+        "botnim.vector_store.vector_store_aurora._get_embedding_client",
+        lambda env: _FakeEmbeddingClient(),
+    )
+    store = VectorStoreAurora(config={"slug": "unified", "name": "Unified"},
+                              config_dir=".", environment="staging")
+    cid_a = store.get_or_create_vector_store({"slug": "a"}, "a", False)
+    cid_b = store.get_or_create_vector_store({"slug": "b"}, "b", False)
+    emb = [1.0] * 1536
+    _seed_documents(database_url, cid_a, [("alpha doc", emb, {"title": "from-a"})])
+    _seed_documents(database_url, cid_b, [("beta doc", emb, {"title": "from-b"})])
+
+    blocks = store.search_many("anything", emb, [
+        {"context_name": "b", "search_mode": DEFAULT_SEARCH_MODE, "num_results": 3},
+        {"context_name": "a", "search_mode": DEFAULT_SEARCH_MODE, "num_results": 3},
+    ], timeout=10)
+
+    assert [b["context_name"] for b in blocks] == ["b", "a"]
+    assert all(b["status"] == "ok" for b in blocks)
+    titles = [[h["_source"]["metadata"]["title"] for h in b["result"]["hits"]["hits"]] for b in blocks]
+    assert titles == [["from-b"], ["from-a"]]
+    # Every search session handed its read-pool connection back.
+    from botnim.db.session import READ, get_engine
+    assert get_engine(READ).pool.checkedout() == 0
+
+
+def test_search_many_returns_partial_results_on_timeout(aurora_db, monkeypatch):
+    import time
+    from botnim.vector_store.vector_store_aurora import VectorStoreAurora
+    from botnim.vector_store.search_modes import DEFAULT_SEARCH_MODE
+
+    store = VectorStoreAurora(config={"slug": "unified", "name": "Unified"},
+                              config_dir=".", environment="staging")
+
+    def fake_search(context_name, query_text, search_mode, embedding, **kwargs):
+        if context_name == "slow":
+            time.sleep(1.0)
+        if context_name == "broken":
+            raise RuntimeError("boom")
+        return {"hits": {"hits": [{"_id": context_name}]}}
+
+    monkeypatch.setattr(store, "search", fake_search)
+    started = time.monotonic()
+    blocks = store.search_many("q", [0.0] * 1536, [
+        {"context_name": "fast", "search_mode": DEFAULT_SEARCH_MODE},
+        {"context_name": "slow", "search_mode": DEFAULT_SEARCH_MODE},
+        {"context_name": "broken", "search_mode": DEFAULT_SEARCH_MODE},
+    ], timeout=0.2)
+    assert time.monotonic() - started < 0.9
+    assert [b["status"] for b in blocks] == ["ok", "timeout", "error"]
+    assert blocks[0]["result"]["hits"]["hits"] == [{"_id": "fast"}]
+    assert "boom" in blocks[2]["detail"]
+
+
+def test_search_many_reports_queued_contexts_as_timeouts(aurora_db, monkeypatch):
+    import time
+    from botnim.vector_store import vector_store_aurora
+    from botnim.vector_store.vector_store_aurora import VectorStoreAurora
+    from botnim.vector_store.search_modes import DEFAULT_SEARCH_MODE
+
+    store = VectorStoreAurora(config={"slug": "unified", "name": "Unified"},
+                              config_dir=".", environment="staging")
+    seen = []
+
+    def fake_search(context_name, query_text, search_mode, embedding, **kwargs):
+        seen.append(kwargs["num_results"])
+        time.sleep(1.0)
+        return {"hits": {"hits": []}}
+
+    monkeypatch.setattr(store, "search", fake_search)
+    n = vector_store_aurora._SEARCH_MANY_MAX_WORKERS + 2
+    requests = [{"context_name": f"c{i}", "search_mode": DEFAULT_SEARCH_MODE} for i in range(n)]
+    requests[0]["num_results"] = 0
+    blocks = store.search_many("q", [0.0] * 1536, requests, timeout=0.2)
+
+    # The two contexts queued behind the worker cap were cancelled, not raised.
+    assert [b["status"] for b in blocks] == ["timeout"] * n
+    assert all(b["detail"] == "deadline exceeded after 0.2s" for b in blocks)
+    # An explicit 0 is passed through; omitted means the module default.
+    assert seen[0] == 0
+    assert set(seen[1:]) == {vector_store_aurora._DEFAULT_NUM_RESULTS}
+
+
+def test_search_many_timeout_cancels_the_slow_statement(aurora_db, monkeypatch):
+    import time
+    from sqlalchemy import text
+    from botnim.db.session import READ, get_engine, get_session
+    from botnim.vector_store.vector_store_aurora import VectorStoreAurora
+    from botnim.vector_store.search_modes import DEFAULT_SEARCH_MODE
+
+    store = VectorStoreAurora(config={"slug": "unified", "name": "Unified"},
+                              config_dir=".", environment="staging")
+    finished = []
+
+    def fake_search(context_name, query_text, search_mode, embedding, **kwargs):
+        try:
+            with get_session() as sess:
+                sess.execute(text("SELECT pg_sleep(10)"))
+        except TimeoutError as exc:
+            finished.append(exc)
+            raise
+        return {"hits": {"hits": []}}
+
+    monkeypatch.setattr(store, "search", fake_search)
+    blocks = store.search_many("q", [0.0] * 1536, [
+        {"context_name": "slow", "search_mode": DEFAULT_SEARCH_MODE},
+    ], timeout=0.3)
+    assert blocks[0]["status"] == "timeout"
+    # The abandoned worker's statement was cancelled, not left sleeping.
+    deadline = time.monotonic() + 5
+    while not finished and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert finished
+    assert get_engine(READ).pool.checkedout() == 0
+
+
+def test_run_branches_overlaps_vector_and_lexical():
+    import time
+    from botnim.vector_store.vector_store_aurora import _run_branches
+
+    def vector():
+        time.sleep(0.2)
+        return [("v",)]
+
+    def lexical():
+        time.sleep(0.2)
+        return [("l",)]
+
+    started = time.monotonic()
+    vector_rows, lexical_rows = _run_branches(vector, lexical)
+    assert time.monotonic() - started < 0.35
+    assert vector_rows == [("v",)]
+    assert lexical_rows == [("l",)]
+
+
+def test_run_branches_skips_disabled_branch_and_propagates_errors():
+    from botnim.vector_store.vector_store_aurora import _run_branches
+
+    assert _run_branches(None, lambda: [1]) == ([], [1])
+    assert _run_branches(lambda: [1], None) == ([1], [])
+
+    def broken():
+        raise RuntimeError("lexical down")
+
+    with pytest.raises(RuntimeError, match="lexical down"):
+        _run_branches(lambda: [], broken)
+
+
+def test_run_branches_records_per_branch_timings_on_span(monkeypatch):
+    import time
+    from opentelemetry import trace as otel_trace
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    from botnim.vector_store.vector_store_aurora import _run_branches
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(otel_trace, "get_tracer", lambda name, *a, **k: provider.get_tracer(name))
+
+    _run_branches(lambda: time.sleep(0.05) or [], lambda: [])
+
+    (span,) = [s for s in exporter.get_finished_spans() if s.name == "aurora.search.branches"]
+    attrs = dict(span.attributes)
+    assert attrs["search.parallel"] is True
+    assert attrs["search.vector_ms"] >= 40
+    assert "search.lexical_ms" in attrs
+    assert attrs["search.long_pole"] == "vector"
+
+
+class _CountingSession:
+    """Minimal stand-in for a Session: fixed bind, counts executes."""
+    def __init__(self, bind, row):
+        self.bind, self.row, self.executes = bind, row, 0
+
+    def get_bind(self):
+        return self.bind
+
+    def execute(self, *a, **kw):
+        self.executes += 1
+        row = self.row
+
+        class _R:
+            def fetchone(self):
+                return row
+        return _R()
+
+
+def test_context_id_cache_serves_repeat_lookups_without_a_query():
+    from botnim.vector_store.vector_store_aurora import _ContextIdCache
+
+    cache = _ContextIdCache()
+    sess = _CountingSession(bind=object(), row=("cid-1",))
+    assert cache.resolve(sess, "unified", "israeli_laws") == "cid-1"
+    assert cache.resolve(sess, "unified", "israeli_laws") == "cid-1"
+    assert sess.executes == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_context_id_cache_is_scoped_to_the_engine_and_skips_misses():
+    from botnim.vector_store.vector_store_aurora import _ContextIdCache
+
+    cache = _ContextIdCache()
+    cache.resolve(_CountingSession(bind=object(), row=("cid-old-db",)), "unified", "x")
+    other_db = _CountingSession(bind=object(), row=("cid-new-db",))
+    assert cache.resolve(other_db, "unified", "x") == "cid-new-db"
+    assert other_db.executes == 1
+
+    missing = _CountingSession(bind=object(), row=None)
+    assert cache.resolve(missing, "unified", "absent") is None
+    assert cache.resolve(missing, "unified", "absent") is None
+    assert missing.executes == 2
+
+
+def test_context_id_cache_invalidate_and_ttl(monkeypatch):
+    from botnim.vector_store import vector_store_aurora as vsa
+
+    cache = vsa._ContextIdCache(ttl_seconds=60)
+    sess = _CountingSession(bind=object(), row=("cid",))
+    cache.resolve(sess, "unified", "a")
+    cache.resolve(sess, "other", "a")
+    cache.invalidate("unified")
+    cache.resolve(sess, "unified", "a")
+    cache.resolve(sess, "other", "a")
+    assert sess.executes == 3
+
+    now = vsa.time.monotonic()
+    monkeypatch.setattr(vsa.time, "monotonic", lambda: now + 61)
+    cache.resolve(sess, "other", "a")
+    assert sess.executes == 4
+
+
+def test_get_or_create_vector_store_writes_context_id_through(aurora_db):
+    from botnim.db.session import READ, get_session
+    from botnim.vector_store import vector_store_aurora as vsa
+
+    store = vsa.VectorStoreAurora(config={"slug": "unified", "name": "Unified"},
+                                  config_dir=".", environment="staging")
+    cid = store.get_or_create_vector_store({"slug": "wt"}, "wt", False)
+    before = vsa._context_ids.stats()["hits"]
+    with get_session() as sess:
+        assert vsa._context_ids.resolve(sess, "unified", "wt") == cid
+    # The read-role lookups the search paths make hit as well.
+    with get_session(READ) as sess:
+        assert vsa._context_ids.resolve(sess, "unified", "wt") == cid
+    assert vsa._context_ids.stats()["hits"] == before + 2
@@ -330,6 +330,10 @@ def test_sync_delta_logs_new_content_with_zero_churn(aurora_db, monkeypatch, cap
         "1 insert + 0 deletes = 0% churn (the new content displaced nothing); "
         f"got {delta['churn_ratio']!r}"
     )
+    # Throughput fields: one embeddings batch for the single new chunk.
+    assert delta["embed_batches"] == "1"
+    assert float(delta["chunks_per_sec"]) > 0
+    assert float(delta["elapsed_s"]) >= 0
 
 
 def test_sync_delta_logs_pure_churn_at_100pct(aurora_db, monkeypatch, caplog):
@@ -0,0 +1,153 @@
+"""Tests for VectorStoreBase.vector_store_update's per-context scheduler.
+
+A minimal in-memory backend stands in for Aurora/ES so the tests pin the
+orchestration only: largest-first start order, bounded overlap, tools
+registered in config order, error propagation, and the timing summary.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+import pytest
+
+from botnim.vector_store import vector_store_base
+from botnim.vector_store.vector_store_base import VectorStoreBase
+
+
+class _RecordingStore(VectorStoreBase):
+    parallel_contexts = True
+
+    def __init__(self, sizes=None, delay=0.05, fail=None):
+        super().__init__({"slug": "bot"}, ".", production=True)
+        self.sizes = sizes or {}
+        self.delay = delay
+        self.fail = fail
+        self.started = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _context_size_hints(self):
+        return self.sizes
+
+    def get_or_create_vector_store(self, context, context_name, replace_context, force_rebuild=False):
+        return f"vs-{context_name}"
+
+    def upload_files(self, context, context_name, vector_store, file_streams, callback):
+        with self._lock:
+            self.started.append(context_name)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        if context_name == self.fail:
+            raise RuntimeError(f"{context_name} upload failed")
+        callback(len(file_streams))
+
+    def delete_existing_files(self, context_, vector_store, file_names):
+        return 0
+
+    def update_tools(self, context_, vector_store):
+        self.tools.append(vector_store)
+
+    def update_tool_resources(self, context_, vector_store):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def _no_sources(monkeypatch):
+    monkeypatch.setattr(vector_store_base, "collect_context_sources",
+                        lambda context_, config_dir, **kw: [])
+
+
+def _contexts(*slugs):
+    return [{"slug": s, "name": s} for s in slugs]
+
+
+def test_contexts_run_in_parallel_largest_first(monkeypatch):
+    monkeypatch.setenv("SYNC_CONTEXT_CONCURRENCY", "2")
+    store = _RecordingStore(sizes={"small": 1, "big": 100, "mid": 10})
+    tools, _ = store.vector_store_update(_contexts("small", "big", "mid"), replace_context="all")
+    assert store.started[:2] == ["big", "mid"]
+    assert store.peak == 2
+    # Tool registration stays in config order regardless of finish order.
+    assert tools == ["vs-small", "vs-big", "vs-mid"]
+
+
+def test_context_concurrency_one_is_sequential_in_config_order(monkeypatch):
+    monkeypatch.setenv("SYNC_CONTEXT_CONCURRENCY", "1")
+    store = _RecordingStore(sizes={"small": 1, "big": 100}, delay=0)
+    store.vector_store_update(_contexts("small", "big"), replace_context="all")
+    assert store.started == ["small", "big"]
+    assert store.peak == 1
+
+
+def test_backends_without_parallel_contexts_sync_sequentially(monkeypatch):
+    monkeypatch.setenv("SYNC_CONTEXT_CONCURRENCY", "3")
+
+    class _SerialStore(_RecordingStore):
+        parallel_contexts = False
+
+    store = _SerialStore(sizes={"small": 1, "big": 100}, delay=0.02)
+    store.vector_store_update(_contexts("small", "big", "mid"), replace_context="all")
+    assert store.started == ["small", "big", "mid"]
+    assert store.peak == 1
+
+
+def test_failed_context_raises_after_the_others_finish(monkeypatch):
+    monkeypatch.setenv("SYNC_CONTEXT_CONCURRENCY", "3")
+    store = _RecordingStore(fail="b")
+    with pytest.raises(RuntimeError, match="b upload failed"):
+        store.vector_store_update(_contexts("a", "b", "c"), replace_context="all")
+    assert sorted(store.started) == ["a", "b", "c"]
+
+
+def test_unselected_contexts_register_tools_without_syncing(monkeypatch, caplog):
+    monkeypatch.setenv("SYNC_CONTEXT_CONCURRENCY", "2")
+    store = _RecordingStore(delay=0)
+    with caplog.at_level(logging.INFO, logger="botnim.vector_store.vector_store_base"):
+        tools, _ = store.vector_store_update(_contexts("a", "b"), replace_context="b")
+    assert store.started == ["b"]
+    assert tools == ["vs-a", "vs-b"]
+    timing = [r.getMessage() for r in caplog.records if r.getMessage().startswith("SYNC_CONTEXT_TIMING")]
+    assert len(timing) == 1 and "context=b" in timing[0]
+    assert "peak_rss_mb=" in timing[0]
+    assert any(r.getMessage().startswith("SYNC_RUN_TIMING: bot=bot contexts=1 parallel=2")
+               for r in caplog.records)
+
+
+class _StreamingStore(_RecordingStore):
+    streaming_upload = True
+
+    def upload_files(self, context, context_name, vector_store, file_streams, callback):
+        self.received = file_streams
+        self.uploaded = [fname for fname, _, _, _ in file_streams]
+        callback(len(self.uploaded))
+
+    def delete_existing_files(self, context_, vector_store, file_names):
+        raise AssertionError("streaming backends don't pre-delete by name")
+
+
+def test_streaming_backend_uploads_from_the_source_iterator(monkeypatch, caplog):
+    closed = []
+
+    def _sources(context_, config_dir, **kw):
+        try:
+            for i in range(3):
+                yield (f"{context_['slug']}_{i}.md", None, "text/markdown", {})
+        finally:
+            closed.append(context_["slug"])
+
+    monkeypatch.setattr(vector_store_base, "iter_context_sources", _sources)
+    store = _StreamingStore(delay=0)
+    store.production = False
+    with caplog.at_level(logging.INFO, logger="botnim.vector_store.vector_store_base"):
+        store.vector_store_update(_contexts("a"), replace_context="all")
+    assert not isinstance(store.received, list)
+    assert store.uploaded == ["_a_0.md", "_a_1.md", "_a_2.md"]
+    assert closed == ["a"]
+    timing = [r.getMessage() for r in caplog.records if r.getMessage().startswith("SYNC_CONTEXT_TIMING")]
+    assert "files=3" in timing[0] and "peak_rss_mb=" in timing[0]